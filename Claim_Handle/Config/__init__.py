@@ -1,16 +1,28 @@
 from Claim_Handle.Config.nodes import (
     CONTEXT_WINDOWS,
     DISAMBIGUATION_CONFIG,
+    DOCUMENT_CONTEXT_CONFIG,
     DECOMPOSITION_CONFIG,
+    FUSED_EXTRACTION_CONFIG,
+    INCREMENTAL_CONFIG,
+    PIPELINE_CONFIG,
+    PREFILTER_CONFIG,
+    SEGMENTER_CONFIG,
     SELECTION_CONFIG,
     VALIDATION_CONFIG,
 )
 
 __all__ = [
     # Node configurations
+    "SEGMENTER_CONFIG",
+    "PREFILTER_CONFIG",
     "SELECTION_CONFIG",
     "DISAMBIGUATION_CONFIG",
     "DECOMPOSITION_CONFIG",
     "VALIDATION_CONFIG",
     "CONTEXT_WINDOWS",
+    "DOCUMENT_CONTEXT_CONFIG",
+    "FUSED_EXTRACTION_CONFIG",
+    "PIPELINE_CONFIG",
+    "INCREMENTAL_CONFIG",
 ]
\ No newline at end of file
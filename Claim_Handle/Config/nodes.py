@@ -1,3 +1,7 @@
+SEGMENTER_CONFIG = {
+    # "rules" for the fast regex segmenter, "nltk" for NLTK punkt
+    "engine": "rules",
+}
 CONTEXT_WINDOWS = {
     "selection": {
         "preceding_sentences": 5,
@@ -12,21 +16,90 @@ CONTEXT_WINDOWS = {
         "following_sentences": 0,  # No following sentences here
     },
 }
+DOCUMENT_CONTEXT_CONFIG = {
+    # Send numbered document chunks once instead of a window per sentence.
+    # Only selection uses it: disambiguation must not see what comes next,
+    # which a shared excerpt would show it
+    "enabled": False,
+    "chunk_size": 20,  # Sentences of interest per request
+}
+PREFILTER_CONFIG = {
+    # Drop obviously non-factual sentences (greetings, questions, calls to
+    # action) before selection spends LLM votes on them
+    "enabled": True,
+    "threshold": 0.8,  # Minimum non-factual score to drop; higher is more conservative
+}
+FUSED_EXTRACTION_CONFIG = {
+    # Replace selection, disambiguation and decomposition with one structured
+    # call per sentence that returns all of their results; the claims are
+    # still validated as in the staged graph
+    "enabled": False,
+    "temperature": 0.0,  # Zero temp for consistent results
+    "batch_size": 8,  # Sentences per request; 1 sends one request per sentence
+    "max_retries": 2,  # Retries for sentences whose results failed to parse
+}
+PIPELINE_CONFIG = {
+    # Move each sentence through selection, disambiguation, decomposition and
+    # validation on its own instead of finishing every stage for all sentences
+    # before the next one starts
+    "enabled": False,
+    "queue_size": 16,  # Items waiting between two stages before the earlier one blocks
+    # Kept small so selection doesn't take the whole LLM rate limit while
+    # later stages wait behind it
+    "max_batch": 4,  # Queued items a stage takes per call
+    "max_concurrency": 2,  # Calls in flight per stage
+}
+INCREMENTAL_CONFIG = {
+    # Remember each sentence's stage outputs keyed by a hash of its context
+    # windows, so a re-submitted text only re-runs the sentences that changed
+    "enabled": False,
+    "path": ".cache/claim_extraction.sqlite3",  # SQLite file shared across runs
+}
 SELECTION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 16,  # Sentences voted on at once
+    "single_request_voting": False,  # Get all completions as candidates of one request
+    # "sequential" starts with min_successes attempts and adds more only on
+    # disagreement or parse failures; "parallel" starts all completions at once
+    "voting_strategy": "sequential",
+    "require_agreement": False,  # Only identical answers count as the same vote
 }
 DISAMBIGUATION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 16,  # Sentences voted on at once
+    "single_request_voting": False,  # Get all completions as candidates of one request
+    # "sequential" starts with min_successes attempts and adds more only on
+    # disagreement or parse failures; "parallel" starts all completions at once
+    "voting_strategy": "sequential",
+    "require_agreement": False,  # Only identical answers count as the same vote
+    # Pass sentences with no pronouns, relative times or other context-dependent
+    # terms through unchanged instead of voting on them
+    "skip_unambiguous": True,
 }
 DECOMPOSITION_CONFIG = {
     "completions": 1,
     "min_successes": 1,
     "temperature": 0.0,  # Zero temp for consistent results
+    "batch_size": 8,  # Sentences per request; 1 sends one request per sentence
+    "max_retries": 2,  # Retries for sentences whose results failed to parse
 }
 VALIDATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    "batch_size": 20,  # Claims per request; 1 sends one request per claim
+    "max_retries": 2,  # Retries for claims whose results failed to parse
+    # Collapse reworded claims so each cluster is verified once, copying its
+    # verdict to the rest. Estimated Jaccard similarity of word unigrams and
+    # bigrams; claims must also share numbers, names, negation and main
+    # verb. None keeps every claim
+    "near_duplicate_threshold": 0.7,
+    # Accept or reject clear-cut claims with local rules, asking the LLM only
+    # about the rest. A sample of rule decisions, picked by hashing the claim
+    # text so runs stay reproducible, is also sent to the LLM and the
+    # agreement logged, to audit the rules
+    "rules_enabled": True,
+    "rules_audit_rate": 0.05,  # Fraction of rule decisions double-checked; 0 disables
 }
\ No newline at end of file
@@ -8,49 +8,106 @@ from dotenv import load_dotenv
 # sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from typing import Optional
 
+from Claim_Handle.Config.nodes import (
+    FUSED_EXTRACTION_CONFIG,
+    INCREMENTAL_CONFIG,
+    PIPELINE_CONFIG,
+)
 from Claim_Handle.nodes import (
     sentence_splitter_node,
+    prefilter_node,
     selection_node,
     disambiguation_node,
     decomposition_node,
     validation_node,
+    fused_extraction_node,
+    pipelined_extraction_node,
+    incremental_lookup_node,
+    incremental_store_node,
 )
 
 from Claim_Handle.schemas import State
 
 load_dotenv()
 
-def create_graph() -> CompiledStateGraph:
+def create_graph(
+    fused: Optional[bool] = None,
+    incremental: Optional[bool] = None,
+    pipelined: Optional[bool] = None,
+) -> CompiledStateGraph:
     """Set up the claim extraction workflow graph.
 
     The pipeline follows these steps:
     1. Split text into contextual sentences 
-    2. Filter for sentences with factual content
-    3. Resolve ambiguities like pronouns
-    4. Extract specific atomic claims
-    5. Validate claims are properly formed
+    2. Drop obviously non-factual sentences with local rules
+    3. Filter for sentences with factual content
+    4. Resolve ambiguities like pronouns
+    5. Extract specific atomic claims
+    6. Validate claims are properly formed
+
+    In fused mode, steps 3-5 are done by one structured call per sentence
+    (or batch of sentences) instead, followed by the usual validation. In
+    pipelined mode, steps 3-6 run in one node that moves each sentence to
+    the next step as soon as it is done.
+
+    In incremental mode, sentences whose text and context are unchanged since
+    an earlier run skip steps 3-6 and reuse the stored results.
+
+    Args:
+        fused: Build the fused graph; defaults to FUSED_EXTRACTION_CONFIG["enabled"]
+        incremental: Reuse stored results; defaults to INCREMENTAL_CONFIG["enabled"]
+        pipelined: Build the pipelined graph; defaults to PIPELINE_CONFIG["enabled"].
+            Ignored in fused mode
     """
+    if fused is None:
+        fused = FUSED_EXTRACTION_CONFIG["enabled"]
+    if incremental is None:
+        incremental = INCREMENTAL_CONFIG["enabled"]
+    if pipelined is None:
+        pipelined = PIPELINE_CONFIG["enabled"]
+
     workflow = StateGraph(State)
 
     # Add nodes
     workflow.add_node("sentence_splitter", sentence_splitter_node)
-    workflow.add_node("selection", selection_node)
-    workflow.add_node("disambiguation", disambiguation_node)
-    workflow.add_node("decomposition", decomposition_node)
-    workflow.add_node("validation", validation_node)
+    workflow.add_node("prefilter", prefilter_node)
+    workflow.add_edge("sentence_splitter", "prefilter")
 
-    # Add edges
-    workflow.add_edge("sentence_splitter", "selection")
-    workflow.add_edge("selection", "disambiguation")
-    workflow.add_edge("disambiguation", "decomposition")
-    workflow.add_edge("decomposition", "validation")
+    if fused:
+        workflow.add_node("fused_extraction", fused_extraction_node)
+        first_step, last_step = "fused_extraction", "fused_extraction"
+    elif pipelined:
+        workflow.add_node("pipelined_extraction", pipelined_extraction_node)
+        first_step, last_step = "pipelined_extraction", "pipelined_extraction"
+    else:
+        workflow.add_node("selection", selection_node)
+        workflow.add_node("disambiguation", disambiguation_node)
+        workflow.add_node("decomposition", decomposition_node)
+        workflow.add_node("validation", validation_node)
 
-    # Set entry point
-    workflow.set_entry_point("sentence_splitter")
+        # Add edges
+        workflow.add_edge("selection", "disambiguation")
+        workflow.add_edge("disambiguation", "decomposition")
+        workflow.add_edge("decomposition", "validation")
+        first_step, last_step = "selection", "validation"
+
+    if incremental:
+        workflow.add_node("incremental_lookup", incremental_lookup_node)
+        workflow.add_node("incremental_store", incremental_store_node)
+        workflow.add_edge("prefilter", "incremental_lookup")
+        workflow.add_edge("incremental_lookup", first_step)
+        workflow.add_edge(last_step, "incremental_store")
+        last_step = "incremental_store"
+    else:
+        workflow.add_edge("prefilter", first_step)
 
     # Set finish point
-    workflow.set_finish_point("validation")
+    workflow.set_finish_point(last_step)
+
+    # Set entry point
+    workflow.set_entry_point("sentence_splitter")
 
     return workflow.compile()
 
@@ -0,0 +1,326 @@
+"""Cheap lexical features for recognizing sentences that cannot hold claims.
+
+Used ahead of the LLM stages to skip greetings, questions, calls to action
+and similar filler without spending a model call on them, and to settle the
+clear cases of claim validation and disambiguation locally.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_NUMBER = re.compile(r"\d")
+_CURRENCY_OR_PERCENT = re.compile(r"[%₹$€£¥]|\b(?:rs|inr|usd|crore|lakh|million|billion|percent)\b", re.I)
+# Capitalized words after the first word, and acronyms anywhere
+_PROPER_NOUN = re.compile(r"(?<=\s)(?:[A-Z][a-z]+|[A-Z]{2,})\b")
+_ACRONYM = re.compile(r"\b[A-Z]{2,}\b")
+# Capitalized, but they name a date rather than the subject of a sentence
+_CALENDAR_NAME = re.compile(
+    r"\b(?:January|February|March|April|May|June|July|August|September|October|"
+    r"November|December|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b"
+)
+
+# The greeting has to be the whole sentence: up to three more words, with no
+# punctuation between them that could start another clause ("Hi all, ...")
+_GREETINGS = re.compile(
+    r"^(?:hi|hello|hey|dear|good (?:morning|afternoon|evening|night)|greetings|namaste|"
+    r"thanks|thank you|regards|cheers|happy|congratulations|welcome)\b[,!]?(?:\s+\w+){0,3}\W*$",
+    re.I,
+)
+_CALLS_TO_ACTION = re.compile(
+    r"\b(?:forward (?:this|it|to)|share (?:this|it|with)|pass (?:this|it) on|"
+    r"like and (?:share|subscribe)|subscribe|click (?:here|the link|on)|tag your|"
+    r"send (?:this|it) to|spread the word|must (?:watch|read|share)|don'?t ignore)\b"
+    # Hindi forwards: "share karein", "forward karein", "bhejein", "failayein"
+    r"|शेयर कर|फॉरवर्ड कर|भेजें|फैलाएं",
+    re.I,
+)
+_IMPERATIVE_OPENERS = {
+    "forward", "share", "send", "click", "subscribe", "follow", "watch", "read", "check",
+    "call", "visit", "join", "please", "kindly", "beware", "remember", "stay", "avoid",
+    "don't", "dont", "do", "let's", "lets", "imagine", "look", "see", "listen", "pray",
+}
+_OPINION_MARKERS = re.compile(
+    r"\b(?:i think|i feel|i believe|in my opinion|imo|i guess|i hope|i wish|"
+    r"we should|you should|hopefully|i love|i hate)\b",
+    re.I,
+)
+_FACTUAL_VERBS = re.compile(
+    r"\b(?:was|were|had|announced|reported|said|says|found|"
+    r"according to|confirmed|launched|banned|approved|died|killed|increased|decreased)\b",
+    re.I,
+)
+_FINITE_VERBS = re.compile(
+    # Auxiliaries and modals, unless part of an infinitive ("to have")
+    r"(?<!\bto )\b(?:is|are|was|were|am|has|have|had|will|would|shall|should|can|could|"
+    r"may|might|must|does|did|isn't|aren't|wasn't|weren't|hasn't|haven't|hadn't|won't|"
+    r"can't|doesn't|didn't)\b",
+    re.I,
+)
+_INTERROGATIVE_OPENERS = {
+    "who", "what", "when", "where", "why", "how", "which", "whose", "whom",
+    "is", "are", "was", "were", "do", "does", "did", "can", "could", "will", "would",
+    "should", "shall", "has", "have", "had", "may", "might",
+}
+_UNFINISHED_ENDINGS = (",", ";", ":", "-", "(")
+# A period or exclamation mark, possibly inside closing quotes or brackets,
+# but not an ellipsis
+_TERMINAL_PUNCTUATION = re.compile(r"(?<![.…])[.!][\"'”’)\]]*$")
+_TRAILING_CONNECTIVES = {
+    "and", "or", "but", "nor", "so", "yet", "because", "since", "although", "though",
+    "while", "whereas", "if", "unless", "that", "which", "who", "whom", "whose", "where",
+    "when", "as", "than", "of", "to", "the", "a", "an",
+}
+_RELATIVE_PRONOUN = re.compile(r"\b(?:who|whom|whose|which|that)\b", re.I)
+_PRONOUNS = re.compile(
+    r"\b(?:he|him|his|himself|she|her|hers|herself|it|its|itself|they|them|their|theirs|"
+    r"themselves|this|these|those|such|here|there|former|latter|aforementioned)\b",
+    re.I,
+)
+# First and second person leave the speaker or audience unnamed; "I" and
+# "us" are case-sensitive so "US" isn't read as one
+_PERSONAL_PRONOUNS = re.compile(
+    r"\b(?:I|[Uu]s|(?i:me|my|mine|myself|we|our|ours|ourselves|you|your|yours|"
+    r"yourself|yourselves))\b"
+)
+# "that" is a conjunction far more often than a reference, so only count it
+# where it can't be one
+_DEMONSTRATIVE_THAT = re.compile(r"^that\b|\bthat\s*[.!]?$", re.I)
+_RELATIVE_TIME = re.compile(
+    r"\b(?:today|tonight|yesterday|tomorrow|now|currently|recently|lately|soon|"
+    r"(?:next|last|this|coming|past|previous|following) (?:\w+ )?"
+    r"(?:day|week|weekend|month|quarter|year|decade|season|monday|tuesday|wednesday|"
+    r"thursday|friday|saturday|sunday|january|february|march|april|may|june|july|august|"
+    r"september|october|november|december|time)s?|ago|earlier|later|the same (?:day|time|year)|"
+    r"so far|to date|at present|these days|nowadays|"
+    # A weekday alone doesn't say which week
+    r"monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
+    re.I,
+)
+# Definite descriptions whose referent the surrounding text names
+_CONTEXT_DEPENDENT = re.compile(
+    r"\bthe (?:same|above|below|said|company|firm|government|minister|ministry|"
+    r"department|agency|court|city|state|country|town|village|district|party|group|"
+    r"organisation|organization|official|officials|report|study|decision|move|policy|"
+    r"scheme|plan|incident|event|statement|announcement|order|rule|law|bill|video|post|"
+    r"message|person|man|woman|victim|accused|team|leader|chief|president|governor)\b",
+    re.I,
+)
+# Openers that continue the previous sentence or drop its subject
+_CONTINUATION_OPENERS = {
+    "and", "but", "also", "then", "so", "or", "nor", "yet", "plus", "besides",
+    "however", "moreover", "furthermore", "meanwhile", "instead", "still", "thus",
+    "therefore", "hence", "additionally", "likewise", "similarly", "otherwise",
+}
+# Punctuation or conjunctions that can attach another clause to a call to action
+_CLAUSE_BREAK = re.compile(
+    r"\w\s*(?:[,;:]|\s[-–—])\s*\w|"
+    r"\b(?:because|since|as|that|which|who|so|but|if|when|while|otherwise|before)\b",
+    re.I,
+)
+_CALL_TO_ACTION_MAX_WORDS = 10
+_DECLARATIVE_MIN_WORDS = 5
+_CLAIM_MIN_WORDS = 3
+
+
+def _has_named_entity(sentence: str) -> bool:
+    if _ACRONYM.search(sentence):
+        return True
+    # Title Case Forwards capitalize every word, so capitals only count when rare
+    capitalized = _PROPER_NOUN.findall(sentence)
+    return bool(capitalized) and len(capitalized) * 2 <= len(_WORD.findall(sentence))
+
+
+def factual_signals(sentence: str) -> int:
+    """Count lexical signals that a sentence states something checkable.
+
+    Signals are digits, currency or percentages, named entities (capitalized
+    words past the first word, acronyms) and past-tense or reporting verbs.
+    """
+    signals = 0
+    if _NUMBER.search(sentence):
+        signals += 1
+    if _CURRENCY_OR_PERCENT.search(sentence):
+        signals += 1
+    if _has_named_entity(sentence):
+        signals += 1
+    if _FACTUAL_VERBS.search(sentence):
+        signals += 1
+    return signals
+
+
+def non_factual_score(sentence: str) -> Tuple[float, Optional[str]]:
+    """Estimate how surely a sentence contains no verifiable claim.
+
+    The strongest non-factual cue sets the score, and every factual signal
+    halves it, so a call to action that also names an entity and a number is
+    kept for the LLM to judge. Only cues that rule out a claim in the whole
+    sentence (a bare greeting, a call to action with nothing else in the
+    sentence, a question, fewer than three words) score above 0.8; an
+    imperative opener or a call to action next to another clause may still
+    precede a claim ("Forward this to everyone, garlic cures cancer").
+
+    Args:
+        sentence: Sentence to score
+
+    Returns:
+        (score between 0 and 1, name of the strongest cue or None)
+    """
+    text = sentence.strip()
+    words = _WORD.findall(text)
+
+    if not words:
+        return 1.0, "no words"
+
+    cues = []
+    if _GREETINGS.match(text):
+        cues.append((0.95, "greeting"))
+    if _CALLS_TO_ACTION.search(text):
+        whole = len(words) <= _CALL_TO_ACTION_MAX_WORDS and not _CLAUSE_BREAK.search(text)
+        cues.append((0.95 if whole else 0.6, "call to action"))
+    if text.endswith("?"):
+        cues.append((0.9, "question"))
+    if words[0].lower() in _IMPERATIVE_OPENERS or text.lower().startswith(("don't", "do not")):
+        cues.append((0.6, "imperative"))
+    if _OPINION_MARKERS.search(text):
+        cues.append((0.7, "opinion"))
+    if len(words) < _CLAIM_MIN_WORDS:
+        cues.append((0.85, "too short"))
+
+    if not cues:
+        return 0.0, None
+
+    score, reason = max(cues)
+    return score / (2 ** factual_signals(text)), reason
+
+
+def is_low_priority_claim(claim_text: str) -> bool:
+    """Claims with fewer than two factual signals are the first to drop under budget pressure."""
+    return factual_signals(claim_text) < 2
+
+
+def _verbs(text: str) -> List[re.Match]:
+    """Auxiliaries, modals and reporting verbs, in order of appearance."""
+    # "was" and "had" are in both patterns; count each word once
+    matches = {match.start(): match for match in _FACTUAL_VERBS.finditer(text)}
+    matches.update((match.start(), match) for match in _FINITE_VERBS.finditer(text))
+    return [matches[start] for start in sorted(matches)]
+
+
+def _opener_starts_name_or_clause(words: List[str], text: str) -> bool:
+    """Whether an imperative or interrogative opener may be part of a subject.
+
+    "Do Kwon was arrested", "Check Point Software reported" and "Call of
+    Duty sold" open with a verb-like word that belongs to a name; a verb
+    after the opener ("Watch sales increased") makes it a statement too.
+    """
+    if any(word[0].isupper() for word in words[1:3]):
+        return True
+    # Skip the whole first token, so the "'t" of "Don't" isn't read as a word
+    rest = text.split(None, 1)[1:]
+    return bool(rest and _verbs(rest[0]))
+
+
+def declarative_form(claim_text: str) -> Tuple[Optional[bool], str]:
+    """Decide the clear cases of whether a claim is a complete declarative sentence.
+
+    Questions, imperatives, unfinished fragments and claims under three words
+    are rejected, unless the opener may belong to a name or is followed by a
+    verb, in which case the LLM decides. Claims of five or more words are
+    accepted when they start like a sentence, end with a period or
+    exclamation mark, don't end on a conjunction or relative pronoun, and
+    have a verb outside any relative clause at their start. Everything else
+    is left to the LLM.
+
+    Args:
+        claim_text: Claim to check
+
+    Returns:
+        (True to accept, False to reject or None when unsure, name of the rule)
+    """
+    text = claim_text.strip()
+    words = _WORD.findall(text)
+
+    if not words:
+        return False, "no words"
+    if text.endswith("?"):
+        return False, "question"
+    if text.endswith(_UNFINISHED_ENDINGS) or words[-1].lower() in _TRAILING_CONNECTIVES:
+        return False, "unfinished"
+    if len(words) < _CLAIM_MIN_WORDS:
+        return False, "too short"
+
+    opener = words[0].lower()
+    imperative = opener in _IMPERATIVE_OPENERS or text.lower().startswith(
+        ("don't", "do not", "let's")
+    )
+    question = opener in _INTERROGATIVE_OPENERS and not text.endswith(".")
+    if imperative or question:
+        if _opener_starts_name_or_clause(words, text):
+            return None, "verb-like opener"
+        return False, "imperative" if imperative else "question"
+
+    verbs = _verbs(text)
+    if not verbs:
+        return None, "no finite verb found"
+    if len(words) < _DECLARATIVE_MIN_WORDS:
+        return None, "short"
+    if not (text[0].isupper() or text[0].isdigit() or _CURRENCY_OR_PERCENT.match(text)):
+        return None, "lowercase start"
+    if not _TERMINAL_PUNCTUATION.search(text):
+        return None, "no terminal punctuation"
+    # "The minister who was appointed in 2019." has a verb, but only inside
+    # the relative clause; ask the LLM unless there is another one after it
+    relative = _RELATIVE_PRONOUN.search(text)
+    if relative and relative.start() < verbs[0].start() and len(verbs) < 2:
+        return None, "relative clause only"
+
+    return True, "declarative"
+
+
+def unresolved_references(sentence: str) -> List[str]:
+    """Find words whose meaning depends on the surrounding text.
+
+    Looks for pronouns (first and second person included) and
+    demonstratives, relative time expressions ("next week", "yesterday"),
+    definite descriptions like "the company" or any opening "the <noun>" in
+    a sentence that names nothing, and openers that continue the previous sentence or start with a verb
+    because the subject was dropped. A sentence with none of them reads the
+    same out of context, so disambiguation would return it unchanged.
+
+    Args:
+        sentence: Sentence to check
+
+    Returns:
+        The matched cues, empty when there is nothing to resolve
+    """
+    text = sentence.strip()
+    words = _WORD.findall(text)
+    if not words:
+        return []
+
+    cues = [match.group(0) for match in _PRONOUNS.finditer(text)]
+    cues += [match.group(0) for match in _PERSONAL_PRONOUNS.finditer(text)]
+    cues += [match.group(0) for match in _DEMONSTRATIVE_THAT.finditer(text)]
+    cues += [match.group(0) for match in _RELATIVE_TIME.finditer(text)]
+    cues += [match.group(0) for match in _CONTEXT_DEPENDENT.finditer(text)]
+
+    opener = words[0]
+    if (
+        opener.lower() == "the"
+        and len(words) > 1
+        and not _has_named_entity(_CALENDAR_NAME.sub("", text))
+    ):
+        # "The bank cut rates": some particular bank, and nothing here names it
+        cues.append(f"{opener} {words[1]}")
+    elif opener.lower() in _CONTINUATION_OPENERS:
+        cues.append(opener)
+    elif opener.islower() or (
+        opener.lower().endswith(("ed", "ing"))
+        and len(words) > 1
+        and words[1].lower() in {"the", "a", "an", "to", "that", "in", "on", "by"}
+    ):
+        # "announced that ...", "Launched the scheme in 2019 ..."
+        cues.append(opener)
+
+    return cues
@@ -0,0 +1,143 @@
+"""Sentence-level store for incremental re-extraction.
+
+Each sentence is keyed by a hash of every stage's rendered context window
+(which contains the sentence itself) plus a fingerprint of the prompts and
+stage configs. A re-submitted document only re-runs sentences whose text or
+context changed; the rest are answered from the store.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from Claim_Handle import prompts
+from Claim_Handle.Config.nodes import (
+    CONTEXT_WINDOWS,
+    DECOMPOSITION_CONFIG,
+    DISAMBIGUATION_CONFIG,
+    FUSED_EXTRACTION_CONFIG,
+    INCREMENTAL_CONFIG,
+    SELECTION_CONFIG,
+    VALIDATION_CONFIG,
+)
+from Claim_Handle.schemas import ContextualSentence, SentenceExtraction
+
+logger = logging.getLogger(__name__)
+
+
+def pipeline_fingerprint() -> str:
+    """Hash of the prompts and configs that shape stage outputs.
+
+    Computed from their current values, so configs changed in-process give
+    new keys; callers keying many sentences compute it once and pass it on.
+    """
+    payload = {
+        "prompts": {
+            name: value
+            for name, value in vars(prompts).items()
+            if name.isupper() and isinstance(value, str)
+        },
+        "configs": [
+            CONTEXT_WINDOWS,
+            SELECTION_CONFIG,
+            DISAMBIGUATION_CONFIG,
+            DECOMPOSITION_CONFIG,
+            VALIDATION_CONFIG,
+            FUSED_EXTRACTION_CONFIG,
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def sentence_key(item: ContextualSentence, fingerprint: Optional[str] = None) -> str:
+    """Content hash of a sentence and every context window a stage sees.
+
+    Args:
+        item: Sentence to key
+        fingerprint: pipeline_fingerprint(), if already computed
+
+    Returns:
+        Hex digest identifying the sentence's extraction
+    """
+    payload = [
+        fingerprint or pipeline_fingerprint(),
+        item.metadata,
+        [item.render_context(**window) for _, window in sorted(CONTEXT_WINDOWS.items())],
+    ]
+    encoded = json.dumps(payload, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ExtractionStore:
+    """SQLite-backed map from sentence key to SentenceExtraction.
+
+    Args:
+        path: Database file; None keeps the store in memory
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS extractions "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, SentenceExtraction]:
+        """Look up stored extractions, returning only the keys found."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, SentenceExtraction] = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = self._db.execute(
+                    f"SELECT key, value FROM extractions WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = SentenceExtraction.model_validate_json(value)
+        return found
+
+    def put_many(self, extractions: Dict[str, SentenceExtraction]) -> None:
+        """Store extractions, replacing older ones with the same key."""
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO extractions (key, value, updated_at) VALUES (?, ?, ?)",
+                [(key, value.model_dump_json(), now) for key, value in extractions.items()],
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every stored extraction."""
+        with self._lock:
+            self._db.execute("DELETE FROM extractions")
+            self._db.commit()
+
+
+_store: Optional[ExtractionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_extraction_store() -> ExtractionStore:
+    """Get the shared store at INCREMENTAL_CONFIG["path"]."""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = ExtractionStore(INCREMENTAL_CONFIG["path"])
+            logger.info(f"Incremental extraction store at '{INCREMENTAL_CONFIG['path']}'")
+    return _store
@@ -0,0 +1,230 @@
+"""Local near-duplicate detection for extracted claims.
+
+Decomposition often returns the same claim worded slightly differently.
+Claims are compared by the MinHash estimate of the Jaccard similarity of
+their word unigrams and bigrams; LSH banding keeps this close to linear in
+the number of claims. Similar claims are only grouped when they also share
+their numbers, named entities, negation and main verb, so a reworded claim
+merges while "raised the repo rate" and "cut the repo rate" never do.
+"""
+
+import hashlib
+import random
+import re
+from typing import List, Optional, Sequence
+
+from Claim_Handle.schemas import PotentialClaim, ValidatedClaim
+
+_SEED = 0x5EED
+_PRIME = (1 << 61) - 1
+# ValidatedClaim fields a PotentialClaim doesn't have
+_VALIDATION_FIELDS = {"is_complete_declarative", "near_duplicates"}
+
+_NON_WORD = re.compile(r"[^\w₹$€£%]+", re.UNICODE)
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_NAME = re.compile(r"(?<=\s)[A-Z]\w*")
+_CONTRACTED_NOT = re.compile(r"n['’]t\b", re.I)
+_NEGATIONS = frozenset(
+    {"no", "not", "never", "none", "nobody", "nothing", "neither", "nor", "without", "cannot"}
+)
+# Words duplicates may differ in when their main verb can't be found
+_FUNCTION_WORDS = frozenset({"a", "an", "the", "that", "which", "who", "also", "just"})
+_AUXILIARIES = frozenset(
+    {
+        "is", "are", "was", "were", "am", "be", "been", "being", "has", "have", "had",
+        "will", "would", "shall", "should", "can", "could", "may", "might", "must",
+        "does", "do", "did",
+    }
+)
+# Words that can sit between an auxiliary and the verb it carries
+_VERB_MODIFIERS = frozenset({"not", "also", "just", "already", "still", "now", "never"})
+# Common irregular past forms, so "cut" and "rose" are found like "raised"
+_IRREGULAR_PAST = frozenset(
+    {
+        "beat", "became", "began", "bought", "brought", "built", "came", "caught", "chose",
+        "cost", "cut", "dealt", "drew", "drove", "fell", "felt", "fled", "found", "fought",
+        "gave", "got", "grew", "held", "hit", "hurt", "kept", "knew", "known", "laid",
+        "led", "left", "lent", "let", "lost", "made", "meant", "met", "paid", "put",
+        "quit", "ran", "rose", "said", "sank", "saw", "seen", "sent", "set", "shot",
+        "shut", "sold", "spent", "split", "spoke", "spread", "stood", "struck", "swore",
+        "taken", "taught", "thought", "threw", "told", "took", "understood",
+        "went", "withdrew", "withdrawn", "won", "wore", "wrote", "written",
+    }
+)
+
+
+def _normalize(text: str) -> str:
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _shingles(text: str, max_ngram: int) -> set:
+    words = _normalize(text).split()
+    return {
+        " ".join(words[i : i + n])
+        for n in range(1, max_ngram + 1)
+        for i in range(len(words) - n + 1)
+    } or {""}
+
+
+def _is_past_form(word: str) -> bool:
+    return word in _IRREGULAR_PAST or (len(word) > 3 and word.endswith("ed"))
+
+
+def _main_verb(words: List[str]) -> Optional[str]:
+    """The verb the claim asserts: the first past form, or what an auxiliary carries.
+
+    "are advised to exchange" gives "advised", "raised the rate" gives
+    "raised" and "is legal tender" falls back to "is". Present-tense verbs
+    without an auxiliary aren't recognised, and give None.
+    """
+    for position, word in enumerate(words):
+        if _is_past_form(word):
+            return word
+        if word in _AUXILIARIES:
+            for following in words[position + 1 :]:
+                if following in _VERB_MODIFIERS or following in ("be", "been", "being"):
+                    continue
+                if _is_past_form(following) or following.endswith("ing"):
+                    return following
+                break
+            return word
+    return None
+
+
+def _guard(text: str) -> tuple:
+    """Numbers, names, negation and main verb two duplicates must share."""
+    # Capitalized words past the first, so "Monday" and "Tuesday" differ
+    names = frozenset(name.lower() for name in _NAME.findall(text))
+    text = _normalize(_CONTRACTED_NOT.sub(" not", text))
+    words = text.split()
+    verb = _main_verb(words)
+    return (
+        tuple(sorted(_NUMBER.findall(text))),
+        names,
+        sum(word in _NEGATIONS for word in words) % 2,
+        # Without a recognised verb ("The RBI cuts rates"), any differing word
+        # could be it, so fall back to requiring the same words
+        verb or frozenset(words) - _FUNCTION_WORDS,
+    )
+
+
+class MinHasher:
+    """MinHash signatures over word n-grams.
+
+    Args:
+        num_perm: Number of hash functions in a signature
+        max_ngram: Longest word n-gram in the shingle set
+    """
+
+    def __init__(self, num_perm: int = 64, max_ngram: int = 2):
+        rng = random.Random(_SEED)
+        self.num_perm = num_perm
+        self.max_ngram = max_ngram
+        self._params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> List[int]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+            for s in _shingles(text, self.max_ngram)
+        ]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._params]
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+def cluster_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = 0.7,
+    num_perm: int = 64,
+    max_ngram: int = 2,
+    bands: int = 16,
+) -> List[List[int]]:
+    """Group texts whose estimated shingle similarity reaches the threshold.
+
+    Args:
+        texts: Texts to group
+        threshold: Minimum estimated Jaccard similarity to group two texts
+        num_perm: Number of MinHash functions
+        max_ngram: Longest word n-gram compared
+        bands: LSH bands; num_perm must be divisible by it
+
+    Returns:
+        Clusters of indices into texts, each in ascending order and ordered
+        by their first index; singletons included
+    """
+    hasher = MinHasher(num_perm, max_ngram)
+    signatures = [hasher.signature(text) for text in texts]
+    guards = [_guard(text) for text in texts]
+
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Only texts sharing a whole band of their signature are compared
+    rows = num_perm // bands
+    compared = set()
+    for band in range(bands):
+        buckets = {}
+        for i, signature in enumerate(signatures):
+            key = tuple(signature[band * rows : (band + 1) * rows])
+            buckets.setdefault(key, []).append(i)
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                for j in members[position + 1 :]:
+                    if (i, j) in compared:
+                        continue
+                    compared.add((i, j))
+                    if (
+                        guards[i] == guards[j]
+                        and hasher.similarity(signatures[i], signatures[j]) >= threshold
+                    ):
+                        root_i, root_j = find(i), find(j)
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = {}
+    for i in range(len(texts)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def collapse_near_duplicates(
+    claims: List[ValidatedClaim], threshold: Optional[float]
+) -> List[ValidatedClaim]:
+    """Keep one claim per near-duplicate cluster.
+
+    The first claim of each cluster is kept, with the others recorded in its
+    near_duplicates so their verdict can be filled in from it.
+
+    Args:
+        claims: Validated claims, already free of exact duplicates
+        threshold: Minimum similarity to collapse; None returns claims unchanged
+
+    Returns:
+        Cluster representatives in their original order
+    """
+    if threshold is None or len(claims) < 2:
+        return claims
+
+    collapsed = []
+    for cluster in cluster_near_duplicates([c.claim_text for c in claims], threshold):
+        representative, *members = [claims[i] for i in cluster]
+        if members:
+            duplicates = list(representative.near_duplicates)
+            for member in members:
+                duplicates.append(PotentialClaim(**member.model_dump(exclude=_VALIDATION_FIELDS)))
+                duplicates.extend(member.near_duplicates)
+            representative = representative.model_copy(
+                update={"near_duplicates": duplicates}
+            )
+        collapsed.append(representative)
+
+    return collapsed
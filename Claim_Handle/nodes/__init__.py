@@ -1,13 +1,22 @@
 from Claim_Handle.nodes.splitting_sentences import sentence_splitter_node
+from Claim_Handle.nodes.prefilter import prefilter_node
 from Claim_Handle.nodes.selection import selection_node
 from Claim_Handle.nodes.disambiguation import disambiguation_node
 from Claim_Handle.nodes.decomposition import decomposition_node
 from Claim_Handle.nodes.validation import validation_node
+from Claim_Handle.nodes.fused_extraction import fused_extraction_node
+from Claim_Handle.nodes.pipelined_extraction import pipelined_extraction_node
+from Claim_Handle.nodes.incremental import incremental_lookup_node, incremental_store_node
 
 __all__ = [
     "sentence_splitter_node",
+    "prefilter_node",
     "selection_node",
     "disambiguation_node",
     "decomposition_node",
     "validation_node",
+    "fused_extraction_node",
+    "pipelined_extraction_node",
+    "incremental_lookup_node",
+    "incremental_store_node",
 ]
\ No newline at end of file
@@ -6,20 +6,33 @@ Breaks complex sentences into simple, standalone factual claims.
 import asyncio
 import itertools
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from Claim_Handle.Config.nodes import DECOMPOSITION_CONFIG
-from Claim_Handle.prompts import DECOMPOSITION_SYSTEM_PROMPT, HUMAN_PROMPT
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS, DECOMPOSITION_CONFIG
+from Claim_Handle.prompts import (
+    BATCH_HUMAN_PROMPT,
+    BATCH_ITEM_PROMPT,
+    DECOMPOSITION_BATCH_SYSTEM_PROMPT,
+    DECOMPOSITION_SYSTEM_PROMPT,
+    HUMAN_PROMPT,
+)
 from Claim_Handle.schemas import DisambiguatedContent, PotentialClaim, State
-from utils import call_llm_with_structured_output, get_llm, remove_following_sentences
+from utils import (
+    instrument_node,
+    call_llm_batched,
+    call_llm_with_structured_output,
+    get_llm,
+)
 
 logger = logging.getLogger(__name__)
 
 # Use only one completion here - we've already filtered and disambiguated
 COMPLETIONS = DECOMPOSITION_CONFIG["completions"]
 MIN_SUCCESSES = DECOMPOSITION_CONFIG["min_successes"]
+BATCH_SIZE = DECOMPOSITION_CONFIG["batch_size"]
+MAX_RETRIES = DECOMPOSITION_CONFIG["max_retries"]
 
 
 class DecompositionOutput(BaseModel):
@@ -33,16 +46,68 @@ class DecompositionOutput(BaseModel):
     )
 
 
+def _decomposition_human_prompt(disambiguated_item: DisambiguatedContent) -> str:
+    """Build the excerpt + sentence prompt for a disambiguated sentence."""
+    # The decomposition window has no following sentences
+    contextual_item = disambiguated_item.original_selected_item.original_context_item
+    modified_context = contextual_item.render_context(**CONTEXT_WINDOWS["decomposition"])
+
+    return HUMAN_PROMPT.format(
+        excerpt=modified_context,
+        sentence=disambiguated_item.disambiguated_sentence,
+    )
+
+
+def _to_potential_claims(
+    disambiguated_item: DisambiguatedContent, response: Optional[DecompositionOutput]
+) -> Optional[List[PotentialClaim]]:
+    """Turn a decomposition response into potential claims; None if the call failed."""
+    sentence = disambiguated_item.disambiguated_sentence
+
+    if response is None:
+        logger.warning(f"Decomposition failed for: '{sentence}'")
+        return None
+
+    # If no claims were found
+    if response.no_claims or not response.claims:
+        logger.info(f"No claims found in: '{sentence}'")
+        return []
+
+    logger.debug(f"Decomposition response: {response}")
+
+    # Clean up claims and convert to objects
+    claims_texts = [claim.strip() for claim in response.claims if claim.strip()]
+
+    # Get original sentence and index
+    original_sentence = disambiguated_item.original_selected_item.original_context_item.original_sentence
+    original_index = disambiguated_item.original_selected_item.original_context_item.original_index
+
+    potential_claims = [
+        PotentialClaim(
+            claim_text=claim_text, 
+            disambiguated_sentence=sentence,
+            original_sentence=original_sentence,
+            original_index=original_index
+        )
+        for claim_text in claims_texts
+    ]
+
+    logger.info(
+        f"Extracted {len(potential_claims)} potential claims from: '{sentence}'"
+    )
+    return potential_claims
+
+
 async def _decomposition_stage(
     disambiguated_item: DisambiguatedContent,
-) -> List[PotentialClaim]:
+) -> Optional[List[PotentialClaim]]:
     """Extract atomic claims from a disambiguated sentence.
 
     Args:
         disambiguated_item: Disambiguated content to process
 
     Returns:
-        List of potential claims
+        List of potential claims, or None if the LLM call failed
     """
     sentence = disambiguated_item.disambiguated_sentence
     logger.debug(f"Processing decomposition for: '{sentence}'")
@@ -50,22 +115,10 @@ async def _decomposition_stage(
     # Get zero-temp LLM for consistent results
     llm = get_llm(completions=COMPLETIONS)
 
-    # Get context without following sentences
-    original_context = (
-        disambiguated_item.original_selected_item.original_context_item.context_for_llm
-    )
-    modified_context = remove_following_sentences(original_context)
-
     # Prep the prompt
     messages = [
         ("system", DECOMPOSITION_SYSTEM_PROMPT),
-        (
-            "human",
-            HUMAN_PROMPT.format(
-                excerpt=modified_context,
-                sentence=sentence,
-            ),
-        ),
+        ("human", _decomposition_human_prompt(disambiguated_item)),
     ]
 
     # Call the LLM to extract claims
@@ -76,44 +129,62 @@ async def _decomposition_stage(
         context_desc=f"decomposition stage for sentence '{sentence}'",
     )
 
-    # If no claims were found
-    if not response or response.no_claims or not response.claims:
-        logger.info(f"No claims found in: '{sentence}'")
-        return []
+    return _to_potential_claims(disambiguated_item, response)
 
-    logger.debug(f"Decomposition response: {response}")
 
-    # Clean up claims and convert to objects
-    claims_texts = [claim.strip() for claim in response.claims if claim.strip()]
+def _decomposition_batch_messages(
+    batch: List[Tuple[int, DisambiguatedContent]],
+) -> List[Tuple[str, str]]:
+    """Build the prompt decomposing several numbered sentences at once."""
+    items = "".join(
+        BATCH_ITEM_PROMPT.format(index=index, item=_decomposition_human_prompt(item))
+        for index, item in batch
+    )
+    return [
+        ("system", DECOMPOSITION_BATCH_SYSTEM_PROMPT),
+        ("human", BATCH_HUMAN_PROMPT.format(items=items)),
+    ]
 
-    # Get original sentence and index
-    original_sentence = disambiguated_item.original_selected_item.original_context_item.original_sentence
-    original_index = disambiguated_item.original_selected_item.original_context_item.original_index
 
-    potential_claims = [
-        PotentialClaim(
-            claim_text=claim_text, 
-            disambiguated_sentence=sentence,
-            original_sentence=original_sentence,
-            original_index=original_index
-        )
-        for claim_text in claims_texts
-    ]
+async def _decompose_batched(
+    disambiguated_contents: List[DisambiguatedContent],
+) -> List[Optional[List[PotentialClaim]]]:
+    """Extract claims for many sentences with a few batched requests.
 
-    logger.info(
-        f"Extracted {len(potential_claims)} potential claims from: '{sentence}'"
+    Args:
+        disambiguated_contents: Disambiguated contents to process
+
+    Returns:
+        Potential claims per sentence, in the same order; None where the
+        sentence's result couldn't be parsed
+    """
+    llm = get_llm(completions=COMPLETIONS)
+
+    responses = await call_llm_batched(
+        llm=llm,
+        output_class=DecompositionOutput,
+        items=disambiguated_contents,
+        build_messages=_decomposition_batch_messages,
+        batch_size=BATCH_SIZE,
+        max_retries=MAX_RETRIES,
+        context_desc="decomposition",
     )
-    return potential_claims
+
+    return [
+        _to_potential_claims(item, response)
+        for item, response in zip(disambiguated_contents, responses)
+    ]
 
 
-async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
+@instrument_node("Claim_Handle.decomposition")
+async def decomposition_node(state: State) -> Dict[str, List[Any]]:
     """Break sentences into self-contained factual claims.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with potential_claims key
+        Dictionary with potential_claims and failed_sentences keys
     """
     disambiguated_contents = state.disambiguated_contents or []
 
@@ -121,20 +192,30 @@ async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
         logger.warning("Nothing to decompose")
         return {"potential_claims": []}
 
-    # Process all contents in parallel for speed
-    potential_claims = await asyncio.gather(
-        *(
-            _decomposition_stage(disambiguated_content)
-            for disambiguated_content in disambiguated_contents
+    if BATCH_SIZE > 1:
+        claims_per_sentence = await _decompose_batched(disambiguated_contents)
+    else:
+        # Process all contents in parallel for speed
+        claims_per_sentence = await asyncio.gather(
+            *(
+                _decomposition_stage(disambiguated_content)
+                for disambiguated_content in disambiguated_contents
+            )
         )
-    )
 
-    potential_claims = list(itertools.chain.from_iterable(potential_claims))
+    failed = [
+        item.original_selected_item.original_context_item.original_index
+        for item, claims in zip(disambiguated_contents, claims_per_sentence)
+        if claims is None
+    ]
+    potential_claims = list(
+        itertools.chain.from_iterable(claims or [] for claims in claims_per_sentence)
+    )
 
     # Check if any claims were found
     if not potential_claims:
         logger.info("No potential claims found after processing")
-        return {"potential_claims": []}
+        return {"potential_claims": [], "failed_sentences": failed}
 
     logger.info(f"Extracted a total of {len(potential_claims)} potential claims")
-    return {"potential_claims": potential_claims}
+    return {"potential_claims": potential_claims, "failed_sentences": failed}
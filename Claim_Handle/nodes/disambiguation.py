@@ -4,19 +4,22 @@ Clarifies pronouns and other references so claims make sense on their own.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from pydantic import BaseModel, Field
 
-from Claim_Handle.Config.nodes import DISAMBIGUATION_CONFIG
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS, DISAMBIGUATION_CONFIG
+from Claim_Handle.heuristics import unresolved_references
 from Claim_Handle.prompts import DISAMBIGUATION_SYSTEM_PROMPT, HUMAN_PROMPT
 from Claim_Handle.schemas import DisambiguatedContent, SelectedContent, State
 from utils import (
+    instrument_node,
+    call_llm_with_candidates,
     call_llm_with_structured_output,
     get_llm,
     process_with_voting,
-    remove_following_sentences,
+    record_skips,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,11 @@ logger = logging.getLogger(__name__)
 # to ensure consistency in how references are resolved
 COMPLETIONS = DISAMBIGUATION_CONFIG["completions"]
 MIN_SUCCESSES = DISAMBIGUATION_CONFIG["min_successes"]
+MAX_CONCURRENCY = DISAMBIGUATION_CONFIG["max_concurrency"]
+SINGLE_REQUEST_VOTING = DISAMBIGUATION_CONFIG["single_request_voting"]
+VOTING_STRATEGY = DISAMBIGUATION_CONFIG["voting_strategy"]
+REQUIRE_AGREEMENT = DISAMBIGUATION_CONFIG["require_agreement"]
+SKIP_UNAMBIGUOUS = DISAMBIGUATION_CONFIG["skip_unambiguous"]
 
 
 class DisambiguationOutput(BaseModel):
@@ -38,46 +46,30 @@ class DisambiguationOutput(BaseModel):
     )
 
 
-async def _single_disambiguation_attempt(
-    selected_item: SelectedContent, llm: BaseChatModel
-) -> Tuple[bool, Optional[str]]:
-    """Try to disambiguate a single sentence.
-
-    Args:
-        selected_item: Selected content to disambiguate
-        llm: LLM instance
-
-    Returns:
-        (success, disambiguated_sentence)
-    """
-    sentence = selected_item.processed_sentence
-
-    # Get context but remove following sentences
+def _disambiguation_messages(selected_item: SelectedContent) -> List[Tuple[str, str]]:
+    """Build the disambiguation prompt for a selected sentence."""
+    # The disambiguation window has no following sentences
     # We don't want to rely on future info that might not be available
-    modified_context = remove_following_sentences(
-        selected_item.original_context_item.context_for_llm
+    modified_context = selected_item.original_context_item.render_context(
+        **CONTEXT_WINDOWS["disambiguation"]
     )
 
-    # Prep the prompt
-    messages = [
+    return [
         ("system", DISAMBIGUATION_SYSTEM_PROMPT),
         (
             "human",
             HUMAN_PROMPT.format(
                 excerpt=modified_context,
-                sentence=sentence,
+                sentence=selected_item.processed_sentence,
             ),
         ),
     ]
 
-    # Call the LLM
-    response = await call_llm_with_structured_output(
-        llm=llm,
-        output_class=DisambiguationOutput,
-        messages=messages,
-        context_desc=f"disambiguation attempt for '{sentence}'",
-    )
 
+def _interpret_disambiguation(
+    response: Optional[DisambiguationOutput],
+) -> Tuple[bool, Optional[str]]:
+    """Turn a disambiguation response into (success, disambiguated_sentence)."""
     # Skip sentences we can't disambiguate - better to drop them
     # than have unclear claims
     if (
@@ -90,6 +82,57 @@ async def _single_disambiguation_attempt(
     return True, response.disambiguated_sentence.strip()
 
 
+async def _single_disambiguation_attempt(
+    selected_item: SelectedContent, llm: BaseChatModel
+) -> Tuple[bool, Optional[str]]:
+    """Try to disambiguate a single sentence.
+
+    Args:
+        selected_item: Selected content to disambiguate
+        llm: LLM instance
+
+    Returns:
+        (success, disambiguated_sentence)
+    """
+    sentence = selected_item.processed_sentence
+
+    # Call the LLM
+    response = await call_llm_with_structured_output(
+        llm=llm,
+        output_class=DisambiguationOutput,
+        messages=_disambiguation_messages(selected_item),
+        context_desc=f"disambiguation attempt for '{sentence}'",
+    )
+
+    return _interpret_disambiguation(response)
+
+
+async def _disambiguation_candidates(
+    selected_item: SelectedContent, llm: BaseChatModel, n: int
+) -> List[Tuple[bool, Optional[str]]]:
+    """Get n disambiguation votes from a single multi-candidate request.
+
+    Args:
+        selected_item: Selected content to disambiguate
+        llm: LLM instance
+        n: Number of candidates
+
+    Returns:
+        (success, disambiguated_sentence) per candidate
+    """
+    sentence = selected_item.processed_sentence
+
+    candidates = await call_llm_with_candidates(
+        llm=llm,
+        output_class=DisambiguationOutput,
+        messages=_disambiguation_messages(selected_item),
+        n=n,
+        context_desc=f"disambiguation candidates for '{sentence}'",
+    )
+
+    return [_interpret_disambiguation(candidate) for candidate in candidates]
+
+
 def _create_disambiguated_content(
     disambiguated_sentence: str, selected_item: SelectedContent
 ) -> DisambiguatedContent:
@@ -110,14 +153,44 @@ def _create_disambiguated_content(
     )
 
 
-async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedContent]]:
+def _split_unambiguous(
+    selected_contents: List[SelectedContent],
+) -> Tuple[List[DisambiguatedContent], List[SelectedContent]]:
+    """Separate sentences with nothing to resolve from those the LLM must see.
+
+    Args:
+        selected_contents: Selected sentences
+
+    Returns:
+        (unchanged sentences as DisambiguatedContent, sentences still to disambiguate)
+    """
+    unchanged = []
+    remaining = []
+    for selected in selected_contents:
+        cues = unresolved_references(selected.processed_sentence)
+        if cues:
+            logger.debug(f"Needs disambiguation ({', '.join(cues)}): '{selected.processed_sentence}'")
+            remaining.append(selected)
+        else:
+            logger.info(f"Nothing to disambiguate in: '{selected.processed_sentence}'")
+            unchanged.append(
+                DisambiguatedContent(
+                    disambiguated_sentence=selected.processed_sentence,
+                    original_selected_item=selected,
+                )
+            )
+    return unchanged, remaining
+
+
+@instrument_node("Claim_Handle.disambiguation")
+async def disambiguation_node(state: State) -> Dict[str, List[Any]]:
     """Resolve ambiguous references in sentences.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with disambiguated_contents key
+        Dictionary with disambiguated_contents and failed_sentences keys
     """
     selected_contents = state.selected_contents or []
 
@@ -125,10 +198,29 @@ async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedConte
         logger.warning("Nothing to disambiguate")
         return {}
 
+    # Sentences that read the same out of context pass through unchanged
+    unchanged: List[DisambiguatedContent] = []
+    if SKIP_UNAMBIGUOUS:
+        unchanged, selected_contents = _split_unambiguous(selected_contents)
+        record_skips(len(unchanged), len(unchanged) + len(selected_contents))
+        logger.info(
+            f"Skipped disambiguation for {len(unchanged)} of "
+            f"{len(unchanged) + len(selected_contents)} sentences with nothing to resolve"
+        )
+        if not selected_contents:
+            return {"disambiguated_contents": unchanged}
+
     # Get LLM with temperature 0.2 for multiple completions
     llm = get_llm(completions=COMPLETIONS)
 
-    # Process all selected contents with voting
+    # Sentences dropped because a call failed rather than by vote
+    failed: List[int] = []
+
+    def _on_error(item: SelectedContent) -> None:
+        failed.append(item.original_context_item.original_index)
+
+    # Always one sentence per prompt: a shared document excerpt would show
+    # every sentence the ones after it
     disambiguated_contents = await process_with_voting(
         items=selected_contents,
         processor=_single_disambiguation_attempt,
@@ -137,13 +229,27 @@ async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedConte
         min_successes=MIN_SUCCESSES,
         result_factory=_create_disambiguated_content,
         description="sentence for disambiguation",
+        max_concurrency=MAX_CONCURRENCY,
+        candidate_processor=_disambiguation_candidates if SINGLE_REQUEST_VOTING else None,
+        strategy=VOTING_STRATEGY,
+        require_agreement=REQUIRE_AGREEMENT,
+        degrade_step="voting_completions",
+        on_error=_on_error,
     )
 
-    if not disambiguated_contents:
+    if failed:
+        logger.warning(f"Disambiguation failed for {len(failed)} sentences")
+
+    if not disambiguated_contents and not unchanged:
         logger.info("Nothing could be disambiguated")
-        return {}
+        return {"failed_sentences": failed}
 
     logger.info(
         f"Successfully disambiguated {len(disambiguated_contents)} of {len(selected_contents)} items"
     )
-    return {"disambiguated_contents": disambiguated_contents}
+    # Put the skipped sentences back in document order for the stages after this one
+    merged = sorted(
+        unchanged + disambiguated_contents,
+        key=lambda item: item.original_selected_item.original_context_item.original_index,
+    )
+    return {"disambiguated_contents": merged, "failed_sentences": failed}
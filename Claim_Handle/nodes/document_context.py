@@ -0,0 +1,167 @@
+"""Document-level prompting helpers for selection.
+
+Instead of sending every sentence with its own copy of the surrounding
+window, the document (or a sliding chunk of it) is sent once with numbered
+sentences and the LLM answers for several sentences of interest at once.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from Claim_Handle.prompts import DOCUMENT_HUMAN_PROMPT, HUMAN_PROMPT
+from Claim_Handle.schemas import ContextualSentence
+from utils import (
+    call_llm_with_candidates,
+    call_llm_with_structured_output,
+    estimate_token_count,
+)
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def chunk_indices(indices: Sequence[int], chunk_size: int) -> List[List[int]]:
+    """Split sentence indices into consecutive chunks of at most chunk_size."""
+    ordered = sorted(indices)
+    return [ordered[i : i + chunk_size] for i in range(0, len(ordered), max(1, chunk_size))]
+
+
+def render_document_prompt(
+    sentences: Dict[int, str],
+    targets: Dict[int, str],
+    preceding: int,
+    following: int,
+    metadata: Optional[str] = None,
+) -> str:
+    """Render the numbered excerpt covering a chunk of target sentences.
+
+    The excerpt is shared by the whole chunk, so every target sees up to
+    `following` sentences past the last target, not past itself.
+
+    Args:
+        sentences: Every sentence of the document by index
+        targets: Sentences of interest by index (possibly rewritten by earlier stages)
+        preceding: Context sentences to include before the first target
+        following: Context sentences to include after the last target
+        metadata: Optional document metadata
+
+    Returns:
+        Human prompt for the chunk
+    """
+    start = max(min(sentences), min(targets) - preceding)
+    end = min(max(sentences), max(targets) + following)
+
+    lines = []
+    if metadata:
+        lines.append(f"[Document Metadata: {metadata}]")
+    lines.extend(f"[{i}] {sentences[i]}" for i in range(start, end + 1) if i in sentences)
+
+    return DOCUMENT_HUMAN_PROMPT.format(
+        document="\n".join(lines),
+        sentences="\n".join(f"[{i}] {text}" for i, text in sorted(targets.items())),
+    )
+
+
+async def vote_on_document_chunk(
+    llm: Any,
+    system_prompt: str,
+    output_class: Type[M],
+    human_prompt: str,
+    completions: int,
+    single_request: bool,
+    context_desc: str,
+) -> List[Dict[int, Any]]:
+    """Collect `completions` answers for one chunk.
+
+    Returns:
+        One {sentence index: per-sentence result} mapping per completion
+    """
+    messages = [("system", system_prompt), ("human", human_prompt)]
+
+    if single_request:
+        responses = await call_llm_with_candidates(
+            llm=llm,
+            output_class=output_class,
+            messages=messages,
+            n=completions,
+            context_desc=context_desc,
+        )
+    else:
+        responses = await asyncio.gather(
+            *(
+                call_llm_with_structured_output(
+                    llm=llm,
+                    output_class=output_class,
+                    messages=messages,
+                    context_desc=context_desc,
+                )
+                for _ in range(completions)
+            )
+        )
+
+    return [
+        {result.index: result for result in response.results}
+        for response in responses
+        if response is not None
+    ]
+
+
+def successful_votes(
+    votes: List[Dict[int, Any]],
+    index: int,
+    interpret: Callable[[Optional[Any]], Tuple[bool, Optional[Any]]],
+) -> List[Any]:
+    """Interpret every completion's answer for one sentence and keep the successes."""
+    return [
+        result
+        for success, result in (interpret(vote.get(index)) for vote in votes)
+        if success
+    ]
+
+
+def compare_prompt_tokens(
+    contextual_sentences: List[ContextualSentence],
+    system_prompt: str,
+    document_system_prompt: str,
+    chunk_size: int,
+    preceding: int,
+    following: int,
+) -> Dict[str, float]:
+    """Estimate prompt tokens for per-sentence vs document-level requests.
+
+    Counts one completion's worth of requests for each path.
+
+    Returns:
+        Token totals, request counts and the reduction ratio
+    """
+    per_sentence_tokens = sum(
+        estimate_token_count(
+            system_prompt
+            + HUMAN_PROMPT.format(excerpt=item.context_for_llm, sentence=item.original_sentence)
+        )
+        for item in contextual_sentences
+    )
+
+    sentences = {item.original_index: item.original_sentence for item in contextual_sentences}
+    chunks = chunk_indices(list(sentences), chunk_size)
+    document_tokens = sum(
+        estimate_token_count(
+            document_system_prompt
+            + render_document_prompt(
+                sentences, {i: sentences[i] for i in chunk}, preceding, following
+            )
+        )
+        for chunk in chunks
+    )
+
+    return {
+        "per_sentence_requests": len(contextual_sentences),
+        "per_sentence_tokens": per_sentence_tokens,
+        "document_requests": len(chunks),
+        "document_tokens": document_tokens,
+        "reduction": per_sentence_tokens / document_tokens if document_tokens else 0.0,
+    }
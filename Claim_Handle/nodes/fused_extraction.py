@@ -0,0 +1,220 @@
+"""Fused extraction node - selection, disambiguation and decomposition in one call.
+
+Alternative to the selection -> disambiguation -> decomposition -> validation
+chain: a single structured call per sentence (or per batch of sentences)
+returns all three results, trading the voting passes for one round trip.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS, FUSED_EXTRACTION_CONFIG
+from Claim_Handle.nodes.validation import validation_node
+from Claim_Handle.prompts import (
+    BATCH_HUMAN_PROMPT,
+    BATCH_ITEM_PROMPT,
+    FUSED_EXTRACTION_BATCH_SYSTEM_PROMPT,
+    FUSED_EXTRACTION_SYSTEM_PROMPT,
+    HUMAN_PROMPT,
+)
+from Claim_Handle.schemas import (
+    ContextualSentence,
+    DisambiguatedContent,
+    PotentialClaim,
+    SelectedContent,
+    State,
+    ValidatedClaim,
+)
+from utils import (
+    call_llm_batched,
+    call_llm_with_structured_output,
+    get_llm,
+    instrument_node,
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPERATURE = FUSED_EXTRACTION_CONFIG["temperature"]
+BATCH_SIZE = FUSED_EXTRACTION_CONFIG["batch_size"]
+MAX_RETRIES = FUSED_EXTRACTION_CONFIG["max_retries"]
+
+
+class FusedExtractionOutput(BaseModel):
+    """Response schema for fused extraction LLM calls."""
+
+    no_verifiable_claims: bool = Field(
+        description="Flag indicating if no verifiable claims were found"
+    )
+    selected_sentence: Optional[str] = Field(
+        default=None, description="The sentence containing only verifiable content"
+    )
+    cannot_be_disambiguated: bool = Field(
+        default=False, description="Flag indicating if the sentence cannot be disambiguated"
+    )
+    disambiguated_sentence: Optional[str] = Field(
+        default=None, description="The selected sentence with ambiguities resolved"
+    )
+    claims: List[str] = Field(
+        default_factory=list,
+        description="Self-contained, complete declarative claims from the sentence",
+    )
+
+
+def _fused_human_prompt(contextual_item: ContextualSentence) -> str:
+    # Disambiguation must not read ahead, so the excerpt stops at the sentence
+    # and selection goes without the following sentences
+    return HUMAN_PROMPT.format(
+        excerpt=contextual_item.render_context(**CONTEXT_WINDOWS["disambiguation"]),
+        sentence=contextual_item.original_sentence,
+    )
+
+
+def _fused_batch_messages(
+    batch: List[Tuple[int, ContextualSentence]],
+) -> List[Tuple[str, str]]:
+    """Build the prompt extracting claims from several numbered sentences at once."""
+    items = "".join(
+        BATCH_ITEM_PROMPT.format(index=index, item=_fused_human_prompt(item))
+        for index, item in batch
+    )
+    return [
+        ("system", FUSED_EXTRACTION_BATCH_SYSTEM_PROMPT),
+        ("human", BATCH_HUMAN_PROMPT.format(items=items)),
+    ]
+
+
+async def _fused_extraction(
+    contextual_item: ContextualSentence, llm
+) -> Optional[FusedExtractionOutput]:
+    """Run all extraction steps for one sentence with a single call."""
+    messages = [
+        ("system", FUSED_EXTRACTION_SYSTEM_PROMPT),
+        ("human", _fused_human_prompt(contextual_item)),
+    ]
+    return await call_llm_with_structured_output(
+        llm=llm,
+        output_class=FusedExtractionOutput,
+        messages=messages,
+        context_desc=f"fused extraction for '{contextual_item.original_sentence}'",
+    )
+
+
+def _unpack_response(
+    contextual_item: ContextualSentence, response: Optional[FusedExtractionOutput]
+) -> Tuple[
+    Optional[SelectedContent],
+    Optional[DisambiguatedContent],
+    List[PotentialClaim],
+]:
+    """Turn a fused response into the pipeline's per-stage results."""
+    sentence = contextual_item.original_sentence
+
+    if not response or response.no_verifiable_claims or not response.selected_sentence:
+        logger.info(f"No verifiable claims in: '{sentence}'")
+        return None, None, []
+
+    selected = SelectedContent(
+        processed_sentence=response.selected_sentence.strip(),
+        original_context_item=contextual_item,
+    )
+
+    if response.cannot_be_disambiguated or not response.disambiguated_sentence:
+        logger.info(f"Could not disambiguate: '{selected.processed_sentence}'")
+        return selected, None, []
+
+    disambiguated = DisambiguatedContent(
+        disambiguated_sentence=response.disambiguated_sentence.strip(),
+        original_selected_item=selected,
+    )
+
+    potential_claims = [
+        PotentialClaim(
+            claim_text=claim.strip(),
+            disambiguated_sentence=disambiguated.disambiguated_sentence,
+            original_sentence=sentence,
+            original_index=contextual_item.original_index,
+        )
+        for claim in response.claims
+        if claim.strip()
+    ]
+
+    logger.info(f"Extracted {len(potential_claims)} claims from: '{sentence}'")
+    return selected, disambiguated, potential_claims
+
+
+@instrument_node("Claim_Handle.fused_extraction")
+async def fused_extraction_node(state: State) -> Dict[str, List]:
+    """Select, disambiguate and decompose every sentence with one call each.
+
+    The claims then go through the validation node as in the staged graph,
+    where local rules settle the clear cases and only the rest cost an LLM
+    call. The intermediate selected and disambiguated contents are filled
+    in as well for compatibility.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with selected_contents, disambiguated_contents,
+        potential_claims, validated_claims and failed_sentences keys
+    """
+    contextual_sentences = state.sentences_to_process
+
+    if not contextual_sentences:
+        logger.warning("No sentences to process")
+        return {}
+
+    llm = get_llm(temperature=TEMPERATURE)
+
+    if BATCH_SIZE > 1:
+        responses = await call_llm_batched(
+            llm=llm,
+            output_class=FusedExtractionOutput,
+            items=contextual_sentences,
+            build_messages=_fused_batch_messages,
+            batch_size=BATCH_SIZE,
+            max_retries=MAX_RETRIES,
+            context_desc="fused extraction",
+        )
+    else:
+        responses = await asyncio.gather(
+            *[_fused_extraction(item, llm) for item in contextual_sentences]
+        )
+
+    selected_contents: List[SelectedContent] = []
+    disambiguated_contents: List[DisambiguatedContent] = []
+    potential_claims: List[PotentialClaim] = []
+    failed = [
+        item.original_index
+        for item, response in zip(contextual_sentences, responses)
+        if response is None
+    ]
+
+    for item, response in zip(contextual_sentences, responses):
+        selected, disambiguated, claims = _unpack_response(item, response)
+        if selected:
+            selected_contents.append(selected)
+        if disambiguated:
+            disambiguated_contents.append(disambiguated)
+        potential_claims.extend(claims)
+
+    # Dedupes and collapses near duplicates too, as in the staged graph
+    validated = await validation_node(
+        state.model_copy(update={"potential_claims": potential_claims})
+    )
+    validated_claims: List[ValidatedClaim] = validated.get("validated_claims", [])
+
+    logger.info(
+        f"Fused extraction kept {len(validated_claims)} claims "
+        f"from {len(contextual_sentences)} sentences"
+    )
+    return {
+        "selected_contents": selected_contents,
+        "disambiguated_contents": disambiguated_contents,
+        "potential_claims": potential_claims,
+        "validated_claims": validated_claims,
+        "failed_sentences": failed + validated.get("failed_sentences", []),
+    }
@@ -0,0 +1,183 @@
+"""Incremental re-extraction nodes.
+
+The lookup node runs before selection and takes unchanged sentences out of
+the pipeline, leaving the rest in pending_sentences. The store node runs after validation; it remembers the outputs
+of the sentences that were processed and stitches the reused ones back into
+the state.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from Claim_Handle.Config.nodes import VALIDATION_CONFIG
+from Claim_Handle.incremental import get_extraction_store, pipeline_fingerprint, sentence_key
+from Claim_Handle.near_duplicates import collapse_near_duplicates
+from Claim_Handle.schemas import (
+    DisambiguatedContent,
+    PotentialClaim,
+    ReusedExtraction,
+    SelectedContent,
+    SentenceExtraction,
+    State,
+    ValidatedClaim,
+)
+from utils import current_budget, instrument_node
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUPLICATE_THRESHOLD = VALIDATION_CONFIG["near_duplicate_threshold"]
+
+
+@instrument_node("Claim_Handle.incremental_lookup")
+async def incremental_lookup_node(state: State) -> Dict[str, Any]:
+    """Answer unchanged sentences from the incremental store.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with the sentences still to process and the reused ones
+    """
+    contextual_sentences = state.sentences_to_process
+
+    if not contextual_sentences:
+        return {}
+
+    fingerprint = pipeline_fingerprint()
+    keys = [sentence_key(item, fingerprint) for item in contextual_sentences]
+    stored = get_extraction_store().get_many(keys)
+
+    remaining = []
+    reused = []
+    for item, key in zip(contextual_sentences, keys):
+        extraction = stored.get(key)
+        if extraction is None:
+            remaining.append(item)
+        else:
+            reused.append(ReusedExtraction(contextual_item=item, extraction=extraction))
+
+    logger.info(
+        f"Incremental extraction reused {len(reused)} of {len(contextual_sentences)} sentences"
+    )
+    return {"pending_sentences": remaining, "reused_extractions": reused}
+
+
+def _record_extractions(state: State) -> Dict[str, SentenceExtraction]:
+    """Collect the stage outputs of every sentence processed in this run.
+
+    Sentences that lost a result to a failed LLM call are left out, so the
+    next run retries them instead of reusing the gap.
+    """
+    failed = set(state.failed_sentences)
+    processed = [item for item in state.sentences_to_process if item.original_index not in failed]
+    extractions = {item.original_index: SentenceExtraction() for item in processed}
+
+    for selected in state.selected_contents:
+        index = selected.original_context_item.original_index
+        if index in extractions:
+            extractions[index].processed_sentence = selected.processed_sentence
+
+    for disambiguated in state.disambiguated_contents:
+        index = disambiguated.original_selected_item.original_context_item.original_index
+        if index in extractions:
+            extractions[index].disambiguated_sentence = disambiguated.disambiguated_sentence
+
+    # A claim dropped or collapsed as a duplicate of another sentence's claim
+    # still counts as valid, so it survives that other sentence being edited
+    valid = {claim.claim_text for claim in state.validated_claims}
+    valid.update(
+        duplicate.claim_text
+        for claim in state.validated_claims
+        for duplicate in claim.near_duplicates
+    )
+    for claim in state.potential_claims:
+        if claim.original_index in extractions:
+            extraction = extractions[claim.original_index]
+            extraction.claims.append(claim.claim_text)
+            if claim.claim_text in valid:
+                extraction.valid_claims.append(claim.claim_text)
+
+    fingerprint = pipeline_fingerprint()
+    keys = {item.original_index: sentence_key(item, fingerprint) for item in processed}
+    return {keys[index]: extraction for index, extraction in extractions.items()}
+
+
+def _stitch(reused: ReusedExtraction, seen_claims: set) -> Dict[str, List]:
+    """Rebuild the pipeline's per-stage results from a stored extraction."""
+    item = reused.contextual_item
+    extraction = reused.extraction
+    stitched: Dict[str, List] = defaultdict(list)
+
+    if extraction.processed_sentence is None:
+        return stitched
+    selected = SelectedContent(
+        processed_sentence=extraction.processed_sentence, original_context_item=item
+    )
+    stitched["selected_contents"].append(selected)
+
+    if extraction.disambiguated_sentence is None:
+        return stitched
+    disambiguated = DisambiguatedContent(
+        disambiguated_sentence=extraction.disambiguated_sentence,
+        original_selected_item=selected,
+    )
+    stitched["disambiguated_contents"].append(disambiguated)
+
+    for claim_text in extraction.claims:
+        claim = PotentialClaim(
+            claim_text=claim_text,
+            disambiguated_sentence=extraction.disambiguated_sentence,
+            original_sentence=item.original_sentence,
+            original_index=item.original_index,
+        )
+        stitched["potential_claims"].append(claim)
+
+        if claim_text in extraction.valid_claims and claim_text not in seen_claims:
+            seen_claims.add(claim_text)
+            stitched["validated_claims"].append(
+                ValidatedClaim(is_complete_declarative=True, **claim.model_dump())
+            )
+
+    return stitched
+
+
+@instrument_node("Claim_Handle.incremental_store")
+async def incremental_store_node(state: State) -> Dict[str, List]:
+    """Remember this run's outputs and add the reused sentences' results.
+
+    Runs degraded by a request budget are not stored, so cheaper answers
+    don't outlive the request that needed them. Neither are sentences whose
+    LLM calls failed. The reducers merge the reused results into the fresh
+    ones in document order.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with the reused selected_contents, disambiguated_contents,
+        potential_claims and validated_claims
+    """
+    budget = current_budget()
+    if state.sentences_to_process and not (budget and budget.degradations):
+        extractions = _record_extractions(state)
+        get_extraction_store().put_many(extractions)
+        logger.info(f"Incremental extraction stored {len(extractions)} sentences")
+        if state.failed_sentences:
+            logger.warning(
+                f"Incremental extraction skipped {len(set(state.failed_sentences))} "
+                "sentences with failed LLM calls"
+            )
+
+    seen_claims = {claim.claim_text for claim in state.validated_claims}
+    stitched: Dict[str, List] = defaultdict(list)
+    for reused in state.reused_extractions:
+        for key, values in _stitch(reused, seen_claims).items():
+            stitched[key].extend(values)
+
+    if "validated_claims" in stitched:
+        stitched["validated_claims"] = collapse_near_duplicates(
+            stitched["validated_claims"], NEAR_DUPLICATE_THRESHOLD
+        )
+
+    return dict(stitched)
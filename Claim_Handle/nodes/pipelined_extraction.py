@@ -0,0 +1,214 @@
+"""Pipelined extraction node - moves each sentence through the stages on its own.
+
+Alternative to running selection, disambiguation, decomposition and
+validation as graph nodes, where every stage waits for the slowest sentence
+of the previous one. Here each stage takes whatever is waiting in its queue,
+runs the usual stage node on it and hands the results straight to the next
+stage through a bounded queue.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from langgraph.config import get_stream_writer
+
+from Claim_Handle.Config.nodes import PIPELINE_CONFIG, VALIDATION_CONFIG
+from Claim_Handle.near_duplicates import collapse_near_duplicates
+from Claim_Handle.nodes.decomposition import decomposition_node
+from Claim_Handle.nodes.disambiguation import disambiguation_node
+from Claim_Handle.nodes.selection import selection_node
+from Claim_Handle.nodes.validation import validation_node
+from Claim_Handle.schemas import State, ValidatedClaim, sentence_index
+from utils import instrument_node
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = PIPELINE_CONFIG["queue_size"]
+MAX_BATCH = PIPELINE_CONFIG["max_batch"]
+MAX_CONCURRENCY = PIPELINE_CONFIG["max_concurrency"]
+NEAR_DUPLICATE_THRESHOLD = VALIDATION_CONFIG["near_duplicate_threshold"]
+
+# (stage node, state field it reads, state field it fills)
+_STAGES = (
+    (selection_node, "pending_sentences", "selected_contents"),
+    (disambiguation_node, "selected_contents", "disambiguated_contents"),
+    (decomposition_node, "disambiguated_contents", "potential_claims"),
+    (validation_node, "potential_claims", "validated_claims"),
+)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+async def _next_batch(inbox: asyncio.Queue) -> Optional[list]:
+    """Wait for one item, then take whatever else is already queued.
+
+    Returns None once the queue is finished; a batch cut short by the end
+    marker puts it back for the next call.
+    """
+    item = await inbox.get()
+    if item is _DONE:
+        return None
+
+    batch = [item]
+    while len(batch) < MAX_BATCH and not inbox.empty():
+        item = inbox.get_nowait()
+        if item is _DONE:
+            inbox.put_nowait(_DONE)
+            break
+        batch.append(item)
+    return batch
+
+
+async def _run_stage(
+    state: State,
+    node: Callable,
+    input_field: str,
+    output_field: str,
+    inbox: asyncio.Queue,
+    outbox: Optional[asyncio.Queue],
+    on_results: Callable[[list], None],
+    on_failures: Callable[[List[int]], None],
+) -> None:
+    """Feed batches from inbox through one stage node until inbox is finished.
+
+    Raises:
+        The error of the first batch to fail; batches still running are cancelled
+    """
+    slots = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Finished tasks stay in the list so a failed batch isn't lost before the gather
+    tasks: List[asyncio.Task] = []
+
+    async def _process(batch: list) -> None:
+        try:
+            result = await node(state.model_copy(update={input_field: batch}))
+            outputs = result.get(output_field, [])
+            on_results(outputs)
+            on_failures(result.get("failed_sentences", []))
+            if outbox is not None:
+                for output in outputs:
+                    # Blocks while the next stage is behind, holding the slot
+                    await outbox.put(output)
+        finally:
+            slots.release()
+
+    try:
+        while (batch := await _next_batch(inbox)) is not None:
+            await slots.acquire()
+            # Stop taking batches once one has failed
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            tasks.append(asyncio.create_task(_process(batch)))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if outbox is not None:
+        await outbox.put(_DONE)
+
+
+@instrument_node("Claim_Handle.pipelined_extraction")
+async def pipelined_extraction_node(state: State) -> Dict[str, List]:
+    """Select, disambiguate, decompose and validate sentences as a pipeline.
+
+    Results land in the same state fields as the staged graph. Validated
+    claims are also sent to the custom stream as they come, so callers
+    using graph.astream(..., stream_mode="custom") see the first claims
+    before the last sentence is selected; the returned lists are put back in
+    document order. Stage node metrics count one run per batch.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with selected_contents, disambiguated_contents,
+        potential_claims, validated_claims and failed_sentences keys
+    """
+    contextual_sentences = state.sentences_to_process
+
+    if not contextual_sentences:
+        logger.warning("No sentences to process")
+        return {}
+
+    write = get_stream_writer()
+    started = time.perf_counter()
+    collected: Dict[str, List] = {output_field: [] for _, _, output_field in _STAGES}
+    streamed_claims: Set[str] = set()
+    failed_sentences: List[int] = []
+
+    def _collect(output_field: str) -> Callable[[list], None]:
+        return collected[output_field].extend
+
+    def _collect_validated(claims: List[ValidatedClaim]) -> None:
+        collected["validated_claims"].extend(claims)
+        # Validation dedupes within a batch; this dedupes the stream across batches
+        claims = [claim for claim in claims if claim.claim_text not in streamed_claims]
+        if not claims:
+            return
+        if not streamed_claims:
+            logger.info(f"First validated claim after {time.perf_counter() - started:.2f}s")
+        streamed_claims.update(claim.claim_text for claim in claims)
+        write({"validated_claims": claims})
+
+    queues = [asyncio.Queue(maxsize=QUEUE_SIZE) for _ in _STAGES]
+    stages = [
+        _run_stage(
+            state,
+            node,
+            input_field,
+            output_field,
+            queues[i],
+            queues[i + 1] if i + 1 < len(_STAGES) else None,
+            _collect_validated if output_field == "validated_claims" else _collect(output_field),
+            failed_sentences.extend,
+        )
+        for i, (node, input_field, output_field) in enumerate(_STAGES)
+    ]
+
+    async def _feed() -> None:
+        for item in contextual_sentences:
+            await queues[0].put(item)
+        await queues[0].put(_DONE)
+
+    tasks = [asyncio.create_task(coroutine) for coroutine in (_feed(), *stages)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # A failed stage stops draining its inbox, so the others can't finish on their own
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Batches finish in any order; sorting is stable, so a sentence's claims keep theirs
+    for outputs in collected.values():
+        outputs.sort(key=sentence_index)
+
+    # Duplicates across batches keep the first in document order, as in the staged graph
+    validated_claims: List[ValidatedClaim] = []
+    seen_claims: Set[str] = set()
+    for claim in collected["validated_claims"]:
+        if claim.claim_text not in seen_claims:
+            seen_claims.add(claim.claim_text)
+            validated_claims.append(claim)
+
+    # Paraphrases can meet in different batches, so collapse over all of them
+    validated_claims = collapse_near_duplicates(validated_claims, NEAR_DUPLICATE_THRESHOLD)
+
+    logger.info(
+        f"Pipelined extraction kept {len(validated_claims)} claims "
+        f"from {len(contextual_sentences)} sentences in {time.perf_counter() - started:.2f}s"
+    )
+    return {
+        "selected_contents": collected["selected_contents"],
+        "disambiguated_contents": collected["disambiguated_contents"],
+        "potential_claims": collected["potential_claims"],
+        "validated_claims": validated_claims,
+        "failed_sentences": failed_sentences,
+    }
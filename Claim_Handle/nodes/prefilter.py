@@ -0,0 +1,49 @@
+"""Prefilter node - drops sentences that cannot contain verifiable claims.
+
+Runs local lexical rules ahead of selection so greetings, questions and calls
+to action don't cost a round of LLM votes.
+"""
+
+import logging
+from typing import Dict, List
+
+from Claim_Handle.Config.nodes import PREFILTER_CONFIG
+from Claim_Handle.heuristics import non_factual_score
+from Claim_Handle.schemas import ContextualSentence, State
+from utils import instrument_node
+
+logger = logging.getLogger(__name__)
+
+ENABLED = PREFILTER_CONFIG["enabled"]
+THRESHOLD = PREFILTER_CONFIG["threshold"]
+
+
+@instrument_node("Claim_Handle.prefilter")
+async def prefilter_node(state: State) -> Dict[str, List[ContextualSentence]]:
+    """Drop obviously non-factual sentences before selection.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary with the sentences left to process as pending_sentences;
+        contextual_sentences keeps every sentence as context
+    """
+    contextual_sentences = state.sentences_to_process
+
+    if not ENABLED or not contextual_sentences:
+        return {}
+
+    kept = []
+    for item in contextual_sentences:
+        score, reason = non_factual_score(item.original_sentence)
+        if score >= THRESHOLD:
+            logger.info(
+                f"Prefilter skipped sentence {item.original_index} "
+                f"({reason}, score {score:.2f}): '{item.original_sentence}'"
+            )
+        else:
+            kept.append(item)
+
+    logger.info(f"Prefilter kept {len(kept)} of {len(contextual_sentences)} sentences")
+    return {"pending_sentences": kept}
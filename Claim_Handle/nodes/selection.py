@@ -3,15 +3,39 @@
 Filters out fluff and keeps only sentences with factual claims.
 """
 
+import asyncio
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
-from utils import call_llm_with_structured_output, get_llm, process_with_voting
-
-from Claim_Handle.Config.nodes import SELECTION_CONFIG
-from Claim_Handle.prompts import HUMAN_PROMPT, SELECTION_SYSTEM_PROMPT
+from utils import (
+    degrade,
+    instrument_node,
+    call_llm_with_candidates,
+    call_llm_with_structured_output,
+    get_llm,
+    process_with_voting,
+    track_llm_failures,
+)
+
+from Claim_Handle.Config.nodes import (
+    CONTEXT_WINDOWS,
+    DOCUMENT_CONTEXT_CONFIG,
+    SELECTION_CONFIG,
+)
+from Claim_Handle.nodes.document_context import (
+    chunk_indices,
+    render_document_prompt,
+    successful_votes,
+    vote_on_document_chunk,
+)
+from Claim_Handle.prompts import (
+    HUMAN_PROMPT,
+    SELECTION_DOCUMENT_SYSTEM_PROMPT,
+    SELECTION_SYSTEM_PROMPT,
+)
 from Claim_Handle.schemas import ContextualSentence, SelectedContent, State
 
 logger = logging.getLogger(__name__)
@@ -19,6 +43,12 @@ logger = logging.getLogger(__name__)
 
 COMPLETIONS = SELECTION_CONFIG["completions"]
 MIN_SUCCESSES = SELECTION_CONFIG["min_successes"]
+MAX_CONCURRENCY = SELECTION_CONFIG["max_concurrency"]
+SINGLE_REQUEST_VOTING = SELECTION_CONFIG["single_request_voting"]
+VOTING_STRATEGY = SELECTION_CONFIG["voting_strategy"]
+REQUIRE_AGREEMENT = SELECTION_CONFIG["require_agreement"]
+DOCUMENT_MODE = DOCUMENT_CONTEXT_CONFIG["enabled"]
+DOCUMENT_CHUNK_SIZE = DOCUMENT_CONTEXT_CONFIG["chunk_size"]
 
 
 class SelectionOutput(BaseModel):
@@ -35,21 +65,22 @@ class SelectionOutput(BaseModel):
     )
 
 
-async def _single_selection_attempt(
-    contextual_item: ContextualSentence, llm
-) -> Tuple[bool, Optional[str]]:
-    """Make a single selection attempt.
+class SentenceSelectionOutput(SelectionOutput):
+    """Selection result for one numbered sentence in document mode."""
 
-    Args:
-        contextual_item: Sentence with context
-        llm: LLM instance
+    index: int = Field(description="Number of the sentence of interest")
 
-    Returns:
-        (success, processed_sentence)
-    """
-    sentence = contextual_item.original_sentence
 
-    # Prepare the prompt
+class DocumentSelectionOutput(BaseModel):
+    """Response schema for document-level selection calls."""
+
+    results: List[SentenceSelectionOutput] = Field(
+        default_factory=list, description="One result per sentence of interest"
+    )
+
+
+def _selection_messages(contextual_item: ContextualSentence):
+    """Build the selection prompt for a sentence."""
     messages = ChatPromptTemplate(
         [
             ("system", SELECTION_SYSTEM_PROMPT),
@@ -57,21 +88,18 @@ async def _single_selection_attempt(
         ]
     )
 
-    prompt_messages = messages.invoke(
+    return messages.invoke(
         {
-            "excerpt": contextual_item.context_for_llm,
-            "sentence": sentence,
+            "excerpt": contextual_item.render_context(**CONTEXT_WINDOWS["selection"]),
+            "sentence": contextual_item.original_sentence,
         }
     )
 
-    # Call the LLM
-    selection_response = await call_llm_with_structured_output(
-        llm=llm,
-        output_class=SelectionOutput,
-        messages=prompt_messages,
-        context_desc=f"selection attempt for '{sentence}'",
-    )
 
+def _interpret_selection(
+    selection_response: Optional[SelectionOutput], sentence: str
+) -> Tuple[bool, Optional[str]]:
+    """Turn a selection response into (success, processed_sentence)."""
     # If LLM call failed or no verifiable content
     if (
         not selection_response
@@ -89,6 +117,57 @@ async def _single_selection_attempt(
     return True, processed
 
 
+async def _single_selection_attempt(
+    contextual_item: ContextualSentence, llm
+) -> Tuple[bool, Optional[str]]:
+    """Make a single selection attempt.
+
+    Args:
+        contextual_item: Sentence with context
+        llm: LLM instance
+
+    Returns:
+        (success, processed_sentence)
+    """
+    sentence = contextual_item.original_sentence
+
+    # Call the LLM
+    selection_response = await call_llm_with_structured_output(
+        llm=llm,
+        output_class=SelectionOutput,
+        messages=_selection_messages(contextual_item),
+        context_desc=f"selection attempt for '{sentence}'",
+    )
+
+    return _interpret_selection(selection_response, sentence)
+
+
+async def _selection_candidates(
+    contextual_item: ContextualSentence, llm, n: int
+) -> List[Tuple[bool, Optional[str]]]:
+    """Get n selection votes from a single multi-candidate request.
+
+    Args:
+        contextual_item: Sentence with context
+        llm: LLM instance
+        n: Number of candidates
+
+    Returns:
+        (success, processed_sentence) per candidate
+    """
+    sentence = contextual_item.original_sentence
+
+    candidates = await call_llm_with_candidates(
+        llm=llm,
+        output_class=SelectionOutput,
+        messages=_selection_messages(contextual_item),
+        n=n,
+        context_desc=f"selection candidates for '{sentence}'",
+    )
+
+    return [_interpret_selection(candidate, sentence) for candidate in candidates]
+
+
 def _create_selected_content(
     processed_sentence: str, contextual_item: ContextualSentence
 ) -> SelectedContent:
@@ -109,16 +188,93 @@ def _create_selected_content(
     )
 
 
-async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
+async def _document_selection(
+    contextual_sentences: List[ContextualSentence],
+    document_sentences: List[ContextualSentence],
+    llm,
+    completions: int = COMPLETIONS,
+    min_successes: int = MIN_SUCCESSES,
+    on_error: Optional[Callable[[ContextualSentence], None]] = None,
+) -> List[SelectedContent]:
+    """Select verifiable sentences by sending numbered document chunks.
+
+    Args:
+        contextual_sentences: Sentences to select from
+        document_sentences: Every sentence of the document, used as context,
+            including the ones the prefilter dropped
+        llm: LLM instance
+        completions: Completions per chunk, cut to one for chunks started
+            once the request budget runs low
+        min_successes: Successful completions needed per sentence
+        on_error: Called with each sentence left unselected in a chunk where
+            an LLM call failed
+
+    Returns:
+        Selected contents in document order
+    """
+    window = CONTEXT_WINDOWS["selection"]
+    items = {item.original_index: item for item in contextual_sentences}
+    sentences = {item.original_index: item.original_sentence for item in document_sentences}
+    for index, item in items.items():
+        sentences.setdefault(index, item.original_sentence)
+    metadata = contextual_sentences[0].metadata
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def _select_chunk(chunk: List[int]) -> List[SelectedContent]:
+        async with semaphore:
+            # A single completion once the request budget is running low
+            chunk_completions, chunk_min_successes = completions, min_successes
+            if degrade("voting_completions"):
+                chunk_completions, chunk_min_successes = 1, 1
+            with track_llm_failures() as failures:
+                votes = await vote_on_document_chunk(
+                    llm=llm,
+                    system_prompt=SELECTION_DOCUMENT_SYSTEM_PROMPT,
+                    output_class=DocumentSelectionOutput,
+                    human_prompt=render_document_prompt(
+                        sentences,
+                        {index: sentences[index] for index in chunk},
+                        window["preceding_sentences"],
+                        window["following_sentences"],
+                        metadata,
+                    ),
+                    completions=chunk_completions,
+                    single_request=SINGLE_REQUEST_VOTING,
+                    context_desc=f"document selection for sentences {chunk[0]}-{chunk[-1]}",
+                )
+
+        selected = []
+        for index in chunk:
+            item = items[index]
+            successes = successful_votes(
+                votes, index, lambda vote: _interpret_selection(vote, item.original_sentence)
+            )
+            if len(successes) < chunk_min_successes:
+                logger.info(
+                    f"Not enough successes ({len(successes)}/{chunk_min_successes}) for sentence"
+                )
+                if failures and on_error is not None:
+                    on_error(item)
+                continue
+            selected.append(_create_selected_content(successes[0], item))
+        return selected
+
+    chunks = chunk_indices(list(items), DOCUMENT_CHUNK_SIZE)
+    results = await asyncio.gather(*(_select_chunk(chunk) for chunk in chunks))
+    return list(itertools.chain.from_iterable(results))
+
+
+@instrument_node("Claim_Handle.selection")
+async def selection_node(state: State) -> Dict[str, List[Any]]:
     """Filter sentences that contain verifiable claims.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with selected_contents key
+        Dictionary with selected_contents and failed_sentences keys
     """
-    contextual_sentences = state.contextual_sentences or []
+    contextual_sentences = state.sentences_to_process
 
     if not contextual_sentences:
         logger.warning("No sentences to process")
@@ -127,22 +283,42 @@ async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
     # Get LLM with temperature 0.2 since we're using multiple completions
     llm = get_llm(completions=COMPLETIONS)
 
-    # Process all sentences with voting
-    selected_contents = await process_with_voting(
-        items=contextual_sentences,
-        processor=_single_selection_attempt,
-        llm=llm,
-        completions=COMPLETIONS,
-        min_successes=MIN_SUCCESSES,
-        result_factory=_create_selected_content,
-        description="sentence",
-    )
+    # Sentences that went unselected because a call failed rather than by vote
+    failed: List[int] = []
+
+    def _on_error(item: ContextualSentence) -> None:
+        failed.append(item.original_index)
+
+    if DOCUMENT_MODE:
+        selected_contents = await _document_selection(
+            contextual_sentences, state.contextual_sentences or [], llm, on_error=_on_error
+        )
+    else:
+        # Process all sentences with voting
+        selected_contents = await process_with_voting(
+            items=contextual_sentences,
+            processor=_single_selection_attempt,
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            result_factory=_create_selected_content,
+            description="sentence",
+            max_concurrency=MAX_CONCURRENCY,
+            candidate_processor=_selection_candidates if SINGLE_REQUEST_VOTING else None,
+            strategy=VOTING_STRATEGY,
+            require_agreement=REQUIRE_AGREEMENT,
+            degrade_step="voting_completions",
+            on_error=_on_error,
+        )
+
+    if failed:
+        logger.warning(f"Selection failed for {len(failed)} sentences")
 
     if not selected_contents:
         logger.info("No verifiable claims found")
-        return {}
+        return {"failed_sentences": failed}
 
     logger.info(
         f"Selected {len(selected_contents)} of {len(contextual_sentences)} sentences as verifiable"
     )
-    return {"selected_contents": selected_contents}
\ No newline at end of file
+    return {"selected_contents": selected_contents, "failed_sentences": failed}
\ No newline at end of file
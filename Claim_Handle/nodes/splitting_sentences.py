@@ -7,10 +7,7 @@ Want to figure out
 3. Handling extremely long sentences ( clause level splitting )
 4. Handling different language detection and tokenization
 5. Integrate a token counter to annotate each context with token estimates (useful for batching).
-6. Provide a streaming generator version to reduce memory.
-7. Normalize whitespace and preserve original character offsets for high-fidelity highlighting.
-8. Add tests for edge cases: abbreviations (“Dr.”), decimal numbers, URLs, bullet lists, headings.
-Caching ensure_nltk_resources result (currently returns after first found resource; micro-optimization ok).
+6. Normalize whitespace for high-fidelity highlighting.
 """
 """Sentence splitting, context creation, and token-budget utilities.
 
@@ -25,34 +22,171 @@ Enhancements added:
 """
 
 import logging
-from typing import Dict, List, Optional
-import re
-
-
-import nltk
-# nltk.download('punkt_tab')
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
 from Claim_Handle.Config.nodes import CONTEXT_WINDOWS
-from Claim_Handle.schemas import ContextualSentence, State
+from Claim_Handle.schemas import ContextualSentence, SentenceBuffer, State
+from Claim_Handle.segmentation import get_segmenter
+from utils import instrument_node
 
 logger = logging.getLogger(__name__)
 
 
-def ensure_nltk_resources() -> None:
-    """Download NLTK stuff if needed."""
-    resources = ["tokenizers/punkt_tab", "tokenizers/punkt"]
+def iter_sentence_spans(answer_text: str) -> Iterator[Tuple[str, int, int]]:
+    """Split text into sentences with character offsets, as they are segmented.
+
+    Uses the segmenter selected by SEGMENTER_CONFIG. Fragments shorter than
+    5 characters (bullet markers and the like) are merged with the sentence
+    after them; a merged sentence spans all of its pieces.
+
+    Args:
+        answer_text: Text to split
 
-    for resource in resources:
-        try:
-            nltk.data.find(resource)
-            return
-        except LookupError:
+    Yields:
+        (sentence, start, end) with answer_text[start:end] covering the sentence
+    """
+    pending: Optional[Tuple[str, int, int]] = None
+    for start, end in get_segmenter().spans(answer_text):
+        sentence = answer_text[start:end]
+        if pending is not None:
+            # Keep merging tiny sentences with the next one
+            sentence, start = f"{pending[0]} {sentence}", pending[1]
+        if len(sentence) < 5:
+            pending = (sentence, start, end)
             continue
+        pending = None
+        yield sentence, start, end
+
+    if pending is not None:
+        yield pending
+
+
+def stream_contextual_sentences(
+    answer_text: str,
+    p_sentences: int = 1,
+    f_sentences: int = 1,
+    include_metadata: bool = False,
+    metadata: Optional[str] = None,
+) -> Iterator[ContextualSentence]:
+    """Split text into sentences with context windows, yielding each one early.
+
+    Sentences go into one SentenceBuffer shared by every yielded item, whose
+    context window is just an index range into it. A sentence is yielded as
+    soon as its f_sentences following sentences have been segmented (or the
+    text ends), so its window is complete by the time it is rendered.
+
+    Args:
+        answer_text: Text to split
+        p_sentences: Number of preceding sentences for context
+        f_sentences: Number of following sentences for context
+        include_metadata: Whether to include metadata
+        metadata: Source metadata
+
+    Yields:
+        Sentences with context and character offsets, in order
+    """
+    buffer = SentenceBuffer(metadata if include_metadata else None)
+    waiting: Deque[Tuple[int, int, int]] = deque()
+
+    def _emit() -> ContextualSentence:
+        index, start, end = waiting.popleft()
+        sentence = buffer.sentences[index]
+        item = ContextualSentence(
+            original_sentence=sentence,
+            metadata=metadata,
+            original_index=index,
+            start=start,
+            end=end,
+            window_start=max(0, index - p_sentences),
+            window_end=min(buffer.end_index, index + 1 + max(0, f_sentences)),
+        ).attach(buffer)
+
+        # Log a preview
+        sentence_preview = sentence[:30] + ("..." if len(sentence) > 30 else "")
+        logger.debug(f"Context created for: '{sentence_preview}'")
+        return item
 
-    # None found, download both
-    logger.info("Downloading NLTK resources...")
-    nltk.download("punkt_tab", quiet=True)
-    nltk.download("punkt", quiet=True)
+    for sentence, start, end in iter_sentence_spans(answer_text):
+        waiting.append((buffer.append(sentence), start, end))
+        if len(waiting) > max(0, f_sentences):
+            yield _emit()
+
+    while waiting:
+        yield _emit()
+
+
+def iter_contextual_chunks(
+    answer_text: str,
+    chunk_size: int,
+    overlap_sentences: int,
+    p_sentences: int = 1,
+    f_sentences: int = 1,
+    include_metadata: bool = False,
+    metadata: Optional[str] = None,
+) -> Iterator[List[ContextualSentence]]:
+    """Split text into chunks of sentences with context, one chunk at a time.
+
+    Each chunk gets its own SentenceBuffer holding the overlap_sentences
+    before it and the f_sentences after it as context only, so memory stays
+    flat however long the text is. Indices and offsets count from the start
+    of the text, and windows match stream_contextual_sentences() as long as
+    overlap_sentences is at least the widest preceding window in use.
+
+    Args:
+        answer_text: Text to split
+        chunk_size: Sentences of interest per chunk
+        overlap_sentences: Sentences carried over from the previous chunk as context
+        p_sentences: Number of preceding sentences for context
+        f_sentences: Number of following sentences for context
+        include_metadata: Whether to include metadata
+        metadata: Source metadata
+
+    Yields:
+        Lists of at most chunk_size sentences with context, in order
+    """
+    chunk_size = max(1, chunk_size)
+    f_sentences = max(0, f_sentences)
+    carried: Deque[str] = deque(maxlen=max(0, overlap_sentences))
+    pending: Deque[Tuple[str, int, int]] = deque()
+    next_index = 0
+
+    def _chunk(count: int) -> List[ContextualSentence]:
+        nonlocal next_index
+        buffer = SentenceBuffer(
+            metadata if include_metadata else None, first_index=next_index - len(carried)
+        )
+        # Context from the previous chunk, the chunk itself, then look-ahead
+        for sentence in carried:
+            buffer.append(sentence)
+        for sentence, _, _ in pending:
+            buffer.append(sentence)
+
+        items = []
+        for _ in range(count):
+            sentence, start, end = pending.popleft()
+            items.append(
+                ContextualSentence(
+                    original_sentence=sentence,
+                    metadata=metadata,
+                    original_index=next_index,
+                    start=start,
+                    end=end,
+                    window_start=max(buffer.first_index, next_index - p_sentences),
+                    window_end=min(buffer.end_index, next_index + 1 + f_sentences),
+                ).attach(buffer)
+            )
+            carried.append(sentence)
+            next_index += 1
+        return items
+
+    for span in iter_sentence_spans(answer_text):
+        pending.append(span)
+        if len(pending) >= chunk_size + f_sentences:
+            yield _chunk(chunk_size)
+
+    while pending:
+        yield _chunk(min(chunk_size, len(pending)))
 
 
 async def _sentence_splitter_and_context_creator(
@@ -76,81 +210,17 @@ async def _sentence_splitter_and_context_creator(
     """
     logger.info("Stage 1: Sentence Splitting and Context Creation")
 
-    # Get tokenizer
-    ensure_nltk_resources()
-
-    # Split by paragraphs first, then sentences
-    # This handles bullet lists and paragraph breaks better
-    paragraphs = [p.strip() for p in answer_text.split("\\n") if p.strip()]
-    raw_sentences_from_paragraphs: List[str] = []
-    for paragraph in paragraphs:
-        raw_sentences_from_paragraphs.extend(nltk.sent_tokenize(paragraph))
-
-    # Use the paragraph-aware sentences
-    raw_sentences = raw_sentences_from_paragraphs
-
-    # Merge short fragments (< 5 chars) with next sentence
-    # Avoids processing meaningless bits like bullet points
-    merged_sentences: List[str] = []
-    i = 0
-    while i < len(raw_sentences):
-        current_sentence = raw_sentences[i].strip()
-
-        # Keep merging tiny sentences with the next one
-        while len(current_sentence) < 5 and (i + 1) < len(raw_sentences):
-            i += 1
-            current_sentence += f" {raw_sentences[i].strip()}"
-
-        if current_sentence:  # Skip empty ones
-            merged_sentences.append(current_sentence)
-        i += 1
-
-    # Create context windows for each sentence
-    contextual_sentences: List[ContextualSentence] = []
-
-    for i, sentence in enumerate(merged_sentences):
-        context_parts: List[str] = []
-
-        # Add metadata if available
-        if include_metadata and metadata:
-            context_parts.append(f"[Document Metadata: {metadata}]")
-
-        # Add preceding sentences
-        start_index = max(0, i - p_sentences)
-        if start_index < i:
-            context_parts.append("\n[Preceding Sentences:]")
-            for j in range(start_index, i):
-                context_parts.append(merged_sentences[j])
-
-        # Add the sentence itself
-        context_parts.append(f"\n[Sentence of Interest for current task:]\n{sentence}")
-
-        # Add following sentences
-        end_index = min(len(merged_sentences), i + 1 + f_sentences)
-        if (i + 1) < end_index:
-            context_parts.append("\n[Following Sentences:]")
-            for j in range(i + 1, end_index):
-                context_parts.append(merged_sentences[j])
-
-        # Package it up
-        full_context_str = "\n".join(context_parts)
-        contextual_sentences.append(
-            ContextualSentence(
-                original_sentence=sentence,
-                context_for_llm=full_context_str,
-                metadata=metadata,
-                original_index=i,
-            )
+    contextual_sentences = list(
+        stream_contextual_sentences(
+            answer_text, p_sentences, f_sentences, include_metadata, metadata
         )
-
-        # Log a preview
-        sentence_preview = sentence[:30] + ("..." if len(sentence) > 30 else "")
-        logger.debug(f"Context created for: '{sentence_preview}'")
+    )
 
     logger.info(f"Processed {len(contextual_sentences)} sentences with context")
     return contextual_sentences
 
 
+@instrument_node("Claim_Handle.sentence_splitter")
 async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSentence]]:
     """Split text into sentences and create context windows.
 
@@ -160,6 +230,11 @@ async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSente
     Returns:
         Dictionary with contextual_sentences key
     """
+    # Chunked runs hand over sentences already split with cross-chunk context
+    if state.contextual_sentences:
+        logger.info(f"Using {len(state.contextual_sentences)} pre-split sentences")
+        return {}
+
     # Get what we need from state
     answer_text = state.answer_text
     metadata = state.metadata
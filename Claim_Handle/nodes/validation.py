@@ -1,19 +1,36 @@
 """Validation node - verifies claims are properly formed sentences.
 
 Makes sure claims are complete declarative sentences ready for fact-checking.
+Clear-cut claims are settled by local rules; the LLM judges the rest.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field
-from Claim_Handle.prompts import VALIDATION_HUMAN_PROMPT, VALIDATION_SYSTEM_PROMPT
+from Claim_Handle.Config.nodes import VALIDATION_CONFIG
+from Claim_Handle.heuristics import declarative_form
+from Claim_Handle.prompts import (
+    BATCH_HUMAN_PROMPT,
+    BATCH_ITEM_PROMPT,
+    VALIDATION_BATCH_SYSTEM_PROMPT,
+    VALIDATION_HUMAN_PROMPT,
+    VALIDATION_SYSTEM_PROMPT,
+)
+from Claim_Handle.near_duplicates import collapse_near_duplicates
 from Claim_Handle.schemas import PotentialClaim, State, ValidatedClaim
-from utils import get_llm, call_llm_with_structured_output
+from utils import call_llm_batched, get_llm, call_llm_with_structured_output, instrument_node
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = VALIDATION_CONFIG["batch_size"]
+MAX_RETRIES = VALIDATION_CONFIG["max_retries"]
+NEAR_DUPLICATE_THRESHOLD = VALIDATION_CONFIG["near_duplicate_threshold"]
+RULES_ENABLED = VALIDATION_CONFIG["rules_enabled"]
+RULES_AUDIT_RATE = VALIDATION_CONFIG["rules_audit_rate"]
+
 
 class ValidationOutput(BaseModel):
     """Response schema for validation LLM calls."""
@@ -23,14 +40,49 @@ class ValidationOutput(BaseModel):
     )
 
 
-async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
+def _audited(claim_text: str) -> bool:
+    """Pick rule decisions for the audit by hashing the claim text.
+
+    The same claim is always audited or always not, so identical runs send
+    identical LLM calls and cassettes replay.
+    """
+    digest = hashlib.blake2b(claim_text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64 < RULES_AUDIT_RATE
+
+
+def _to_validated_claim(
+    potential_claim: PotentialClaim, response: Optional[ValidationOutput]
+) -> ValidatedClaim:
+    """Turn a validation response into a ValidatedClaim."""
+    # Check if valid
+    is_valid = False
+    if response and response.is_complete_declarative:
+        is_valid = True
+
+    log_level = logging.INFO if is_valid else logging.WARNING
+    logger.log(
+        log_level,
+        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
+    )
+
+    # Return result
+    return ValidatedClaim(
+        claim_text=potential_claim.claim_text,
+        is_complete_declarative=is_valid,
+        disambiguated_sentence=potential_claim.disambiguated_sentence,
+        original_sentence=potential_claim.original_sentence,
+        original_index=potential_claim.original_index,
+    )
+
+
+async def _validate_claim(potential_claim: PotentialClaim) -> Optional[ValidationOutput]:
     """Check if a claim is a properly formed complete sentence.
 
     Args:
         potential_claim: Claim to validate
 
     Returns:
-        Validation result
+        The LLM's answer, or None if the call failed
     """
     logger.debug(f"Validating claim: '{potential_claim.claim_text}'")
 
@@ -50,35 +102,98 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
         context_desc=f"validation of claim '{potential_claim.claim_text}'",
     )
 
-    # Check if valid
-    is_valid = False
-    if response and response.is_complete_declarative:
-        is_valid = True
+    return response
 
-    log_level = logging.INFO if is_valid else logging.WARNING
-    logger.log(
-        log_level,
-        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
+
+def _validation_batch_messages(
+    batch: List[Tuple[int, PotentialClaim]],
+) -> List[Tuple[str, str]]:
+    """Build the prompt validating several numbered claims at once."""
+    items = "".join(
+        BATCH_ITEM_PROMPT.format(
+            index=index, item=VALIDATION_HUMAN_PROMPT.format(claim=claim.claim_text)
+        )
+        for index, claim in batch
     )
+    return [
+        ("system", VALIDATION_BATCH_SYSTEM_PROMPT),
+        ("human", BATCH_HUMAN_PROMPT.format(items=items)),
+    ]
 
-    # Return result
-    return ValidatedClaim(
-        claim_text=potential_claim.claim_text,
-        is_complete_declarative=is_valid,
-        disambiguated_sentence=potential_claim.disambiguated_sentence,
-        original_sentence=potential_claim.original_sentence,
-        original_index=potential_claim.original_index,
+
+async def _validate_claims_batched(
+    potential_claims: List[PotentialClaim],
+) -> List[Optional[ValidationOutput]]:
+    """Validate claims with a few batched requests instead of one per claim.
+
+    Args:
+        potential_claims: Claims to validate
+
+    Returns:
+        The LLM's answers in the same order; None where one couldn't be parsed
+    """
+    llm = get_llm()
+
+    return await call_llm_batched(
+        llm=llm,
+        output_class=ValidationOutput,
+        items=potential_claims,
+        build_messages=_validation_batch_messages,
+        batch_size=BATCH_SIZE,
+        max_retries=MAX_RETRIES,
+        context_desc="claim validation",
+    )
+
+
+async def _validate_claims_with_llm(
+    potential_claims: List[PotentialClaim],
+) -> List[Optional[ValidationOutput]]:
+    """Ask the LLM about claims, batched unless BATCH_SIZE is 1."""
+    if not potential_claims:
+        return []
+
+    if BATCH_SIZE > 1:
+        return await _validate_claims_batched(potential_claims)
+
+    # Validate all claims in parallel
+    return await asyncio.gather(*[_validate_claim(claim) for claim in potential_claims])
+
+
+def _validate_claim_by_rules(potential_claim: PotentialClaim) -> Optional[ValidatedClaim]:
+    """Validate a clear-cut claim locally; None leaves it to the LLM."""
+    is_valid, rule = declarative_form(potential_claim.claim_text)
+    if is_valid is None:
+        logger.debug(f"Rule validation unsure ({rule}): '{potential_claim.claim_text}'")
+        return None
+
+    logger.info(
+        f"Rule validation {'accepted' if is_valid else 'rejected'} ({rule}): "
+        f"'{potential_claim.claim_text}'"
+    )
+    return ValidatedClaim(is_complete_declarative=is_valid, **potential_claim.model_dump())
+
+
+def _log_audit(rule_result: ValidatedClaim, llm_result: ValidatedClaim) -> None:
+    """Log whether the LLM agrees with a rule decision."""
+    _, rule = declarative_form(rule_result.claim_text)
+    agrees = rule_result.is_complete_declarative == llm_result.is_complete_declarative
+    logger.log(
+        logging.INFO if agrees else logging.WARNING,
+        f"Rule validation audit: LLM {'agrees' if agrees else 'disagrees'} with rule "
+        f"'{rule}' (rules {rule_result.is_complete_declarative}, "
+        f"LLM {llm_result.is_complete_declarative}): '{rule_result.claim_text}'",
     )
 
 
-async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
+@instrument_node("Claim_Handle.validation")
+async def validation_node(state: State) -> Dict[str, Sequence[Any]]:
     """Validate claims as complete, properly formed sentences.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with validated_claims key
+        Dictionary with validated_claims and failed_sentences keys
     """
     potential_claims = state.potential_claims or []
 
@@ -86,11 +201,33 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
         logger.warning("No claims to validate")
         return {}
 
-    # Validate all claims in parallel
-    validation_results = await asyncio.gather(
-        *[_validate_claim(claim) for claim in potential_claims]
+    # Settle the clear cases locally; rule decisions stand even when audited
+    validation_results: List[Optional[ValidatedClaim]] = [
+        _validate_claim_by_rules(claim) if RULES_ENABLED else None
+        for claim in potential_claims
+    ]
+    to_llm = [
+        i
+        for i, result in enumerate(validation_results)
+        if result is None or _audited(potential_claims[i].claim_text)
+    ]
+    logger.info(
+        f"Rules settled {len(potential_claims) - validation_results.count(None)} of "
+        f"{len(potential_claims)} claims, asking the LLM about {len(to_llm)}"
     )
 
+    responses = await _validate_claims_with_llm([potential_claims[i] for i in to_llm])
+    failed: List[int] = []
+    for i, response in zip(to_llm, responses):
+        llm_result = _to_validated_claim(potential_claims[i], response)
+        if validation_results[i] is None:
+            validation_results[i] = llm_result
+            # A failed audit doesn't matter, the rule decision stands
+            if response is None:
+                failed.append(potential_claims[i].original_index)
+        else:
+            _log_audit(validation_results[i], llm_result)
+
     # Filter out invalid and duplicate claims
     validated_claims = []
     seen_claims = set()
@@ -111,5 +248,13 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
             )
             logger.info(f"Discarded claim ({reason}): '{validated.claim_text}'")
 
+    # Verify paraphrases once; the verdict is fanned back out to them
+    validated_claims = collapse_near_duplicates(validated_claims, NEAR_DUPLICATE_THRESHOLD)
+    for claim in validated_claims:
+        for duplicate in claim.near_duplicates:
+            logger.info(
+                f"Collapsed claim (near duplicate of '{claim.claim_text}'): '{duplicate.claim_text}'"
+            )
+
     logger.info(f"Validated {len(validated_claims)} of {len(potential_claims)} claims")
-    return {"validated_claims": validated_claims}
+    return {"validated_claims": validated_claims, "failed_sentences": failed}
@@ -12,6 +12,23 @@ Claim:
 {claim}
 """
 
+BATCH_HUMAN_PROMPT = """
+Items:
+{items}
+"""
+
+BATCH_ITEM_PROMPT = """
+[{index}]
+{item}
+"""
+
+DOCUMENT_HUMAN_PROMPT = """
+    Excerpt:
+    {document}
+    Sentences of interest:
+    {sentences}
+"""
+
 ### SYSTEM PROMPTS ###
 
 SELECTION_SYSTEM_PROMPT = """
@@ -197,4 +214,64 @@ Claim: Sourcing materials from sustainable suppliers
 
 C = Sourcing materials from sustainable suppliers
 In isolation, is C a complete, declarative sentence? It's missing a subject and a verb, so C is not a complete, declarative sentence.
-"""
\ No newline at end of file
+"""
+### DOCUMENT-LEVEL PROMPTS ###
+
+DOCUMENT_MODE_INSTRUCTIONS = """
+## Document mode
+Instead of a single sentence, you will be given a numbered excerpt and a list of numbered sentences of interest. Each sentence of interest may have been rewritten by an earlier step; use the text given in the list. Perform the task above independently for EVERY sentence of interest, using the numbered excerpt as the context. Do not let your answer for one sentence influence another.
+
+Return one entry in `results` per sentence of interest, with `index` set to the sentence's number and the remaining fields filled in exactly as described above for a single sentence.
+"""
+
+SELECTION_DOCUMENT_SYSTEM_PROMPT = SELECTION_SYSTEM_PROMPT + DOCUMENT_MODE_INSTRUCTIONS
+
+### BATCH PROMPTS ###
+
+BATCH_MODE_INSTRUCTIONS = """
+## Batch mode
+Instead of a single input, you will be given several numbered items, each formatted as described above. Perform the task above independently for EVERY item. Do not let your answer for one item influence another.
+
+Return one entry in `results` per item, with `index` set to the item's number and the remaining fields filled in exactly as described above for a single item.
+"""
+
+DECOMPOSITION_BATCH_SYSTEM_PROMPT = DECOMPOSITION_SYSTEM_PROMPT + BATCH_MODE_INSTRUCTIONS
+
+VALIDATION_BATCH_SYSTEM_PROMPT = VALIDATION_SYSTEM_PROMPT + BATCH_MODE_INSTRUCTIONS
+
+### FUSED EXTRACTION PROMPTS ###
+
+FUSED_EXTRACTION_SYSTEM_PROMPT = """
+You are an assistant for a group of fact-checkers. You will be given an excerpt from a text, ending with a particular sentence of interest from the text. If it contains "[...]", this means that you are NOT seeing all sentences in the text. In one pass, you will perform three steps that are normally done separately: selection, disambiguation and decomposition.
+
+## Step 1: Selection
+Determine whether the sentence contains at least one specific and verifiable proposition, and if so, rewrite it as a complete sentence that only contains verifiable information.
+- Introductions to the following sentences, conclusions of the preceding sentences, broad or generic statements, opinions, interpretations, speculations and statements about a lack of information do NOT contain specific and verifiable propositions.
+- It does NOT matter whether the proposition is true or false, or whether it contains ambiguous terms.
+- Consider the preceding sentences when deciding.
+- Examples: "Technological progress should be inclusive" has no verifiable proposition. "Smith's advocacy for renewable energy is crucial in addressing these challenges" -> "Smith advocates for renewable energy".
+
+## Step 2: Disambiguation
+Decontextualize the selected sentence using the sentences before it in the excerpt:
+- Replace partial names and undefined acronyms or abbreviations with the full name or definition when the context provides it.
+- Resolve referential ambiguity (pronouns, "at the time", "the company") and structural ambiguity only when a group of readers shown the context would reach consensus on the interpretation. Vagueness and generality are NOT ambiguity.
+- If any ambiguity cannot be resolved, the sentence cannot be disambiguated.
+- Do NOT include citations and do NOT use external knowledge.
+- Example: Context = "John Smith was an early employee who transitioned to management in 2010", Sentence = "At the time, he led the company's operations and finance teams." -> "In 2010, John Smith led the company's operations and finance teams."
+
+## Step 3: Decomposition
+Split the disambiguated sentence into the simplest specific, verifiable and fully self-contained propositions.
+- Each proposition must be understandable in isolation and keep its meaning from the context; add essential context in square brackets where needed, e.g. "The [Boston] local council expects its law [banning plastic bags] to pass in January 2025".
+- If the sentence says a specific entity said or did something, keep that attribution in every proposition.
+- Only return propositions that are complete, declarative sentences on their own.
+
+## Output
+Your output will directly populate the following structured fields:
+- no_verifiable_claims: true if Step 1 finds no specific and verifiable proposition; then leave every other field empty.
+- selected_sentence: the sentence from Step 1 (the original sentence if no changes were needed).
+- cannot_be_disambiguated: true if Step 2 finds an ambiguity that the context cannot resolve; then leave claims empty.
+- disambiguated_sentence: the sentence from Step 2.
+- claims: the propositions from Step 3.
+"""
+
+FUSED_EXTRACTION_BATCH_SYSTEM_PROMPT = FUSED_EXTRACTION_SYSTEM_PROMPT + BATCH_MODE_INSTRUCTIONS
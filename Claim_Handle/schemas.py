@@ -1,19 +1,122 @@
-from typing import List, Optional, Annotated
+from typing import Any, List, Optional, Annotated
 from operator import add
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class SentenceBuffer:
+    """Every sentence of one text, shared by all of its ContextualSentences.
+
+    Context windows are index ranges into the buffer and are only rendered
+    into strings when a prompt is built. A buffer may hold just a slice of a
+    long text (one chunk plus its context), in which case indices still
+    count from the start of the text.
+
+    Args:
+        metadata: Source metadata shown at the top of every context
+        first_index: Index of the buffer's first sentence in the text
+    """
+
+    def __init__(self, metadata: Optional[str] = None, first_index: int = 0):
+        self.sentences: List[str] = []
+        self.metadata = metadata
+        self.first_index = first_index
+
+    @property
+    def end_index(self) -> int:
+        """Index just past the buffer's last sentence."""
+        return self.first_index + len(self.sentences)
+
+    def append(self, sentence: str) -> int:
+        """Add the next sentence and return its index."""
+        self.sentences.append(sentence)
+        return self.end_index - 1
+
+    def render(self, index: int, window_start: int, window_end: int) -> str:
+        """Render the context for sentence index over [window_start, window_end)."""
+        # Work with positions in the buffer rather than in the text
+        index -= self.first_index
+        window_start = max(0, window_start - self.first_index)
+        window_end = min(window_end - self.first_index, len(self.sentences))
+        context_parts: List[str] = []
+
+        # Add metadata if available
+        if self.metadata:
+            context_parts.append(f"[Document Metadata: {self.metadata}]")
+
+        if window_start < index:
+            context_parts.append("\n[Preceding Sentences:]")
+            context_parts.extend(self.sentences[window_start:index])
+
+        # Add the sentence itself
+        context_parts.append(
+            f"\n[Sentence of Interest for current task:]\n{self.sentences[index]}"
+        )
+
+        if index + 1 < window_end:
+            context_parts.append("\n[Following Sentences:]")
+            context_parts.extend(self.sentences[index + 1 : window_end])
+
+        return "\n".join(context_parts)
+
+
 class ContextualSentence(BaseModel):
     """A sentence with its surrounding context."""
 
     original_sentence: str = Field(description="The raw sentence from the source text")
-    context_for_llm: str = Field(
-        description="Full context for the LLM including surrounding sentences and metadata"
-    )
     metadata: Optional[str] = Field(
         default=None, description="Additional metadata about the source"
     )
     original_index: int = Field(
         description="Index of the sentence in the original text"
     )
+    start: Optional[int] = Field(
+        default=None, description="Character offset where the sentence starts in the original text"
+    )
+    end: Optional[int] = Field(
+        default=None, description="Character offset just past the sentence in the original text"
+    )
+    window_start: int = Field(
+        description="Index of the first sentence of the split-time context window"
+    )
+    window_end: int = Field(
+        description="Index just past the last sentence of the split-time context window"
+    )
+
+    _buffer: Optional[SentenceBuffer] = PrivateAttr(default=None)
+
+    def attach(self, buffer: SentenceBuffer) -> "ContextualSentence":
+        """Point the sentence at the buffer holding its neighbours."""
+        self._buffer = buffer
+        return self
+
+    def _context_buffer(self) -> SentenceBuffer:
+        # Sentences built directly or validated from a dict were never
+        # attached, so the only sentence they know is their own
+        if self._buffer is None:
+            buffer = SentenceBuffer(self.metadata, first_index=self.original_index)
+            buffer.append(self.original_sentence)
+            self._buffer = buffer
+        return self._buffer
+
+    def render_context(self, preceding_sentences: int, following_sentences: int) -> str:
+        """Render the context for the LLM with the given window.
+
+        Stages pass their own CONTEXT_WINDOWS entry, e.g.
+        item.render_context(**CONTEXT_WINDOWS["disambiguation"]). A sentence
+        without a buffer renders without neighbouring sentences.
+        """
+        index = self.original_index
+        return self._context_buffer().render(
+            index, max(0, index - preceding_sentences), index + 1 + following_sentences
+        )
+
+    @property
+    def context_for_llm(self) -> str:
+        """Full context for the LLM with the window the sentence was split with."""
+        return self._context_buffer().render(
+            self.original_index, self.window_start, self.window_end
+        )
+
 
 class SelectedContent(BaseModel):
     """Content selected as potentially verifiable."""
@@ -75,6 +178,50 @@ class ValidatedClaim(BaseModel):
     original_index: int = Field(
         description="Index of the original sentence in the answer text"
     )
+    near_duplicates: List[PotentialClaim] = Field(
+        default_factory=list,
+        description="Paraphrases collapsed into this claim; its verdict applies to them",
+    )
+
+
+def sentence_index(item: Any) -> int:
+    """Original sentence index of any stage's output."""
+    if isinstance(item, SelectedContent):
+        return item.original_context_item.original_index
+    if isinstance(item, DisambiguatedContent):
+        return item.original_selected_item.original_context_item.original_index
+    return item.original_index
+
+
+def in_document_order(left: List[Any], right: List[Any]) -> List[Any]:
+    """Reducer merging two stage output lists by original sentence index.
+
+    The sort is stable, so a sentence's outputs keep their order and the
+    left list's come first for the same sentence.
+    """
+    return sorted(left + right, key=sentence_index)
+
+
+class SentenceExtraction(BaseModel):
+    """Stage outputs remembered for one sentence in the incremental store."""
+
+    processed_sentence: Optional[str] = Field(
+        default=None, description="Selection output, or None if the sentence was not selected"
+    )
+    disambiguated_sentence: Optional[str] = Field(
+        default=None, description="Disambiguation output, or None if it failed"
+    )
+    claims: List[str] = Field(default_factory=list, description="Decomposition output")
+    valid_claims: List[str] = Field(
+        default_factory=list, description="Claims that passed validation"
+    )
+
+
+class ReusedExtraction(BaseModel):
+    """A sentence whose stored stage outputs are reused instead of re-run."""
+
+    contextual_item: ContextualSentence = Field(description="The unchanged sentence")
+    extraction: SentenceExtraction = Field(description="Its stored stage outputs")
 
 
 class State(BaseModel):
@@ -84,21 +231,41 @@ class State(BaseModel):
     contextual_sentences: List[ContextualSentence] = Field(
         default_factory=list, description="Sentences with their surrounding context"
     )
-    selected_contents: Annotated[List[SelectedContent], add] = Field(
+    pending_sentences: Optional[List[ContextualSentence]] = Field(
+        default=None,
+        description="Sentences the extraction stages still have to process, once the "
+        "prefilter or the incremental store has narrowed contextual_sentences down",
+    )
+    selected_contents: Annotated[List[SelectedContent], in_document_order] = Field(
         default_factory=list, description="Contents selected as potentially verifiable"
     )
-    disambiguated_contents: Annotated[List[DisambiguatedContent], add] = Field(
+    disambiguated_contents: Annotated[List[DisambiguatedContent], in_document_order] = Field(
         default_factory=list, description="Contents with ambiguities resolved"
     )
-    potential_claims: Annotated[List[PotentialClaim], add] = Field(
+    potential_claims: Annotated[List[PotentialClaim], in_document_order] = Field(
         default_factory=list, description="Potential claims extracted from content"
     )
-    validated_claims: Annotated[List[ValidatedClaim], add] = Field(
+    validated_claims: Annotated[List[ValidatedClaim], in_document_order] = Field(
         default_factory=list,
         description="Claims validated as complete declarative sentences",
     )
+    reused_extractions: List[ReusedExtraction] = Field(
+        default_factory=list,
+        description="Unchanged sentences answered from the incremental store",
+    )
+    failed_sentences: Annotated[List[int], add] = Field(
+        default_factory=list,
+        description="Indices of sentences that lost a result to a failed LLM call",
+    )
     
     
     metadata: Optional[str] = Field(
         default=None, description="Additional metadata about the source"
-    )
\ No newline at end of file
+    )
+
+    @property
+    def sentences_to_process(self) -> List[ContextualSentence]:
+        """pending_sentences when set, otherwise every contextual sentence."""
+        if self.pending_sentences is None:
+            return self.contextual_sentences
+        return self.pending_sentences
@@ -0,0 +1,196 @@
+"""Pluggable sentence segmenters.
+
+The default rule-based segmenter uses precompiled regular expressions and no
+downloads. It is tuned for WhatsApp-style forwards: URLs, ₹ amounts, bullet
+and numbered lists, Indian honorifics and the Devanagari danda. The NLTK
+punkt segmenter is kept as an option.
+"""
+
+import logging
+import re
+from typing import Iterator, Optional, Protocol, Tuple
+
+from Claim_Handle.Config.nodes import SEGMENTER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_LINE = re.compile(r"[^\n]+")
+
+# Sentence-ending punctuation, any closing quotes or brackets, then whitespace
+_BOUNDARY = re.compile(r"(?:[.!?]+|…|।|॥)[\"'”’)\]]*(?=\s)")
+# The word right before a full stop, including dotted abbreviations like "U.S"
+_LAST_WORD = re.compile(r"([\w.]+)$")
+# List markers and other leading symbols before the first word of a line
+_LINE_MARKER = re.compile(r"^\s*(?:[-*•●▪►✅✔☑➡️→>]+\s*|\(?\d{1,3}[.)]\s+|\(?[a-zA-Z][.)]\s+)")
+
+# Abbreviations that usually come before a name: "Dr. Sharma", "Smt. Devi"
+_TITLES = frozenset(
+    """
+    mr mrs ms dr prof sr st mt lt col gen capt sgt maj brig hon sh shri smt kum adv er vs
+    """.split()
+)
+# Abbreviations that usually come before a number: "Rs. 500", "No. 5", "Jan. 12"
+_NUMBER_PREFIXES = frozenset(
+    """
+    rs no nos vol fig pg pp ref art sec ch jan feb mar apr jun jul aug sep sept oct nov dec
+    """.split()
+)
+_DOTTED_ABBREVIATION = re.compile(r"^(?:[A-Za-z]{1,2}\.)+[A-Za-z]{1,2}$")
+
+
+class Segmenter(Protocol):
+    """Anything that can split text into sentences."""
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each sentence, without surrounding whitespace."""
+        ...
+
+
+def _strip_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if start < end else None
+
+
+class RuleBasedSegmenter:
+    """Fast regex segmenter with rules for forwards and Indian English.
+
+    Every line is its own paragraph, so bullets and line breaks always end a
+    sentence. Within a line a sentence ends at ., !, ?, … or a danda
+    followed by whitespace, except after a known abbreviation, a single
+    initial ("J. K."), a list number at the start of a sentence, or a full
+    stop followed by a lowercase word.
+    """
+
+    def _is_boundary(self, line: str, match: re.Match, sentence_start: int) -> bool:
+        punctuation = match.group().rstrip("\"'”’)]")
+        following = line[match.end():].lstrip()
+        if not following or punctuation.strip(".…"):
+            return True
+
+        # "approx. half", "e.g. this", "wait... what"
+        if following[0].islower():
+            return False
+        if punctuation != ".":
+            return True
+
+        # Only the tail of the line can hold the last word
+        word = _LAST_WORD.search(line, max(0, match.start() - 64), match.start())
+        if word is None:
+            return True
+        token = word.group(1).rstrip(".")
+        lowered = token.lower()
+
+        # Initials like "J. K. Rowling", titles like "Dr." and "U.S." style abbreviations
+        if len(token) == 1 and token.isalpha():
+            return False
+        if lowered in _TITLES:
+            return False
+        if lowered in _NUMBER_PREFIXES and following[0] in "0123456789₹":
+            return False
+        if _DOTTED_ABBREVIATION.match(token) and lowered not in ("a.m", "p.m"):
+            return False
+
+        # "1. The RBI ..." is a list number, not the end of a sentence
+        if token.isdigit() and not line[sentence_start:word.start()].strip():
+            return False
+        return True
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        for line_match in _LINE.finditer(text):
+            line = line_match.group()
+            offset = line_match.start()
+            marker = _LINE_MARKER.match(line)
+            line_start = marker.end() if marker else 0
+
+            start = 0
+            for match in _BOUNDARY.finditer(line):
+                if match.end() <= line_start:
+                    continue
+                if not self._is_boundary(line, match, max(start, line_start)):
+                    continue
+                span = _strip_span(text, offset + start, offset + match.end())
+                if span:
+                    yield span
+                start = match.end()
+
+            span = _strip_span(text, offset + start, offset + len(line))
+            if span:
+                yield span
+
+
+def ensure_nltk_resources() -> None:
+    """Download NLTK stuff if needed."""
+    import nltk
+
+    resources = ["tokenizers/punkt_tab", "tokenizers/punkt"]
+
+    for resource in resources:
+        try:
+            nltk.data.find(resource)
+            return
+        except LookupError:
+            continue
+
+    # None found, download both
+    logger.info("Downloading NLTK resources...")
+    nltk.download("punkt_tab", quiet=True)
+    nltk.download("punkt", quiet=True)
+
+
+class NLTKSegmenter:
+    """NLTK punkt sentence tokenizer, applied line by line (needs nltk)."""
+
+    def __init__(self):
+        import nltk
+
+        ensure_nltk_resources()
+        # A failed download is only logged, so make sure punkt actually
+        # loads here rather than on the first document
+        nltk.sent_tokenize("A. B.")
+        self._nltk = nltk
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        for line in _LINE.finditer(text):
+            paragraph = line.group()
+            cursor = 0
+            for sentence in self._nltk.sent_tokenize(paragraph):
+                sentence = sentence.strip()
+                if not sentence:
+                    continue
+                # Tokenizer output is verbatim text from the paragraph, in order
+                offset = paragraph.find(sentence, cursor)
+                if offset < 0:
+                    offset = cursor
+                cursor = offset + len(sentence)
+                yield line.start() + offset, line.start() + cursor
+
+
+_segmenter: Optional[Segmenter] = None
+
+
+def _build_segmenter(name: str) -> Segmenter:
+    if name.lower() == "nltk":
+        try:
+            return NLTKSegmenter()
+        except Exception as e:
+            logger.warning(f"Segmenter 'nltk' unavailable, using rules: {e}")
+    return RuleBasedSegmenter()
+
+
+def get_segmenter() -> Segmenter:
+    """Get the shared segmenter selected by SEGMENTER_CONFIG["engine"]."""
+    global _segmenter
+
+    if _segmenter is None:
+        _segmenter = _build_segmenter(SEGMENTER_CONFIG["engine"])
+    return _segmenter
+
+
+def set_segmenter(segmenter: Optional[Segmenter]) -> None:
+    """Replace the shared segmenter (None re-reads SEGMENTER_CONFIG)."""
+    global _segmenter
+
+    _segmenter = segmenter
@@ -8,6 +8,7 @@ from typing import List
 
 from pydantic import BaseModel, Field
 from utils import (
+    instrument_node,
     call_llm_with_structured_output,
     get_llm,
     truncate_evidence_for_token_limit,
@@ -55,6 +56,7 @@ def _format_evidence_snippets(snippets: List[Evidence]) -> str:
     )
 
 
+@instrument_node("Claim_Verification.evaluate_evidence")
 async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
     claim = state.claim
     evidence_snippets = state.evidence
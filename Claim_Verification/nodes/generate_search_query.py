@@ -15,7 +15,7 @@ from Claim_Verification.prompts import (
     get_current_timestamp,
 )
 from Claim_Verification.schemas import ClaimVerifierState
-from utils import get_llm, call_llm_with_structured_output
+from utils import get_llm, call_llm_with_structured_output, instrument_node
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,7 @@ class QueryGenerationOutput(BaseModel):
     )
 
 
+@instrument_node("Claim_Verification.generate_search_query")
 async def generate_search_query_node(
     state: ClaimVerifierState,
 ) -> Dict[str, str]:
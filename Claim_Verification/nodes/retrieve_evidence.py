@@ -4,6 +4,7 @@ Uses search queries to retrieve relevant evidence snippets from the web using ne
 """
 
 import logging
+import re
 from typing import Any, Dict, List
 
 from langchain_exa import ExaSearchRetriever
@@ -11,6 +12,15 @@ from langchain_tavily import TavilySearch
 
 from Claim_Verification.Config.nodes import EVIDENCE_RETRIEVAL_CONFIG
 from Claim_Verification.schemas import ClaimVerifierState, Evidence
+from utils import (
+    degrade,
+    get_cassette,
+    get_singleflight,
+    instrument_node,
+    record_search,
+    settings,
+)
+from utils.cassette import search_key
 
 logger = logging.getLogger(__name__)
 
@@ -21,12 +31,12 @@ SEARCH_PROVIDER = EVIDENCE_RETRIEVAL_CONFIG["search_provider"]
 
 class SearchProviders:
     @staticmethod
-    async def exa(query: str) -> List[Evidence]:
+    async def exa(query: str, k: int = RESULTS_PER_QUERY) -> List[Evidence]:
         logger.info(f"Searching with Exa: '{query}'")
 
         try:
             retriever = ExaSearchRetriever(
-                k=RESULTS_PER_QUERY,
+                k=k,
                 text_contents_options={"max_characters": 2000},
                 type="neural",
             )
@@ -50,12 +60,12 @@ class SearchProviders:
             return []
 
     @staticmethod
-    async def tavily(query: str) -> List[Evidence]:
+    async def tavily(query: str, k: int = RESULTS_PER_QUERY) -> List[Evidence]:
         logger.info(f"Searching with Tavily: '{query}'")
 
         try:
             search = TavilySearch(
-                max_results=RESULTS_PER_QUERY,
+                max_results=k,
                 topic="general",
                 include_raw_content="markdown",
             )
@@ -89,14 +99,48 @@ class SearchProviders:
                 return []
 
 
-async def _search_query(query: str) -> List[Evidence]:
+def _normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().casefold()
+
+
+async def _provider_search(query: str, k: int) -> List[Evidence]:
     match SEARCH_PROVIDER.lower():
         case "tavily":
-            return await SearchProviders.tavily(query)
+            return await SearchProviders.tavily(query, k)
         case _:
-            return await SearchProviders.exa(query)
+            return await SearchProviders.exa(query, k)
+
+
+async def _run_search(query: str, k: int) -> List[Evidence]:
+    record_search()
+    cassette = get_cassette()
+    if cassette is None:
+        return await _provider_search(query, k)
+
+    return await cassette.fetch(
+        "search",
+        search_key(SEARCH_PROVIDER.lower(), _normalize_query(query), k),
+        lambda: _provider_search(query, k),
+        lambda evidence: [item.model_dump() for item in evidence],
+        lambda data: [Evidence.model_validate(item) for item in data],
+    )
+
+
+async def _search_query(query: str) -> List[Evidence]:
+    """Search with the configured provider, sharing identical in-flight searches."""
+    k = RESULTS_PER_QUERY
+    if degrade("results_per_query"):
+        k = max(1, k // 2)
+
+    if not settings.llm_singleflight_enabled:
+        return await _run_search(query, k)
+
+    key = (SEARCH_PROVIDER.lower(), _normalize_query(query), k)
+    evidence = await get_singleflight("search").do(key, lambda: _run_search(query, k))
+    return list(evidence)
 
 
+@instrument_node("Claim_Verification.retrieve_evidence")
 async def retrieve_evidence_node(
     state: ClaimVerifierState,
 ) -> Dict[str, List[Evidence]]:
@@ -8,7 +8,7 @@ from typing import Literal
 
 from langgraph.graph.state import Command
 from pydantic import BaseModel, Field
-from utils import call_llm_with_structured_output, get_llm
+from utils import call_llm_with_structured_output, degrade, get_llm, instrument_node
 
 from Claim_Verification.Config import ITERATIVE_SEARCH_CONFIG
 from Claim_Verification.prompts import (
@@ -39,6 +39,7 @@ class SearchDecisionOutput(BaseModel):
     )
 
 
+@instrument_node("Claim_Verification.search_decision")
 async def search_decision_node(
     state: ClaimVerifierState,
 ) -> Command[Literal["generate_search_query", "evaluate_evidence"]]:
@@ -49,6 +50,8 @@ async def search_decision_node(
     iteration_count = state.iteration_count
 
     max_iterations = ITERATIVE_SEARCH_CONFIG["max_iterations"]
+    if degrade("max_iterations"):
+        max_iterations = max(1, max_iterations // 2)
 
     # Check stopping conditions
     if iteration_count >= max_iterations:
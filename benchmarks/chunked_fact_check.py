@@ -0,0 +1,69 @@
+"""Compare whole-document and chunked fact-checking on a long forward.
+
+Usage:
+    python benchmarks/chunked_fact_check.py [sentences] [chunk_sentences]
+
+Runs the same synthetic document through the fact_checker graph and through
+check_document_chunked(), printing claims verified, wall time and the peak
+memory traced during the run. Uses whichever LLM and search backends are
+configured.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fact_checker import check_document_chunked, graph
+
+SAMPLE_SENTENCES = [
+    "The Reserve Bank of India announced on Monday that ₹500 notes without the silver thread will be withdrawn in district {i}.",
+    "Citizens must exchange them at their nearest bank branch before 30 September.",
+    "Forward this message to everyone you know!",
+    "The RBI governor said the decision was taken to curb counterfeit currency in district {i}.",
+    "Banks in district {i} will stay open on Sunday to handle the rush.",
+]
+
+
+def build_text(sentence_count: int) -> str:
+    # Numbered districts keep the claims from collapsing into a handful
+    return " ".join(
+        SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)].format(i=i // len(SAMPLE_SENTENCES))
+        for i in range(sentence_count)
+    )
+
+
+async def run_graph(text: str, chunk_sentences: int):
+    result = await graph.ainvoke({"answer": text})
+    return result.get("final_report")
+
+
+async def run_chunked(text: str, chunk_sentences: int):
+    return await check_document_chunked(text, chunk_sentences=chunk_sentences)
+
+
+def main(sentence_count: int, chunk_sentences: int) -> None:
+    text = build_text(sentence_count)
+    print(f"document: {len(text) / 1e3:.0f} kB, {sentence_count} sentences")
+
+    for name, runner in (("graph", run_graph), ("chunked", run_chunked)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        report = asyncio.run(runner(text, chunk_sentences))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:>8}: {report.claims_verified if report else 0} claims verified, "
+            f"{elapsed:7.1f} s, peak memory {peak / 1e6:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
@@ -0,0 +1,64 @@
+"""Compare prompt tokens for per-sentence vs document-level selection.
+
+Usage:
+    python benchmarks/document_context_tokens.py [sentences] [chunk_size]
+
+Splits a synthetic WhatsApp-style forward with the regular splitter and
+prints the estimated prompt tokens each path would send for one completion.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS, DOCUMENT_CONTEXT_CONFIG
+from Claim_Handle.nodes.document_context import compare_prompt_tokens
+from Claim_Handle.nodes.splitting_sentences import _sentence_splitter_and_context_creator
+from Claim_Handle.prompts import SELECTION_DOCUMENT_SYSTEM_PROMPT, SELECTION_SYSTEM_PROMPT
+
+SAMPLE_SENTENCES = [
+    "The Reserve Bank of India announced on Monday that ₹500 notes without the silver thread will be withdrawn.",
+    "Citizens must exchange them at their nearest bank branch before 30 September.",
+    "Forward this message to everyone you know!",
+    "The RBI governor said the decision was taken to curb counterfeit currency.",
+    "Banks will stay open on Sunday to handle the rush.",
+]
+
+
+def build_text(sentence_count: int) -> str:
+    return " ".join(
+        SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] for i in range(sentence_count)
+    )
+
+
+async def main(sentence_count: int, chunk_size: int) -> None:
+    window = CONTEXT_WINDOWS["selection"]
+    contextual_sentences = await _sentence_splitter_and_context_creator(
+        build_text(sentence_count),
+        window["preceding_sentences"],
+        window["following_sentences"],
+    )
+
+    comparison = compare_prompt_tokens(
+        contextual_sentences,
+        SELECTION_SYSTEM_PROMPT,
+        SELECTION_DOCUMENT_SYSTEM_PROMPT,
+        chunk_size,
+        window["preceding_sentences"],
+        window["following_sentences"],
+    )
+
+    print(f"sentences:              {len(contextual_sentences)}")
+    print(f"per-sentence requests:  {comparison['per_sentence_requests']}")
+    print(f"per-sentence tokens:    {comparison['per_sentence_tokens']}")
+    print(f"document requests:      {comparison['document_requests']}")
+    print(f"document tokens:        {comparison['document_tokens']}")
+    print(f"reduction:              {comparison['reduction']:.1f}x")
+
+
+if __name__ == "__main__":
+    sentence_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else DOCUMENT_CONTEXT_CONFIG["chunk_size"]
+    asyncio.run(main(sentence_count, chunk_size))
@@ -0,0 +1,70 @@
+"""Compare the five-node claim extraction pipeline with fused extraction.
+
+Usage:
+    python benchmarks/fused_extraction.py [sentences]
+
+Runs the same synthetic forward through both Claim_Handle graphs and prints
+LLM calls, provider-reported tokens, end-to-end latency and claims found.
+Uses whichever backend is configured; for an offline comparison of calls
+and latency, set LLM_BACKEND=local and LOCAL_LLM_LATENCY to a typical
+per-request latency (the local backend reports no tokens).
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Claim_Handle import create_graph
+from utils import metrics_scope
+
+SAMPLE_SENTENCES = [
+    "The Reserve Bank of India announced on Monday that ₹500 notes without the silver thread will be withdrawn.",
+    "Citizens must exchange them at their nearest bank branch before 30 September.",
+    "Forward this message to everyone you know!",
+    "The RBI governor said the decision was taken to curb counterfeit currency.",
+    "Banks will stay open on Sunday to handle the rush.",
+]
+
+
+def build_text(sentence_count: int) -> str:
+    return " ".join(
+        SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] for i in range(sentence_count)
+    )
+
+
+async def run(fused: bool, text: str) -> dict:
+    graph = create_graph(fused=fused)
+
+    with metrics_scope() as metrics:
+        start = time.perf_counter()
+        result = await graph.ainvoke({"answer_text": text})
+        elapsed = time.perf_counter() - start
+
+    totals = metrics.snapshot().totals
+    return {
+        "calls": totals.llm_calls,
+        "input_tokens": totals.input_tokens,
+        "output_tokens": totals.output_tokens,
+        "seconds": elapsed,
+        "claims": len(result.get("validated_claims", [])),
+    }
+
+
+async def main(sentence_count: int) -> None:
+    text = build_text(sentence_count)
+    print(f"sentences: {sentence_count}")
+
+    for name, fused in (("pipeline", False), ("fused", True)):
+        result = await run(fused, text)
+        print(
+            f"{name:>8}: {result['calls']:4d} LLM calls, "
+            f"{result['input_tokens']:7d} in / {result['output_tokens']:6d} out tokens, "
+            f"{result['seconds']:6.2f} s, {result['claims']} claims"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
@@ -0,0 +1,75 @@
+"""Compare the staged claim extraction graph with the pipelined one.
+
+Usage:
+    python benchmarks/pipelined_extraction.py [sentences]
+
+Streams the same synthetic forward through both Claim_Handle graphs and
+prints the time until the first validated claim is available, the total
+latency and the claims found. In the staged graph the first claims arrive
+with the validation node's update; in the pipelined graph they arrive on
+the custom stream as each sentence finishes. Uses whichever backend is
+configured; offline, set LLM_BACKEND=local and LOCAL_LLM_LATENCY to a
+typical per-request latency.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Claim_Handle import create_graph
+
+SAMPLE_SENTENCES = [
+    "The Reserve Bank of India announced on Monday that ₹500 notes without the silver thread will be withdrawn.",
+    "Citizens must exchange them at their nearest bank branch before 30 September.",
+    "Forward this message to everyone you know!",
+    "The RBI governor said the decision was taken to curb counterfeit currency.",
+    "Banks will stay open on Sunday to handle the rush.",
+]
+
+
+def build_text(sentence_count: int) -> str:
+    return " ".join(
+        SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] for i in range(sentence_count)
+    )
+
+
+async def run(pipelined: bool, text: str) -> dict:
+    graph = create_graph(pipelined=pipelined)
+    first = None
+    claims = 0
+
+    start = time.perf_counter()
+    async for mode, chunk in graph.astream(
+        {"answer_text": text}, stream_mode=["updates", "custom"]
+    ):
+        # Updates are keyed by node name; custom events carry claims directly
+        updates = chunk.values() if mode == "updates" else [chunk]
+        for update in updates:
+            found = len((update or {}).get("validated_claims", []))
+            if found and first is None:
+                first = time.perf_counter() - start
+            if mode == "updates":
+                claims += found
+    total = time.perf_counter() - start
+
+    return {"first": first, "total": total, "claims": claims}
+
+
+async def main(sentence_count: int) -> None:
+    text = build_text(sentence_count)
+    print(f"sentences: {sentence_count}")
+
+    for name, pipelined in (("staged", False), ("pipelined", True)):
+        result = await run(pipelined, text)
+        first = f"{result['first']:7.2f} s" if result["first"] is not None else "      -  "
+        print(
+            f"{name:>10}: first claim {first}, total {result['total']:7.2f} s, "
+            f"{result['claims']} claims"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
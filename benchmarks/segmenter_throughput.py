@@ -0,0 +1,82 @@
+"""Measure sentence segmenter accuracy and throughput.
+
+Usage:
+    python benchmarks/segmenter_throughput.py [megabytes]
+
+Checks every available segmenter against the edge-case corpus in
+data/segmentation_corpus.json (URLs, ₹ amounts, bullets, abbreviations,
+Devanagari and so on), then times it on a synthetic document of the given
+size built from the corpus and reports MB/s. The NLTK engine is skipped
+when NLTK or its punkt data is unavailable.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Claim_Handle.segmentation import NLTKSegmenter, RuleBasedSegmenter
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "segmentation_corpus.json")
+
+
+def load_corpus() -> list:
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_corpus(segmenter, corpus: list) -> list:
+    """Return (name, expected, got) for every case the segmenter gets wrong."""
+    failures = []
+    for case in corpus:
+        text = case["text"]
+        got = [text[start:end] for start, end in segmenter.spans(text)]
+        if got != case["sentences"]:
+            failures.append((case["name"], case["sentences"], got))
+    return failures
+
+
+def build_document(corpus: list, megabytes: float) -> str:
+    paragraphs = [case["text"] for case in corpus]
+    target = int(megabytes * 1e6)
+    parts, size, i = [], 0, 0
+    while size < target:
+        paragraph = paragraphs[i % len(paragraphs)]
+        parts.append(paragraph)
+        size += len(paragraph.encode("utf-8")) + 1
+        i += 1
+    return "\n".join(parts)
+
+
+def throughput(segmenter, document: str) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = sum(1 for _ in segmenter.spans(document))
+    elapsed = time.perf_counter() - start
+    return len(document.encode("utf-8")) / 1e6 / elapsed, count
+
+
+def main(megabytes: float) -> None:
+    corpus = load_corpus()
+    document = build_document(corpus, megabytes)
+
+    for name, factory in (("rules", RuleBasedSegmenter), ("nltk", NLTKSegmenter)):
+        try:
+            segmenter = factory()
+            failures = check_corpus(segmenter, corpus)
+        except Exception as e:
+            print(f"{name:>6}: unavailable ({e.__class__.__name__}: {str(e).splitlines()[0]})")
+            continue
+
+        mb_per_second, count = throughput(segmenter, document)
+        print(
+            f"{name:>6}: {len(corpus) - len(failures)}/{len(corpus)} corpus cases, "
+            f"{mb_per_second:6.1f} MB/s ({count} sentences in {megabytes:g} MB)"
+        )
+        for case_name, expected, got in failures:
+            print(f"        {case_name}: expected {expected}, got {got}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
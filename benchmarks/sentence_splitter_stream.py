@@ -0,0 +1,93 @@
+"""Compare the list and streaming sentence splitters on a large document.
+
+Usage:
+    python benchmarks/sentence_splitter_stream.py [sentences]
+
+Splits a synthetic multi-paragraph forward both ways and prints the time
+until the first sentence is available, the total time, and the peak
+memory traced while splitting.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS
+from Claim_Handle.nodes.splitting_sentences import (
+    _sentence_splitter_and_context_creator,
+    stream_contextual_sentences,
+)
+
+SAMPLE_SENTENCES = [
+    "The Reserve Bank of India announced on Monday that ₹500 notes without the silver thread will be withdrawn.",
+    "Citizens must exchange them at their nearest bank branch before 30 September.",
+    "Forward this message to everyone you know!",
+    "The RBI governor said the decision was taken to curb counterfeit currency.",
+    "Banks will stay open on Sunday to handle the rush.",
+]
+
+
+def build_text(sentence_count: int) -> str:
+    # A paragraph break every ten sentences
+    lines = []
+    for start in range(0, sentence_count, 10):
+        lines.append(
+            " ".join(
+                SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)]
+                for i in range(start, min(start + 10, sentence_count))
+            )
+        )
+    return "\n".join(lines)
+
+
+def run_list(text: str, p_sentences: int, f_sentences: int) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    sentences = asyncio.run(
+        _sentence_splitter_and_context_creator(text, p_sentences, f_sentences)
+    )
+    first = time.perf_counter() - start
+    # Downstream work starts only after the whole list exists
+    count = sum(1 for _ in sentences)
+    return first, time.perf_counter() - start, count
+
+
+def run_stream(text: str, p_sentences: int, f_sentences: int) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in stream_contextual_sentences(text, p_sentences, f_sentences):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    return first or 0.0, time.perf_counter() - start, count
+
+
+def measure(runner, text: str, p_sentences: int, f_sentences: int) -> dict:
+    tracemalloc.start()
+    first, total, count = runner(text, p_sentences, f_sentences)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"first": first, "total": total, "count": count, "peak": peak}
+
+
+def main(sentence_count: int) -> None:
+    window = CONTEXT_WINDOWS["selection"]
+    text = build_text(sentence_count)
+    print(f"document: {len(text) / 1e6:.2f} MB, {sentence_count} sentences")
+
+    for name, runner in (("list", run_list), ("stream", run_stream)):
+        result = measure(runner, text, window["preceding_sentences"], window["following_sentences"])
+        print(
+            f"{name:>6}: first sentence {result['first'] * 1000:8.1f} ms, "
+            f"total {result['total'] * 1000:8.1f} ms, "
+            f"peak memory {result['peak'] / 1e6:7.1f} MB, "
+            f"{result['count']} sentences"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -1,6 +1,6 @@
 
 from educational_tool.schemas import EducationalToolReport
-from utils import get_llm, call_llm_with_structured_output
+from utils import get_llm, call_llm_with_structured_output, instrument_node
 from educational_tool.prompts import (
     DECEPTION_ANALYSIS_SYSTEM_PROMPT,
     DECEPTION_ANALYSIS_HUMAN_PROMPT,
@@ -22,6 +22,7 @@ from educational_tool.schemas import State
 logger = logging.getLogger(__name__)
 
 
+@instrument_node("educational_tool.educational_report")
 async def education_full_report_node(state: State)-> Dict[str, Any]:
     """
     Process the inputs and generate the educational report
@@ -106,6 +107,7 @@ class ImprovementAnalysis(BaseModel):
 
 # --- 2. The Refactored Sequential Node ---
 
+@instrument_node("educational_tool.educational_report")
 async def education_sequential_report_node(state: State) -> Dict[str, Any]:
     """
     Generates the educational report by calling the LLM sequentially for each section.
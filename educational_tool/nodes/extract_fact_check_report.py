@@ -1,9 +1,12 @@
+from datetime import datetime
 # from educational_tool.schemas import State
+from utils import instrument_node
 from fact_checker.agent import graph as generate_report_graph
 from typing import Dict, Any
 from educational_tool.schemas import State
 import logging
 logger = logging.getLogger(__name__)
+@instrument_node("educational_tool.extract_fact_check_report")
 async def extract_fact_checking_report_node(state: State)-> Dict[str, Any]:
     """ Extract report from the answer text thorugh fact checking graph
     Args:
@@ -13,7 +16,8 @@ async def extract_fact_checking_report_node(state: State)-> Dict[str, Any]:
         Dictionary with required fields
     """
     try:
-        report_genaration_payload= {"answer": state.raw_text}
+        # Shares the request's collector, and returning it keeps it in the state
+        report_genaration_payload= {"answer": state.raw_text, "metrics": state.metrics}
         extractor_report = await generate_report_graph.ainvoke(report_genaration_payload)
         raw_text = extractor_report.get("answer")
         validated_claims = [{"claim": extractor_report.get("verification_results")[i].claim_text, "result": extractor_report.get('verification_results')[0].model_dump()['result'].value} for i in range(len(extractor_report.get("verification_results")))]
@@ -26,7 +30,8 @@ async def extract_fact_checking_report_node(state: State)-> Dict[str, Any]:
             "verification_results": extractor_report.get("verification_results"),
             "final_report": extractor_report.get("final_report"),
             "validated_claims": validated_claims, 
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "metrics": state.metrics
         }
     except Exception as e:
         logger.error(f"Report generation failed: {e}")
@@ -36,5 +41,6 @@ async def extract_fact_checking_report_node(state: State)-> Dict[str, Any]:
             "verification_results": [],
             "final_report": None,
             "validated_claims": [],
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "metrics": state.metrics
         }
\ No newline at end of file
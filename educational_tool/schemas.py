@@ -2,11 +2,12 @@ from datetime import datetime
 from typing import Annotated, List, Optional, Any, Dict
 
 from operator import add
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from Claim_Verification.schemas import Verdict
 from Claim_Handle.schemas import ValidatedClaim
 from fact_checker.schemas import FactCheckReport
+from utils import MetricsCollector
 
 # class similar_claims_in_past(BaseModel):
 #     claim: str = Field(description="The claim")
@@ -45,6 +46,8 @@ class EducationalToolReport(BaseModel):
 class State(BaseModel):
     """The state for the main fact checker workflow."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     raw_text: str = Field(description="The text to extract claims from")
     extracted_claims: List[ValidatedClaim] = Field(
         default_factory=list, description="Claims extracted from the text"
@@ -64,3 +67,7 @@ class State(BaseModel):
     education_report: Optional[EducationalToolReport] = Field(
         default=None, description="The final educational report"
     )
+    metrics: Optional[MetricsCollector] = Field(
+        default_factory=MetricsCollector,
+        description="Collects this request's metrics, fact check included",
+    )
@@ -4,12 +4,14 @@ Integrates claim extraction and verification into a complete workflow.
 """
 
 from fact_checker.agent import create_graph, graph
+from fact_checker.chunked import check_document_chunked
 from fact_checker.schemas import FactCheckReport, State
 
 __all__ = [
     # Main functionality
     "create_graph",
     "graph",
+    "check_document_chunked",
     # Data models
     "State",
     "FactCheckReport",
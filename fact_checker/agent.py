@@ -44,7 +44,9 @@ def create_graph() -> CompiledStateGraph:
 
     # Connect the nodes in sequence
     workflow.add_conditional_edges(
-        "extract_claims", dispatch_claims_for_verification, ["claim_verifier", END]
+        "extract_claims",
+        dispatch_claims_for_verification,
+        ["claim_verifier", "generate_report_node", END],
     )
     workflow.add_edge("claim_verifier", "generate_report_node")
 
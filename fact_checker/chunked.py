@@ -0,0 +1,153 @@
+"""Chunked fact-checking for very long documents.
+
+The text is split into chunks of sentences, each carrying the last sentences
+of the previous chunk as context for disambiguation. Claims from a chunk are
+verified while the next chunks are still being extracted, and every verdict
+goes into one FactCheckReport. Only a few chunks are held at a time, so
+memory stays flat however long the document is.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Set
+
+from Claim_Handle import ContextualSentence, ValidatedClaim
+from Claim_Handle import graph as claim_extractor_graph
+from Claim_Handle.Config.nodes import CONTEXT_WINDOWS
+from Claim_Handle.nodes.splitting_sentences import iter_contextual_chunks
+from Claim_Verification import Verdict
+from fact_checker.nodes import (
+    claim_verifier_node,
+    dispatch_claims_for_verification,
+    generate_report_node,
+)
+from fact_checker.schemas import FactCheckReport, State
+from utils import (
+    Budget,
+    MetricsCollector,
+    activate_budget,
+    instrument_node,
+    metrics_scope,
+    settings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_node("fact_checker.extract_chunk")
+async def _extract_chunk(
+    answer: str, chunk: List[ContextualSentence], budget: Optional[Budget]
+) -> List[ValidatedClaim]:
+    """Run claim extraction on one chunk of pre-split sentences."""
+    first, last = chunk[0], chunk[-1]
+    payload = {
+        "answer_text": answer[first.start : last.end],
+        "contextual_sentences": chunk,
+    }
+
+    try:
+        with activate_budget(budget):
+            result = await claim_extractor_graph.ainvoke(payload)
+    except Exception as e:
+        logger.error(
+            f"Claim extraction failed for sentences {first.original_index}-{last.original_index}: {e}"
+        )
+        return []
+
+    claims = result.get("validated_claims", [])
+    logger.info(
+        f"Extracted {len(claims)} claims from sentences "
+        f"{first.original_index}-{last.original_index}"
+    )
+    return claims
+
+
+async def _verify_claims(
+    answer: str, claims: List[ValidatedClaim], budget: Optional[Budget]
+) -> List[Verdict]:
+    """Verify one chunk's claims in parallel, as the graph's dispatch does."""
+    sends = dispatch_claims_for_verification(
+        State(answer=answer, extracted_claims=claims, budget=budget)
+    )
+    if not isinstance(sends, list):
+        return []
+
+    results = await asyncio.gather(*(claim_verifier_node(send.arg) for send in sends))
+    return [verdict for result in results for verdict in result.get("verification_results", [])]
+
+
+async def check_document_chunked(
+    answer: str,
+    budget: Optional[Budget] = None,
+    chunk_sentences: Optional[int] = None,
+    overlap_sentences: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> FactCheckReport:
+    """Fact-check a long document chunk by chunk.
+
+    Args:
+        answer: The text to fact-check
+        budget: Request budget; defaults to the BUDGET_* settings
+        chunk_sentences: Sentences per chunk; defaults to CHUNK_SENTENCES
+        overlap_sentences: Sentences of the previous chunk kept as context;
+            defaults to CHUNK_OVERLAP_SENTENCES. Below the widest preceding
+            context window, sentences at the start of a chunk see less context
+        max_in_flight: Chunks being extracted or verified at once; defaults
+            to CHUNK_MAX_IN_FLIGHT
+
+    Returns:
+        The report over every chunk, with verdicts in document order
+    """
+    budget = budget or Budget.from_settings()
+    chunk_sentences = chunk_sentences or settings.chunk_sentences
+    if overlap_sentences is None:
+        overlap_sentences = settings.chunk_overlap_sentences
+    window = CONTEXT_WINDOWS["selection"]
+
+    # A chunk holds a slot from the start of its extraction to the end of its
+    # verification, so extraction of chunk n+1 overlaps verification of chunk n
+    slots = asyncio.Semaphore(max(1, max_in_flight or settings.chunk_max_in_flight))
+    verdicts: List[Verdict] = []
+    seen_claims: Set[str] = set()
+    tasks: Set[asyncio.Task] = set()
+
+    async def _verify(claims: List[ValidatedClaim]) -> None:
+        try:
+            verdicts.extend(await _verify_claims(answer, claims, budget))
+        finally:
+            slots.release()
+
+    chunks = iter_contextual_chunks(
+        answer,
+        chunk_sentences,
+        overlap_sentences,
+        window["preceding_sentences"],
+        window["following_sentences"],
+    )
+
+    # Verification tasks copy this context, so their metrics land here too
+    metrics = MetricsCollector()
+    with metrics_scope(metrics):
+        try:
+            for chunk in chunks:
+                await slots.acquire()
+                claims = await _extract_chunk(answer, chunk, budget)
+
+                # Claims repeated in a later chunk are only verified once
+                claims = [claim for claim in claims if claim.claim_text not in seen_claims]
+                seen_claims.update(claim.claim_text for claim in claims)
+
+                task = asyncio.create_task(_verify(claims))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        verdicts.sort(key=lambda verdict: verdict.original_index)
+        result = await generate_report_node(
+            State(answer=answer, verification_results=verdicts, budget=budget, metrics=metrics)
+        )
+    return result["final_report"]
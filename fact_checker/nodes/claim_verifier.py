@@ -4,19 +4,33 @@ Interfaces with the claim verifier subsystem to check factual accuracy.
 """
 
 import logging
-from typing import Dict
+from typing import Dict, List
 
 from Claim_Verification import Verdict
 from Claim_Verification import graph as claim_verifier_graph
+from Claim_Handle import ValidatedClaim
+from Claim_Handle.heuristics import is_low_priority_claim
+from utils import activate_budget, instrument_node
 
 logger = logging.getLogger(__name__)
 
 
+def _fan_out(verdict: Verdict, claim: ValidatedClaim) -> List[Verdict]:
+    """Copy a verdict to every near duplicate collapsed into the claim."""
+    verdicts = [verdict]
+    for duplicate in claim.near_duplicates:
+        verdicts.append(verdict.model_copy(update=duplicate.model_dump()))
+        logger.info(f"Verdict for '{duplicate.claim_text}': {verdict.result} (near duplicate)")
+    return verdicts
+
+
+@instrument_node("fact_checker.claim_verifier")
 async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
     """Process a single claim through the claim verifier.
 
     Args:
-        inputs: Dictionary with the claim to verify
+        inputs: Dictionary with the claim to verify, the request budget and
+            the request's metrics collector
 
     Returns:
         Dictionary with verdict key
@@ -26,17 +40,29 @@ async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
         logger.warning("No claim provided to verifier")
         return {}
 
+    budget = inputs.get("budget")
+    if budget is not None and (
+        budget.exhausted()
+        or (
+            budget.should_degrade("skip_low_priority_claims")
+            and is_low_priority_claim(claim.claim_text)
+        )
+    ):
+        logger.warning(f"Budget running low, skipping claim: '{claim.claim_text}'")
+        return {}
+
     logger.info(f"Verifying claim: '{claim.claim_text}'")
 
     verifier_payload = {"claim": claim}
 
     try:
-        verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
+        with activate_budget(budget):
+            verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
         verdict = verifier_result.get("verdict")
 
         if verdict:
             logger.info(f"Verdict for '{claim.claim_text}': {verdict.result}")
-            return {"verification_results": [verdict]}
+            return {"verification_results": _fan_out(verdict, claim)}
         else:
             logger.warning(f"No verdict returned for claim: '{claim.claim_text}'")
             return {}
@@ -9,6 +9,7 @@ from typing import List
 from langgraph.graph import END
 from langgraph.graph.state import Send
 
+from Claim_Handle.heuristics import is_low_priority_claim
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
@@ -21,15 +22,31 @@ def dispatch_claims_for_verification(state: State) -> List[Send] | str:
         state: Current workflow state
 
     Returns:
-        Either a list of Send objects or END
+        A list of Send objects, or END (the report node when the budget
+        was degraded) if there is nothing to verify
     """
     claims = state.extracted_claims
+    budget = state.budget
 
     if not claims:
+        if budget is not None and budget.degradations:
+            # Still report which degradations left us without claims
+            logger.warning("No claims to verify under a degraded budget, reporting")
+            return "generate_report_node"
         logger.warning("No claims to verify, ending process")
         return END
 
+    if budget is not None and budget.should_degrade("skip_low_priority_claims"):
+        prioritized = [c for c in claims if not is_low_priority_claim(c.claim_text)]
+        logger.warning(
+            f"Budget running low, skipping {len(claims) - len(prioritized)} low-priority claims"
+        )
+        claims = prioritized or claims[:1]
+
     logger.info(f"Dispatching {len(claims)} claims for parallel verification")
 
     # Create Send objects for each claim to be verified in parallel
-    return [Send("claim_verifier", {"claim": claim}) for claim in claims]
+    return [
+        Send("claim_verifier", {"claim": claim, "budget": budget, "metrics": state.metrics})
+        for claim in claims
+    ]
@@ -6,10 +6,12 @@ from typing import Any, Dict
 from Claim_Handle import graph as claim_extractor_graph
 
 from fact_checker.schemas import State
+from utils import Budget, activate_budget, instrument_node
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_node("fact_checker.extract_claims")
 async def extract_claims(state: State) -> Dict[str, Any]:
     """Extract claims from the answer text.
 
@@ -17,18 +19,23 @@ async def extract_claims(state: State) -> Dict[str, Any]:
         state: Current workflow state containing text to extract claims from
 
     Returns:
-        Dictionary with extracted_claims key
+        Dictionary with extracted_claims, budget and metrics keys
     """
     logger.info("Starting claim extraction process")
 
     extractor_payload = {"answer_text": state.answer}
+    budget = state.budget or Budget.from_settings()
+    # Returned so the state keeps the request's collector; instrument_node
+    # reopens its scope in every later node
+    metrics = state.metrics
 
     try:
-        extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
+        with activate_budget(budget):
+            extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
         validated_claims = extractor_result.get("validated_claims", [])
         logger.info(f"Extracted {len(validated_claims)} validated claims")
-        return {"extracted_claims": validated_claims}
+        return {"extracted_claims": validated_claims, "budget": budget, "metrics": metrics}
     except Exception as e:
         logger.error(f"Claim extraction failed: {e}")
         # Return empty list so the pipeline can continue
-        return {"extracted_claims": []}
+        return {"extracted_claims": [], "budget": budget, "metrics": metrics}
@@ -9,10 +9,12 @@ from typing import Dict
 
 from Claim_Verification.schemas import VerificationResult
 from fact_checker.schemas import FactCheckReport, State
+from utils import get_metrics, instrument_node
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_node("fact_checker.generate_report")
 async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
     """Generate the final fact-checking report.
 
@@ -49,6 +51,9 @@ async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
         verified_claims=state.verification_results,
         summary=summary,
         timestamp=datetime.now(),
+        # Taken while this node runs, so its own entry lands in the collector only
+        metrics=(state.metrics or get_metrics()).snapshot(),
+        degradations=state.budget.degradations if state.budget else [],
     )
 
     logger.info(f"Report generated: {summary}")
@@ -2,10 +2,11 @@ from datetime import datetime
 from typing import Annotated, List, Optional
 
 from operator import add
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from Claim_Handle import ValidatedClaim
 from Claim_Verification import Verdict
+from utils import Budget, MetricsCollector, RunMetrics
 
 class FactCheckReport(BaseModel):
     """The final output of the fact-checking process."""
@@ -19,10 +20,19 @@ class FactCheckReport(BaseModel):
     timestamp: datetime = Field(
         default_factory=datetime.now, description="When the fact-check was performed"
     )
+    metrics: Optional[RunMetrics] = Field(
+        default=None, description="Per-node latency, LLM call and token counts"
+    )
+    degradations: List[str] = Field(
+        default_factory=list,
+        description="Budget degradations applied while checking, in the order they kicked in",
+    )
 
 class State(BaseModel):
     """The state for the main fact checker workflow."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     answer: str = Field(description="The text to extract claims from")
     extracted_claims: List[ValidatedClaim] = Field(
         default_factory=list, description="Claims extracted from the text"
@@ -32,4 +42,11 @@ class State(BaseModel):
     )
     final_report: Optional[FactCheckReport] = Field(
         default=None, description="The final fact-checking report"
+    )
+    budget: Optional[Budget] = Field(
+        default=None, description="Cost and latency budget for this request"
+    )
+    metrics: Optional[MetricsCollector] = Field(
+        default_factory=MetricsCollector,
+        description="Collects this request's metrics for the report",
     )
\ No newline at end of file
@@ -0,0 +1,32 @@
+import pytest
+
+from Claim_Handle.heuristics import unresolved_references
+
+
+@pytest.mark.parametrize(
+    "sentence",
+    [
+        "We raised repo rates by 50 basis points in 2023.",
+        "Our scheme covers 10 crore families.",
+        "You will be fined ₹5000 for not wearing a helmet.",
+        "I was arrested in 2019.",
+        "The bank cut rates by 25 basis points.",
+        "The deadline is 31 March 2024.",
+        "He was arrested in 2019.",
+        "The company announced layoffs next week.",
+    ],
+)
+def test_context_dependent_sentences_are_not_skipped(sentence):
+    assert unresolved_references(sentence)
+
+
+@pytest.mark.parametrize(
+    "sentence",
+    [
+        "The Reserve Bank of India cut rates in May 2023.",
+        "India won the 2011 Cricket World Cup.",
+        "The US imposed tariffs on Chinese steel in 2018.",
+    ],
+)
+def test_self_contained_sentences_have_nothing_to_resolve(sentence):
+    assert unresolved_references(sentence) == []
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+import Claim_Handle.incremental as incremental
+from Claim_Handle.incremental import ExtractionStore, sentence_key
+from Claim_Handle.nodes.incremental import incremental_lookup_node, incremental_store_node
+from Claim_Handle.schemas import (
+    ContextualSentence,
+    DisambiguatedContent,
+    PotentialClaim,
+    SelectedContent,
+    State,
+    ValidatedClaim,
+    in_document_order,
+)
+from utils import process_with_voting
+
+SENTENCES = [
+    "The RBI raised the repo rate by 50 basis points in 2023.",
+    "Pune recorded 12 millimetres of rain on Monday.",
+    "The IMD issued a yellow alert for Mumbai.",
+]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ExtractionStore(str(tmp_path / "extractions.sqlite3"))
+    monkeypatch.setattr(incremental, "_store", store)
+    return store
+
+
+def _contextual(index: int) -> ContextualSentence:
+    return ContextualSentence(
+        original_sentence=SENTENCES[index],
+        original_index=index,
+        window_start=index,
+        window_end=index + 1,
+    )
+
+
+def _outputs(index: int):
+    """Every stage's output for a sentence whose one claim is itself."""
+    selected = SelectedContent(
+        processed_sentence=SENTENCES[index], original_context_item=_contextual(index)
+    )
+    disambiguated = DisambiguatedContent(
+        disambiguated_sentence=SENTENCES[index], original_selected_item=selected
+    )
+    claim = PotentialClaim(
+        claim_text=SENTENCES[index],
+        disambiguated_sentence=SENTENCES[index],
+        original_sentence=SENTENCES[index],
+        original_index=index,
+    )
+    validated = ValidatedClaim(is_complete_declarative=True, **claim.model_dump())
+    return selected, disambiguated, claim, validated
+
+
+def _processed_state(indices, failed_sentences) -> State:
+    outputs = [_outputs(index) for index in indices]
+    return State(
+        answer_text=" ".join(SENTENCES),
+        contextual_sentences=[_contextual(index) for index in range(len(SENTENCES))],
+        pending_sentences=[_contextual(index) for index in indices],
+        selected_contents=[selected for selected, _, _, _ in outputs],
+        disambiguated_contents=[disambiguated for _, disambiguated, _, _ in outputs],
+        potential_claims=[claim for _, _, claim, _ in outputs],
+        validated_claims=[validated for _, _, _, validated in outputs],
+        failed_sentences=failed_sentences,
+    )
+
+
+def test_sentences_with_failed_calls_are_not_stored(store):
+    # Selection of sentence 1 failed, so it has no outputs this run
+    state = _processed_state([0, 2], failed_sentences=[1])
+    state.pending_sentences = [_contextual(index) for index in range(len(SENTENCES))]
+
+    asyncio.run(incremental_store_node(state))
+
+    keys = [sentence_key(_contextual(index)) for index in range(len(SENTENCES))]
+    assert sorted(store.get_many(keys)) == sorted([keys[0], keys[2]])
+
+    # The next run retries it instead of reusing the gap
+    rerun = State(answer_text=state.answer_text, contextual_sentences=state.contextual_sentences)
+    lookup = asyncio.run(incremental_lookup_node(rerun))
+    assert [item.original_index for item in lookup["pending_sentences"]] == [1]
+
+
+def test_reused_results_merge_in_document_order(store):
+    asyncio.run(incremental_store_node(_processed_state([0, 2], failed_sentences=[])))
+
+    # Sentence 1 was edited: it is processed again, 0 and 2 are reused
+    state = State(
+        answer_text=" ".join(SENTENCES),
+        contextual_sentences=[_contextual(index) for index in range(len(SENTENCES))],
+    )
+    state = state.model_copy(update=asyncio.run(incremental_lookup_node(state)))
+    assert [item.original_index for item in state.pending_sentences] == [1]
+
+    fresh = _processed_state([1], failed_sentences=[])
+    state = state.model_copy(
+        update={
+            "selected_contents": fresh.selected_contents,
+            "validated_claims": fresh.validated_claims,
+        }
+    )
+    reused = asyncio.run(incremental_store_node(state))
+
+    merged = in_document_order(state.validated_claims, reused["validated_claims"])
+    assert [claim.original_index for claim in merged] == [0, 1, 2]
+    merged = in_document_order(state.selected_contents, reused["selected_contents"])
+    assert [item.processed_sentence for item in merged] == SENTENCES
+
+
+def test_voting_reports_items_lost_to_failed_calls():
+    async def processor(item, llm):
+        if item == "broken":
+            raise RuntimeError("connection reset")
+        return item == "kept", item
+
+    errors = []
+    results = asyncio.run(
+        process_with_voting(
+            items=["kept", "rejected", "broken"],
+            processor=processor,
+            llm=None,
+            completions=3,
+            min_successes=2,
+            result_factory=lambda result, item: result,
+            on_error=errors.append,
+        )
+    )
+
+    # Rejected by the votes is not an error; only the failed item is reported
+    assert results == ["kept"]
+    assert errors == ["broken"]
@@ -0,0 +1,31 @@
+import pytest
+
+from Claim_Handle.Config.nodes import VALIDATION_CONFIG
+from Claim_Handle.near_duplicates import cluster_near_duplicates
+
+THRESHOLD = VALIDATION_CONFIG["near_duplicate_threshold"]
+
+
+def test_paraphrases_from_the_sample_run_cluster():
+    # The two decomposition outputs of the sample run in main_test.py
+    claims = [
+        "Citizens are advised to immediately exchange all ₹500 banknotes without the new "
+        "silver security thread at their nearest bank branch",
+        "Citizens are advised to exchange all ₹500 banknotes without the new silver security "
+        "thread at their nearest bank branch to avoid losses",
+    ]
+    assert cluster_near_duplicates(claims, THRESHOLD) == [[0, 1]]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        "The RBI cut the repo rate by 50 basis points in 2023.",
+        "The RBI raised the repo rate by 25 basis points in 2023.",
+        "The Fed raised the repo rate by 50 basis points in 2023.",
+        "The RBI did not raise the repo rate by 50 basis points in 2023.",
+    ],
+)
+def test_claims_differing_in_a_checkable_detail_stay_apart(other):
+    claims = ["The RBI raised the repo rate by 50 basis points in 2023.", other]
+    assert cluster_near_duplicates(claims, THRESHOLD) == [[0], [1]]
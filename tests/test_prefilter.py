@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from Claim_Handle.nodes.prefilter import prefilter_node
+from Claim_Handle.schemas import ContextualSentence, State
+
+
+def _kept(sentence: str) -> bool:
+    item = ContextualSentence(
+        original_sentence=sentence, original_index=0, window_start=0, window_end=1
+    )
+    result = asyncio.run(prefilter_node(State(answer_text=sentence, contextual_sentences=[item])))
+    return bool(result["pending_sentences"])
+
+
+@pytest.mark.parametrize(
+    "sentence",
+    [
+        "Hi all, garlic cures cancer.",
+        "Good morning friends, the RBI raised the repo rate by 50 basis points.",
+        "Forward this to everyone, drinking cow urine cures covid.",
+        "Please share: the government will give ₹5000 to every farmer.",
+        "Remember that the RBI banned ₹2000 notes in 2023.",
+        "Beware: WhatsApp will start charging users from next month.",
+        "Breaking News: The Reserve Bank of India has withdrawn all ₹500 notes.",
+        "Vaccines cause autism.",
+    ],
+)
+def test_claims_after_openers_are_kept(sentence):
+    assert _kept(sentence)
+
+
+@pytest.mark.parametrize(
+    "sentence",
+    [
+        "Good morning everyone!",
+        "Hi all.",
+        "Please share this with everyone.",
+        "Is this true?",
+        "Thank you.",
+    ],
+)
+def test_sentences_without_claims_are_dropped(sentence):
+    assert not _kept(sentence)
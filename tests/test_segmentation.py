@@ -0,0 +1,23 @@
+import json
+import os
+
+import pytest
+
+from Claim_Handle.segmentation import RuleBasedSegmenter
+
+CORPUS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "data",
+    "segmentation_corpus.json",
+)
+
+with open(CORPUS_PATH, encoding="utf-8") as f:
+    CORPUS = json.load(f)
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+def test_rules_segmenter_matches_corpus(case):
+    text = case["text"]
+    spans = RuleBasedSegmenter().spans(text)
+    assert [text[start:end] for start, end in spans] == case["sentences"]
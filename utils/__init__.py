@@ -1,25 +1,100 @@
 from utils.llm import (
+    call_llm_batched,
+    call_llm_with_candidates,
     call_llm_with_structured_output,
     process_with_voting,
+    track_llm_failures,
     truncate_evidence_for_token_limit,
     estimate_token_count,
 )
-from utils.models import get_default_llm, get_llm
+from utils.budget import (
+    DEGRADATION_STEPS,
+    Budget,
+    activate_budget,
+    current_budget,
+    degrade,
+)
+from utils.cache import LLMResponseCache, get_llm_cache
+from utils.cassette import Cassette, CassetteLLM, CassetteMissError, get_cassette
+from utils.hedging import LatencyTracker, get_latency_tracker, run_llm_request
+from utils.local_llm import LocalLLM, set_local_responder
+from utils.metrics import (
+    MetricsCollector,
+    NodeMetrics,
+    RunMetrics,
+    get_metrics,
+    instrument_node,
+    metrics_scope,
+    record_search,
+    record_skips,
+)
+from utils.models import clear_llm_pool, get_default_llm, get_llm, get_structured_llm
+from utils.rate_limit import AdaptiveRateLimiter, get_rate_limiter
 from utils.settings import settings
-from utils.text import remove_following_sentences
+from utils.singleflight import SingleFlight, get_singleflight, singleflight_stats
+from utils.tokens import (
+    TokenCounter,
+    count_tokens,
+    get_token_counter,
+    set_token_counter,
+)
 
 __all__ = [
     # LLM utilities
     "call_llm_with_structured_output",
+    "call_llm_with_candidates",
+    "call_llm_batched",
     "process_with_voting",
+    "track_llm_failures",
+    # Per-request budgets
+    "Budget",
+    "DEGRADATION_STEPS",
+    "activate_budget",
+    "current_budget",
+    "degrade",
+    # LLM response cache
+    "LLMResponseCache",
+    "get_llm_cache",
+    # Record/replay cassettes
+    "Cassette",
+    "CassetteLLM",
+    "CassetteMissError",
+    "get_cassette",
+    # Hedged requests
+    "LatencyTracker",
+    "get_latency_tracker",
+    "run_llm_request",
+    # Local stand-in backend
+    "LocalLLM",
+    "set_local_responder",
     # LLM models
     "get_llm",
     "get_default_llm",
+    "get_structured_llm",
+    "clear_llm_pool",
+    # Per-node metrics
+    "MetricsCollector",
+    "NodeMetrics",
+    "RunMetrics",
+    "get_metrics",
+    "instrument_node",
+    "metrics_scope",
+    "record_search",
+    "record_skips",
+    # Rate limiting
+    "AdaptiveRateLimiter",
+    "get_rate_limiter",
+    # Request coalescing
+    "SingleFlight",
+    "get_singleflight",
+    "singleflight_stats",
     # Settings
     "settings",
-    # Text utilities
-    "remove_following_sentences",
     # Token utilities
     "truncate_evidence_for_token_limit",
     "estimate_token_count",
+    "count_tokens",
+    "TokenCounter",
+    "get_token_counter",
+    "set_token_counter",
 ]
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Per-request cost and latency budgets.
+
+A Budget caps the LLM calls, tokens and wall time one fact-check may use.
+While it is active, every LLM call is charged to it. As the remaining share
+drops below each threshold, the pipeline steps down in DEGRADATION_STEPS
+order. Once the budget is exhausted, further LLM calls are refused.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Degradations in the order they kick in
+DEGRADATION_STEPS = (
+    "voting_completions",
+    "max_iterations",
+    "results_per_query",
+    "skip_low_priority_claims",
+)
+
+_current_budget: contextvars.ContextVar[Optional["Budget"]] = contextvars.ContextVar(
+    "athena_budget", default=None
+)
+
+
+class Budget(BaseModel):
+    """Hard limits for one request plus the degradations applied so far."""
+
+    max_llm_calls: Optional[int] = Field(default=None, description="LLM request limit")
+    max_tokens: Optional[int] = Field(default=None, description="Input + output token limit")
+    deadline_seconds: Optional[float] = Field(
+        default=None, description="Wall-time limit from when the budget was created"
+    )
+    thresholds: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "voting_completions": 0.75,
+            "max_iterations": 0.5,
+            "results_per_query": 0.35,
+            "skip_low_priority_claims": 0.2,
+        },
+        description="Remaining budget share below which each degradation applies",
+    )
+
+    _started_at: float = PrivateAttr(default_factory=time.monotonic)
+    _llm_calls: int = PrivateAttr(default=0)
+    _tokens: int = PrivateAttr(default=0)
+    _degradations: List[str] = PrivateAttr(default_factory=list)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def from_settings(cls) -> Optional["Budget"]:
+        """Budget from the BUDGET_* settings, or None when none are set."""
+        limits = {
+            "max_llm_calls": settings.budget_max_llm_calls,
+            "max_tokens": settings.budget_max_tokens,
+            "deadline_seconds": settings.budget_deadline_seconds,
+        }
+        if all(limit is None for limit in limits.values()):
+            return None
+        return cls(**limits)
+
+    def charge(self, llm_calls: int = 1, tokens: int = 0) -> None:
+        with self._lock:
+            self._llm_calls += llm_calls
+            self._tokens += tokens
+
+    def remaining_fraction(self) -> float:
+        """Smallest remaining share across the call, token and time limits."""
+        with self._lock:
+            used = [
+                (self._llm_calls, self.max_llm_calls),
+                (self._tokens, self.max_tokens),
+                (time.monotonic() - self._started_at, self.deadline_seconds),
+            ]
+        shares = [1 - spent / limit for spent, limit in used if limit]
+        return max(0.0, min(shares, default=1.0))
+
+    def exhausted(self) -> bool:
+        return self.remaining_fraction() <= 0
+
+    def should_degrade(self, step: str) -> bool:
+        """Check whether a degradation step applies now, recording it the first time."""
+        remaining = self.remaining_fraction()
+        if remaining >= self.thresholds.get(step, 0.0):
+            return False
+
+        with self._lock:
+            first_time = step not in self._degradations
+            if first_time:
+                self._degradations.append(step)
+        if first_time:
+            logger.warning(f"Budget at {remaining:.0%}, degrading: {step}")
+        return True
+
+    @property
+    def degradations(self) -> List[str]:
+        with self._lock:
+            return list(self._degradations)
+
+    def usage(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "llm_calls": self._llm_calls,
+                "tokens": self._tokens,
+                "elapsed_seconds": time.monotonic() - self._started_at,
+            }
+
+
+@contextmanager
+def activate_budget(budget: Optional[Budget]) -> Iterator[Optional[Budget]]:
+    """Charge LLM calls made inside the block to budget (no-op for None)."""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def current_budget() -> Optional[Budget]:
+    return _current_budget.get()
+
+
+def charge_budget(tokens: int = 0) -> None:
+    """Charge one LLM call and its tokens to the active budget, if any."""
+    budget = _current_budget.get()
+    if budget is not None:
+        budget.charge(tokens=tokens)
+
+
+def budget_exhausted() -> bool:
+    """Check whether the active budget has nothing left."""
+    budget = _current_budget.get()
+    return budget is not None and budget.exhausted()
+
+
+def degrade(step: str) -> bool:
+    """Check whether the active budget calls for a degradation step."""
+    budget = _current_budget.get()
+    return budget is not None and budget.should_degrade(step)
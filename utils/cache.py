@@ -0,0 +1,242 @@
+"""Response caching for structured LLM calls.
+
+Two tiers: an in-memory LRU in front of an on-disk SQLite store.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Matches the per-second timestamps that prompts embed via get_current_timestamp(),
+# e.g. "2025-09-08 21:34:10 UTC" or "2025-09-08 21:34:10 IST".
+_TIMESTAMP_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?: ?(?:UTC|IST|Z|[+-]\d{2}:?\d{2}))?"
+)
+
+
+def normalize_messages(messages: Any) -> List[Tuple[str, str]]:
+    """Render messages into (role, content) pairs.
+
+    Accepts either a list of (role, content) tuples or a prompt value
+    produced by ChatPromptTemplate.invoke().
+
+    Args:
+        messages: Messages as passed to the LLM
+
+    Returns:
+        List of (role, content) tuples
+    """
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+
+    rendered: List[Tuple[str, str]] = []
+    for message in messages:
+        if isinstance(message, (tuple, list)):
+            role, content = message
+        else:
+            role, content = message.type, message.content
+        rendered.append((str(role), content if isinstance(content, str) else json.dumps(content)))
+    return rendered
+
+
+def strip_volatile_fields(text: str) -> str:
+    """Replace volatile values like timestamps with a stable placeholder."""
+    return _TIMESTAMP_PATTERN.sub("<timestamp>", text)
+
+
+def make_cache_key(
+    model_name: str,
+    temperature: Optional[float],
+    messages: Any,
+    output_class: Type[BaseModel],
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build a stable cache key for a structured LLM call.
+
+    Args:
+        model_name: Model identifier
+        temperature: Sampling temperature
+        messages: Messages sent to the LLM
+        output_class: Pydantic model for structured output
+        extra: Additional request parameters that change the response
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        "model": model_name,
+        "temperature": temperature,
+        "messages": [
+            [role, strip_volatile_fields(content)]
+            for role, content in normalize_messages(messages)
+        ],
+        "schema": output_class.model_json_schema(),
+        "extra": extra or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier cache of serialized LLM responses.
+
+    Values are JSON strings. Memory entries are evicted in LRU order once
+    max_memory_entries is reached; disk entries are evicted oldest-first once
+    max_disk_entries is reached. Both tiers honour the TTL.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 100_000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+        self._db: Optional[sqlite3.Connection] = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(
+                os.path.join(directory, "llm_cache.sqlite3"), check_same_thread=False
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)"
+            )
+            self._db.commit()
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached value, checking memory first and then disk."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._expired(created_at):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expirations"] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if not self._expired(created_at):
+                        self._remember(key, created_at, value)
+                        self._stats["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._stats["expirations"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value in both tiers."""
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+            self._stats["writes"] += 1
+
+            if self._db is None:
+                return
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, created_at),
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            overflow = count - self.max_disk_entries
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY created_at LIMIT ?)",
+                    (overflow,),
+                )
+                self._stats["evictions"] += overflow
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            if self._db is not None:
+                (stats["disk_entries"],) = self._db.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()
+            return stats
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the shared LLM response cache, or None when caching is disabled."""
+    global _llm_cache
+
+    if not settings.llm_cache_enabled:
+        return None
+
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            directory=settings.llm_cache_dir,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_memory_entries=settings.llm_cache_max_memory_entries,
+            max_disk_entries=settings.llm_cache_max_disk_entries,
+        )
+        logger.info(f"LLM response cache enabled at '{settings.llm_cache_dir}'")
+
+    return _llm_cache
@@ -0,0 +1,270 @@
+"""Record/replay cassettes for LLM and search calls.
+
+In record mode every structured LLM response and search result is captured
+with its latency and written to a gzip-compressed JSON file. In replay mode
+the same calls are answered from that file without touching the network,
+which makes benchmarks and regression runs repeatable and free.
+"""
+
+import asyncio
+import atexit
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from utils.cache import make_cache_key
+from utils.settings import settings
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a call was never recorded."""
+
+
+class Cassette:
+    """Recorded responses keyed by kind ("llm", "search") and request key.
+
+    Every key holds the list of responses seen while recording. Replay hands
+    them out in order and wraps around, so repeated voting calls get the
+    same spread of answers they got when recorded.
+
+    Args:
+        path: Cassette file
+        mode: "record" or "replay"
+        latency: "recorded" to replay recorded latencies, or a fixed number
+            of seconds per call
+    """
+
+    def __init__(self, path: str, mode: str, latency: str = "recorded"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._entries: Dict[str, Dict[str, List[Dict[str, Any]]]] = defaultdict(dict)
+        self._cursors: Dict[tuple, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # Recording always starts from an empty cassette and overwrites the file
+        if mode == "replay":
+            self.load()
+
+    def load(self) -> None:
+        """Read the cassette file."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in '{self.path}'")
+
+        for kind, entries in data.get("entries", {}).items():
+            self._entries[kind] = entries
+        logger.info(
+            f"Loaded cassette '{self.path}' "
+            f"({sum(len(e) for e in self._entries.values())} recorded requests)"
+        )
+
+    def save(self) -> None:
+        """Write the recorded calls to the cassette file."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": CASSETTE_VERSION, "entries": self._entries}
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            tmp_path = f"{self.path}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+        logger.info(f"Saved cassette '{self.path}'")
+
+    def _replay_delay(self, entry: Dict[str, Any]) -> float:
+        if self.latency == "recorded":
+            return entry.get("latency", 0.0)
+        return float(self.latency)
+
+    async def fetch(
+        self,
+        kind: str,
+        key: str,
+        call_factory: Callable[[], Awaitable[T]],
+        dump: Callable[[T], Any],
+        load: Callable[[Any], T],
+    ) -> T:
+        """Answer a call from the cassette, or make and record it.
+
+        Args:
+            kind: Kind of call ("llm" or "search")
+            key: Request identity
+            call_factory: Makes the real call (record mode only)
+            dump: Converts a result to JSON-compatible data
+            load: Converts recorded data back to a result
+
+        Returns:
+            The recorded or freshly made result
+        """
+        if self.mode == "replay":
+            with self._lock:
+                entries = self._entries[kind].get(key)
+                if not entries:
+                    raise CassetteMissError(f"No recorded {kind} response for request {key[:16]}")
+                entry = entries[self._cursors[(kind, key)] % len(entries)]
+                self._cursors[(kind, key)] += 1
+
+            delay = self._replay_delay(entry)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return load(entry["value"])
+
+        start = time.monotonic()
+        result = await call_factory()
+        entry = {"value": dump(result), "latency": round(time.monotonic() - start, 4)}
+
+        with self._lock:
+            self._entries[kind].setdefault(key, []).append(entry)
+            self._dirty = True
+        return result
+
+
+def _dump_model(value: Optional[BaseModel]) -> Any:
+    return value.model_dump(mode="json") if value is not None else None
+
+
+def _dump_structured(result: Any) -> Any:
+    # Results bound with include_raw=True carry the parsed model under "parsed"
+    if isinstance(result, dict) and "parsed" in result:
+        result = result["parsed"]
+    return _dump_model(result)
+
+
+class _CassetteStructuredRunnable:
+    def __init__(self, llm: "CassetteLLM", output_class: Type[BaseModel]):
+        self.llm = llm
+        self.output_class = output_class
+        # While recording, the raw message's usage metadata still reaches the
+        # token metrics; replayed calls return the parsed model and cost nothing
+        self._inner = (
+            llm.inner.with_structured_output(output_class, include_raw=True)
+            if llm.inner is not None
+            else None
+        )
+
+    async def ainvoke(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        key = make_cache_key(
+            self.llm.model_name, self.llm.temperature, messages, self.output_class
+        )
+        return await self.llm.cassette.fetch(
+            "llm",
+            key,
+            lambda: self._inner.ainvoke(messages, *args, **kwargs),
+            _dump_structured,
+            lambda data: self.output_class.model_validate(data) if data is not None else None,
+        )
+
+    def invoke(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        return asyncio.run(self.ainvoke(messages, *args, **kwargs))
+
+
+class CassetteLLM:
+    """Chat backend that records or replays structured calls through a cassette.
+
+    Args:
+        cassette: Cassette to record to or replay from
+        model_name: Model name, part of the request key
+        temperature: Temperature, part of the request key
+        inner: Real LLM to call while recording (None when replaying)
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        model_name: str,
+        temperature: float,
+        inner: Optional[Any] = None,
+    ):
+        if inner is None and cassette.mode == "record":
+            raise ValueError("Recording a cassette needs a real LLM to call")
+
+        self.cassette = cassette
+        self.model_name = model_name
+        self.temperature = temperature
+        self.inner = inner
+
+    def with_structured_output(
+        self, output_class: Type[M], **kwargs: Any
+    ) -> _CassetteStructuredRunnable:
+        return _CassetteStructuredRunnable(self, output_class)
+
+    async def astructured_candidates(
+        self, output_class: Type[M], messages: Any, n: int
+    ) -> List[Optional[M]]:
+        """Answer one request with n candidates."""
+        # Imported here because utils.llm builds on utils.models, which builds on this module
+        from utils.llm import _generate_candidates, supports_candidates
+
+        async def _record() -> List[Optional[M]]:
+            if supports_candidates(self.inner):
+                candidates, _ = await _generate_candidates(self.inner, output_class, messages, n)
+                return candidates
+            runnable = self.inner.with_structured_output(output_class)
+            return list(await asyncio.gather(*(runnable.ainvoke(messages) for _ in range(n))))
+
+        key = make_cache_key(
+            self.model_name, self.temperature, messages, output_class, extra={"candidates": n}
+        )
+        return await self.cassette.fetch(
+            "llm",
+            key,
+            _record,
+            lambda candidates: [_dump_model(c) for c in candidates],
+            lambda data: [
+                output_class.model_validate(item) if item is not None else None for item in data
+            ],
+        )
+
+
+def search_key(provider: str, query: str, k: int) -> str:
+    """Request key for a search call."""
+    return json.dumps([provider, query, k], ensure_ascii=False)
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Get the shared cassette, or None when CASSETTE_MODE is off."""
+    global _cassette
+
+    if settings.cassette_mode == "off":
+        return None
+
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = Cassette(
+                settings.cassette_path, settings.cassette_mode, settings.cassette_latency
+            )
+            if _cassette.mode == "record":
+                atexit.register(_cassette.save)
+            logger.info(f"Cassette {settings.cassette_mode} mode using '{settings.cassette_path}'")
+
+    return _cassette
@@ -0,0 +1,159 @@
+"""Hedged LLM requests.
+
+When a call is still running after the model's recent p95 latency, one
+backup request is sent and whichever answers first wins. Both requests go
+through the shared rate limiter, and the backup is charged to the request
+budget and the llm_calls metric as one more call.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from utils.budget import budget_exhausted, charge_budget
+from utils.metrics import record_hedge, record_llm_call
+from utils.rate_limit import get_rate_limiter
+from utils.settings import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per model.
+
+    Args:
+        window: Latencies kept per model
+        min_samples: Samples needed before quantiles are reported
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, model_name: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies[model_name].append(seconds)
+
+    def quantile(self, model_name: str, q: float) -> Optional[float]:
+        """Latency quantile for a model, or None until min_samples are seen."""
+        with self._lock:
+            samples = sorted(self._latencies.get(model_name, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the process-wide LLM latency tracker."""
+    global _latency_tracker
+
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker(
+            window=settings.llm_hedge_window, min_samples=settings.llm_hedge_min_samples
+        )
+    return _latency_tracker
+
+
+async def run_llm_request(model_name: str, call: Callable[[], Awaitable[T]]) -> T:
+    """Run an LLM call through the rate limiter, hedging it when enabled.
+
+    Every successful attempt's latency feeds the per-model tracker. With
+    LLM_HEDGING_ENABLED, a call that outlives the LLM_HEDGE_QUANTILE latency
+    gets one backup request; the first success wins and the other is cancelled.
+    The hedge timer covers the primary's current attempt only, so time spent
+    queued or backing off between rate-limit retries doesn't trigger it. The
+    caller accounts for the winning response; the backup itself is charged
+    here as one more LLM call, since its usage is unknown once it loses.
+
+    Args:
+        model_name: Model the call is billed against
+        call: Factory producing the awaitable for one attempt
+
+    Returns:
+        The first successful result
+
+    Raises:
+        The error of the last request to fail when neither succeeds
+    """
+    limiter = get_rate_limiter()
+    tracker = get_latency_tracker()
+
+    def timed(running: Optional[asyncio.Event] = None) -> Callable[[], Awaitable[T]]:
+        async def attempt() -> T:
+            nonlocal attempt_started
+            start = time.perf_counter()
+            if running is not None:
+                attempt_started = start
+                running.set()
+            try:
+                result = await call()
+            except BaseException:
+                if running is not None:
+                    running.clear()
+                raise
+            tracker.record(model_name, time.perf_counter() - start)
+            return result
+
+        return attempt
+
+    attempt_started = 0.0
+
+    hedge_after = (
+        tracker.quantile(model_name, settings.llm_hedge_quantile)
+        if settings.llm_hedging_enabled
+        else None
+    )
+    if hedge_after is None:
+        return await limiter.run(model_name, timed())
+
+    # Set while an attempt of the primary request is running, and cleared
+    # when one fails and the limiter backs off before retrying it
+    running = asyncio.Event()
+    primary = asyncio.ensure_future(limiter.run(model_name, timed(running)))
+    tasks = [primary]
+
+    try:
+        while not primary.done():
+            if not running.is_set():
+                running_waiter = asyncio.ensure_future(running.wait())
+                tasks.append(running_waiter)
+                await asyncio.wait({primary, running_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            remaining = attempt_started + hedge_after - time.perf_counter()
+            if remaining <= 0:
+                break
+            await asyncio.wait({primary}, timeout=remaining)
+        if primary.done() or budget_exhausted():
+            return await primary
+
+        logger.debug(f"Hedging {model_name} call after {hedge_after:.2f}s")
+        backup = asyncio.ensure_future(limiter.run(model_name, timed()))
+        tasks.append(backup)
+        record_llm_call()
+        charge_budget()
+
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    record_hedge(won=task is backup)
+                    return task.result()
+                error = task.exception()
+
+        record_hedge(won=False)
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
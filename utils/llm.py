@@ -4,21 +4,122 @@ Helper functions for working with language models.
 """
 
 import asyncio
+import contextvars
+import json
 import logging
-from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type, TypeVar
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError, create_model
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import convert_to_messages
+from langchain_core.output_parsers.openai_tools import PydanticToolsParser
 from langchain_google_vertexai import ChatVertexAI
 
+from utils.budget import budget_exhausted, charge_budget, degrade
+from utils.cache import get_llm_cache, make_cache_key, normalize_messages
+from utils.models import get_structured_llm
+from utils.hedging import run_llm_request
+from utils.metrics import record_llm_call, usage_tokens
+from utils.settings import settings
+from utils.singleflight import get_singleflight
+from utils.tokens import count_tokens
+
 T = TypeVar("T")
 R = TypeVar("R")
 M = TypeVar("M", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+_failed_calls: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "athena_failed_llm_calls", default=None
+)
+
+
+@contextmanager
+def track_llm_failures() -> Iterator[List[str]]:
+    """Collect the LLM calls made inside the block that got no usable answer.
+
+    A call fails when it raises, can't be parsed or is skipped because the
+    request budget is exhausted. Tasks started inside the block report to
+    the same list.
+
+    Example:
+        with track_llm_failures() as failures:
+            response = await call_llm_with_structured_output(...)
+        if failures: ...
+
+    Yields:
+        The context_desc of each failed call, in the order they failed
+    """
+    failures: List[str] = []
+    token = _failed_calls.set(failures)
+    try:
+        yield failures
+    finally:
+        _failed_calls.reset(token)
+
+
+def _record_llm_failure(context_desc: str) -> None:
+    failures = _failed_calls.get()
+    if failures is not None:
+        failures.append(context_desc)
+
+
+def _model_name(llm: Any) -> str:
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+
+
+def _account_llm_call(input_tokens: int = 0, output_tokens: int = 0) -> None:
+    record_llm_call(input_tokens, output_tokens)
+    charge_budget(input_tokens + output_tokens)
+
+
 def estimate_token_count(text: str) -> int:
-    return len(text) // 4
+    return count_tokens(text)
+
+
+def _select_by_policy(
+    costs: List[int],
+    available_tokens: int,
+    policy: str,
+    scores: Optional[List[float]],
+) -> List[int]:
+    """Pick item indices whose summed cost fits, in the order the policy prefers."""
+    count = len(costs)
+
+    match policy:
+        case "newest":
+            order, stop_at_first_miss = list(range(count - 1, -1, -1)), True
+        case "highest_score":
+            if scores is None:
+                raise ValueError("The 'highest_score' policy needs a score_func")
+            order = sorted(range(count), key=lambda i: scores[i], reverse=True)
+            stop_at_first_miss = False
+        case "head_tail":
+            order = []
+            head, tail = 0, count - 1
+            while head <= tail:
+                order.append(head)
+                if tail != head:
+                    order.append(tail)
+                head, tail = head + 1, tail - 1
+            stop_at_first_miss = False
+        case _:
+            raise ValueError(f"Unknown evidence prioritization policy '{policy}'")
+
+    selected = []
+    used = 0
+    for i in order:
+        if used + costs[i] <= available_tokens:
+            selected.append(i)
+            used += costs[i]
+        elif stop_at_first_miss:
+            break
+
+    return selected
+
 
 def truncate_evidence_for_token_limit(
     evidence_items: List[Any],
@@ -27,15 +128,41 @@ def truncate_evidence_for_token_limit(
     human_prompt_template: str,
     max_tokens: int = 120000,
     format_evidence_func: Callable[[List[Any]], str] = None,
+    format_item_func: Optional[Callable[[Any], str]] = None,
+    policy: str = "newest",
+    score_func: Optional[Callable[[Any], float]] = None,
 ) -> List[Any]:
+    """Keep as much evidence as fits in the prompt's token budget.
+
+    Each item is formatted and counted once, so packing is linear in the
+    number of items. The result keeps the original order.
+
+    Args:
+        evidence_items: Evidence to pack
+        claim_text: Claim the prompt is about
+        system_prompt: Rendered system prompt
+        human_prompt_template: Human prompt with claim_text / evidence_snippets slots
+        max_tokens: Model context budget
+        format_evidence_func: Formats a list of items (used per item if
+            format_item_func is not given)
+        format_item_func: Formats a single item
+        policy: Which items win when not all fit: "newest" (fill from the
+            end), "highest_score" (by score_func) or "head_tail" (alternate
+            first and last items)
+        score_func: Relevance score per item for the "highest_score" policy
+
+    Returns:
+        The evidence items that fit
+    """
     if not evidence_items:
         return evidence_items
 
-    format_func = format_evidence_func or (
-        lambda items: "\n\n".join(
-            f"Evidence {i + 1}: {str(item)}" for i, item in enumerate(items)
-        )
-    )
+    if format_item_func is not None:
+        render = lambda position, item: format_item_func(item)
+    elif format_evidence_func is not None:
+        render = lambda position, item: format_evidence_func([item])
+    else:
+        render = lambda position, item: f"Evidence {position + 1}: {str(item)}"
 
     base_tokens = estimate_token_count(
         system_prompt
@@ -46,21 +173,33 @@ def truncate_evidence_for_token_limit(
     if available_tokens <= 0:
         return evidence_items[:1]
 
-    selected = []
-    for evidence in reversed(evidence_items):
-        test_tokens = estimate_token_count(format_func(selected + [evidence]))
-        if test_tokens <= available_tokens:
-            selected.append(evidence)
-        else:
-            break
+    # One extra token per item covers the separator between items
+    costs = [
+        estimate_token_count(render(position, item)) + 1
+        for position, item in enumerate(evidence_items)
+    ]
+    scores = [score_func(item) for item in evidence_items] if score_func else None
 
-    result = [e for e in evidence_items if e in selected]
+    selected = sorted(_select_by_policy(costs, available_tokens, policy, scores))
+    result = [evidence_items[i] for i in selected]
 
     if len(result) < len(evidence_items):
         logger.info(f"Truncated evidence: {len(evidence_items)} → {len(result)} items")
 
     return result
 
+
+def _unpack_structured_result(result: Any) -> Tuple[Any, Tuple[int, int], Optional[Exception]]:
+    """Split a structured-output result into (parsed, token usage, parsing error).
+
+    Chat models bound with include_raw=True return the raw message alongside
+    the parsed object; in-process backends return the parsed object directly.
+    """
+    if isinstance(result, dict) and "parsed" in result:
+        return result["parsed"], usage_tokens(result.get("raw")), result.get("parsing_error")
+    return result, (0, 0), None
+
+
 async def call_llm_with_structured_output(
     llm: ChatVertexAI,
     output_class: Type[M],
@@ -69,6 +208,15 @@ async def call_llm_with_structured_output(
 ) -> Optional[M]:
     """Call LLM with structured output and consistent error handling.
 
+    When LLM_CACHE_ENABLED is set, deterministic (temperature 0) responses
+    are looked up in and written to the shared response cache before the
+    model is called. Sampled calls are never cached, since voting repeats
+    the same request and needs a fresh answer each time. Calls go through
+    the shared rate limiter, which retries quota errors with backoff, and
+    are hedged when LLM_HEDGING_ENABLED is set. Identical deterministic
+    (temperature 0) calls that are in flight at the same time are coalesced
+    into one request.
+
     Args:
         llm: LLM instance
         output_class: Pydantic model for structured output
@@ -78,12 +226,454 @@ async def call_llm_with_structured_output(
     Returns:
         Structured output or None if error
     """
+    temperature = getattr(llm, "temperature", None)
+    cache = get_llm_cache() if not temperature else None
+    coalesce = settings.llm_singleflight_enabled and not temperature
+    cache_key = None
+
+    if cache is not None or coalesce:
+        cache_key = make_cache_key(_model_name(llm), temperature, messages, output_class)
+
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                return output_class.model_validate_json(cached)
+            except ValidationError:
+                logger.warning(f"Discarding stale cache entry for {context_desc}")
+
+    structured_llm = get_structured_llm(llm, output_class)
+
+    async def _call() -> Optional[M]:
+        if budget_exhausted():
+            logger.warning(f"Budget exhausted, skipping LLM call for {context_desc}")
+            return None
+
+        try:
+            result = await run_llm_request(
+                _model_name(llm), lambda: structured_llm.ainvoke(messages)
+            )
+        except Exception as e:
+            _account_llm_call()
+            logger.error(f"Error in LLM call for {context_desc}: {e}")
+            return None
+
+        response, (input_tokens, output_tokens), error = _unpack_structured_result(result)
+        _account_llm_call(input_tokens, output_tokens)
+        if error is not None:
+            logger.error(f"Error in LLM call for {context_desc}: {error}")
+            return None
+
+        if cache is not None and response is not None:
+            cache.set(cache_key, response.model_dump_json())
+
+        return response
+
+    # Recorded here rather than in _call, so coalesced callers see it too
+    response = await get_singleflight("llm").do(cache_key, _call) if coalesce else await _call()
+    if response is None:
+        _record_llm_failure(context_desc)
+    return response
+
+
+_batch_output_classes: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def _batch_output_class(output_class: Type[M]) -> Type[BaseModel]:
+    """Build (once) a list-typed schema wrapping output_class with an item index."""
+    batch_class = _batch_output_classes.get(output_class)
+    if batch_class is None:
+        indexed_class = create_model(
+            f"Indexed{output_class.__name__}",
+            __base__=output_class,
+            index=(int, Field(description="Number of the item this result belongs to")),
+        )
+        batch_class = create_model(
+            f"Batched{output_class.__name__}",
+            __doc__=f"{output_class.__name__} results for a batch of numbered items.",
+            results=(
+                List[indexed_class],
+                Field(default_factory=list, description="One result per numbered item"),
+            ),
+        )
+        _batch_output_classes[output_class] = batch_class
+    return batch_class
+
+
+async def call_llm_batched(
+    llm: BaseChatModel,
+    output_class: Type[M],
+    items: List[T],
+    build_messages: Callable[[List[Tuple[int, T]]], Any],
+    batch_size: int = 10,
+    max_retries: int = 2,
+    max_concurrency: int = 8,
+    context_desc: str = "",
+) -> List[Optional[M]]:
+    """Process many small prompts with a few list-typed structured calls.
+
+    Items are packed into batches of up to batch_size. build_messages gets
+    (index, item) pairs and must ask for one result per index. Results are
+    mapped back by index; items missing from a response, or whose whole batch
+    failed to parse, are retried (in halved batches) up to max_retries times.
+
+    Args:
+        llm: LLM instance
+        output_class: Pydantic model for a single item's output
+        items: Items to process
+        build_messages: Builds the messages for a batch of (index, item) pairs
+        batch_size: Maximum items per request
+        max_retries: How many times to retry unparsed items
+        max_concurrency: How many batches may be in flight at once
+        context_desc: Description for error logs
+
+    Returns:
+        One entry per item, in order; None for items that never parsed
+    """
+    batch_class = _batch_output_class(output_class)
+    results: List[Optional[M]] = [None] * len(items)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run_batch(batch: List[int]) -> None:
+        async with semaphore:
+            response = await call_llm_with_structured_output(
+                llm=llm,
+                output_class=batch_class,
+                messages=build_messages([(i, items[i]) for i in batch]),
+                context_desc=f"{context_desc} (batch of {len(batch)})",
+            )
+
+        if response is None:
+            return
+
+        wanted = set(batch)
+        for entry in response.results:
+            if entry.index in wanted and results[entry.index] is None:
+                results[entry.index] = output_class.model_validate(
+                    entry.model_dump(exclude={"index"})
+                )
+
+    pending = list(range(len(items)))
+    size = max(1, batch_size)
+
+    # Batches that fail are retried, so only items still unparsed at the end count as failures
+    with track_llm_failures():
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+            if attempt:
+                logger.info(f"Retrying {len(pending)} unparsed items for {context_desc}")
+                size = max(1, size // 2)
+
+            await asyncio.gather(
+                *(_run_batch(pending[i : i + size]) for i in range(0, len(pending), size))
+            )
+            pending = [i for i in pending if results[i] is None]
+
+    if pending:
+        logger.warning(f"{len(pending)} of {len(items)} items unparsed for {context_desc}")
+        _record_llm_failure(context_desc)
+
+    return results
+
+
+def supports_candidates(llm: Any) -> bool:
+    """Check whether an LLM can return several candidates from one request."""
+    return hasattr(llm, "astructured_candidates") or "n" in getattr(
+        type(llm), "model_fields", {}
+    )
+
+
+async def _generate_candidates(
+    llm: Any, output_class: Type[M], messages: Any, n: int
+) -> Tuple[List[Optional[M]], Tuple[int, int]]:
+    """Request n candidates; returns them with the (input, output) token usage."""
+    if hasattr(llm, "astructured_candidates"):
+        return await llm.astructured_candidates(output_class, messages, n), (0, 0)
+
+    # Bind the schema as a forced tool call and ask for n candidates; each
+    # candidate comes back as its own generation
+    tool_llm = llm.bind_tools([output_class], tool_choice=output_class.__name__)
+    result = await llm.agenerate(
+        [convert_to_messages(normalize_messages(messages))], n=n, **tool_llm.kwargs
+    )
+    parser = PydanticToolsParser(tools=[output_class], first_tool_only=True)
+
+    candidates: List[Optional[M]] = []
+    input_tokens = output_tokens = 0
+    for generation in result.generations[0]:
+        # The prompt is shared, so its tokens are only billed once
+        generation_input, generation_output = usage_tokens(getattr(generation, "message", None))
+        input_tokens = max(input_tokens, generation_input)
+        output_tokens += generation_output
+        try:
+            candidates.append(parser.parse_result([generation]))
+        except Exception as e:
+            logger.debug(f"Could not parse candidate: {e}")
+            candidates.append(None)
+    return candidates, (input_tokens, output_tokens)
+
+
+async def call_llm_with_candidates(
+    llm: BaseChatModel,
+    output_class: Type[M],
+    messages: List[Tuple[str, str]],
+    n: int,
+    context_desc: str = "",
+) -> List[Optional[M]]:
+    """Get n structured candidates for the same prompt in a single request.
+
+    Uses the provider's candidate-count option. Backends without one fall
+    back to n separate calls. As with call_llm_with_structured_output, only
+    deterministic (temperature 0) requests are cached or shared with an
+    identical request in flight; sampled candidates are meant to be
+    independent votes.
+
+    Args:
+        llm: LLM instance
+        output_class: Pydantic model for structured output
+        messages: Messages to send to the LLM
+        n: How many candidates to request
+        context_desc: Description for error logs
+
+    Returns:
+        One entry per candidate; None for candidates that failed to parse.
+        Empty list if the request failed.
+    """
+    if not supports_candidates(llm):
+        return list(
+            await asyncio.gather(
+                *(
+                    call_llm_with_structured_output(llm, output_class, messages, context_desc)
+                    for _ in range(n)
+                )
+            )
+        )
+
+    temperature = getattr(llm, "temperature", None)
+    cache = get_llm_cache() if not temperature else None
+    coalesce = settings.llm_singleflight_enabled and not temperature
+    cache_key = None
+
+    if cache is not None or coalesce:
+        cache_key = make_cache_key(
+            _model_name(llm),
+            temperature,
+            messages,
+            output_class,
+            extra={"candidates": n},
+        )
+
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                return [
+                    output_class.model_validate(item) if item is not None else None
+                    for item in json.loads(cached)
+                ]
+            except (ValidationError, ValueError):
+                logger.warning(f"Discarding stale cache entry for {context_desc}")
+
+    async def _call() -> List[Optional[M]]:
+        if budget_exhausted():
+            logger.warning(f"Budget exhausted, skipping LLM call for {context_desc}")
+            return []
+
+        try:
+            candidates, (input_tokens, output_tokens) = await run_llm_request(
+                _model_name(llm), lambda: _generate_candidates(llm, output_class, messages, n)
+            )
+        except Exception as e:
+            _account_llm_call()
+            logger.error(f"Error in multi-candidate LLM call for {context_desc}: {e}")
+            return []
+
+        _account_llm_call(input_tokens, output_tokens)
+
+        if cache is not None and any(c is not None for c in candidates):
+            cache.set(
+                cache_key,
+                json.dumps(
+                    [c.model_dump(mode="json") if c is not None else None for c in candidates]
+                ),
+            )
+
+        return candidates
+
+    candidates = list(await get_singleflight("llm").do(cache_key, _call)) if coalesce else await _call()
+    if not candidates or any(c is None for c in candidates):
+        _record_llm_failure(context_desc)
+    return candidates
+
+
+VOTING_STRATEGIES = ("parallel", "sequential")
+
+
+class _VoteTally:
+    """Running count of one item's voting attempts.
+
+    Without agreement every success counts as a vote, as fixed voting always
+    did. With agreement only identical results vote together, and the item
+    is accepted once one result has min_successes votes.
+    """
+
+    def __init__(self, completions: int, min_successes: int, agreement: bool = False):
+        self.completions = completions
+        self.min_successes = min_successes
+        self.agreement = agreement
+        self.attempts = 0
+        self.successes: List[Optional[R]] = []
+        self._votes: Counter = Counter()
+
+    def add(self, success: bool, result: Optional[R]) -> None:
+        self.attempts += 1
+        if success:
+            self.successes.append(result)
+            self._votes[_vote_key(result)] += 1
+
+    def leading_votes(self) -> int:
+        if not self.agreement:
+            return len(self.successes)
+        return max(self._votes.values(), default=0)
+
+    def needed(self) -> int:
+        """Votes still missing for the leading result."""
+        return max(0, self.min_successes - self.leading_votes())
+
+    def decided(self) -> bool:
+        """Accepted, or too few attempts left to ever be accepted."""
+        remaining = self.completions - self.attempts
+        return self.needed() == 0 or self.leading_votes() + remaining < self.min_successes
+
+    def winners(self) -> List[Optional[R]]:
+        """Successful results backing the outcome, first-seen first."""
+        if not self.agreement or not self._votes:
+            return self.successes
+        key, _ = self._votes.most_common(1)[0]
+        return [result for result in self.successes if _vote_key(result) == key]
+
+
+def _vote_key(result: Any) -> Any:
+    if isinstance(result, str):
+        return " ".join(result.split())
+    if isinstance(result, BaseModel):
+        return result.model_dump_json()
+    return repr(result)
+
+
+def _attempt_outcome(outcome: Any, description: str) -> Tuple[bool, Optional[R]]:
+    if isinstance(outcome, BaseException):
+        logger.error(f"Voting attempt failed for {description}: {outcome}")
+        _record_llm_failure(f"voting attempt for {description}")
+        return False, None
+    return outcome
+
+
+async def _vote_on_item(
+    item: T,
+    processor: Callable[[T, Any], Awaitable[Tuple[bool, Optional[R]]]],
+    llm: Any,
+    tally: _VoteTally,
+    result_factory: Callable[[R, T], Any],
+    description: str,
+) -> Any:
+    """Run all voting attempts at once, stopping as soon as the outcome is decided."""
+    pending = {asyncio.ensure_future(processor(item, llm)) for _ in range(tally.completions)}
+
     try:
-        return await llm.with_structured_output(output_class).ainvoke(messages)
-    except Exception as e:
-        logger.error(f"Error in LLM call for {context_desc}: {e}")
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    tally.add(*task.result())
+                except Exception as e:
+                    tally.add(*_attempt_outcome(e, description))
+
+            # Enough votes in, or too many failures to ever get there
+            if tally.decided():
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return _finalize_vote(item, tally, result_factory, description)
+
+
+async def _vote_sequentially(
+    item: T,
+    run_round: Callable[[int], Awaitable[List[Tuple[bool, Optional[R]]]]],
+    tally: _VoteTally,
+    result_factory: Callable[[R, T], Any],
+    description: str,
+) -> Any:
+    """Run only the attempts that can still change the outcome, round by round.
+
+    The first round runs min_successes attempts. Each later round runs as
+    many as the leading result is short of, so unanimous answers cost
+    exactly min_successes calls and only disagreements or parse failures
+    pay for more, up to `completions` in total.
+    """
+    while not tally.decided():
+        batch = min(tally.needed(), tally.completions - tally.attempts)
+        try:
+            attempts = await run_round(batch)
+        except Exception as e:
+            attempts = [_attempt_outcome(e, description)] * batch
+
+        # A multi-candidate request may return fewer candidates than asked for
+        attempts = list(attempts) + [(False, None)] * (batch - len(attempts))
+        for success, result in attempts[:batch]:
+            tally.add(success, result)
+
+    return _finalize_vote(item, tally, result_factory, description)
+
+
+def _finalize_vote(
+    item: T,
+    tally: _VoteTally,
+    result_factory: Callable[[R, T], Any],
+    description: str,
+) -> Any:
+    # Only proceed if we have enough successes
+    if tally.needed() > 0:
+        logger.info(
+            f"Not enough successes ({tally.leading_votes()}/{tally.min_successes}) "
+            f"for {description}"
+        )
         return None
 
+    # Use the first successful result
+    for result in tally.winners():
+        if result is not None:
+            processed_result = result_factory(result, item)
+            if processed_result:
+                return processed_result
+
+    return None
+
+
+async def _vote_on_candidates(
+    item: T,
+    candidate_processor: Callable[[T, Any, int], Awaitable[List[Tuple[bool, Optional[R]]]]],
+    llm: Any,
+    tally: _VoteTally,
+    result_factory: Callable[[R, T], Any],
+    description: str,
+) -> Any:
+    """Tally the candidates returned by a single multi-candidate request."""
+    try:
+        attempts = await candidate_processor(item, llm, tally.completions)
+    except Exception as e:
+        logger.error(f"Multi-candidate attempt failed for {description}: {e}")
+        attempts = []
+
+    for success, result in attempts:
+        tally.add(success, result)
+    return _finalize_vote(item, tally, result_factory, description)
+
 
 async def process_with_voting(
     items: List[T],
@@ -93,9 +683,29 @@ async def process_with_voting(
     min_successes: int,
     result_factory: Callable[[R, T], Any],
     description: str = "item",
+    max_concurrency: int = 16,
+    candidate_processor: Optional[
+        Callable[[T, Any, int], Awaitable[List[Tuple[bool, Optional[R]]]]]
+    ] = None,
+    strategy: str = "parallel",
+    require_agreement: bool = False,
+    degrade_step: Optional[str] = None,
+    on_error: Optional[Callable[[T], None]] = None,
 ) -> List[Any]:
     """Process items with multiple LLM attempts and consensus voting.
 
+    Items are processed concurrently (at most max_concurrency at a time) and
+    results keep the input order. An item stops as soon as min_successes is
+    reached or can no longer be reached; its remaining attempts are cancelled.
+
+    If candidate_processor is given, each item is voted on with a single
+    request that returns `completions` candidates instead of separate calls.
+
+    The "parallel" strategy starts all `completions` attempts at once. The
+    "sequential" strategy starts with min_successes attempts and adds more
+    only while the outcome is undecided, which reaches the same decisions
+    with close to min_successes calls per item.
+
     Args:
         items: Items to process
         processor: Function that processes each item
@@ -104,33 +714,62 @@ async def process_with_voting(
         min_successes: How many must succeed
         result_factory: Function to create final result
         description: Item type for logs
+        max_concurrency: How many items may be voted on at once
+        candidate_processor: Function returning (success, result) per candidate
+            from one multi-candidate request
+        strategy: "parallel" or "sequential"
+        require_agreement: Only count successes with identical results as
+            the same vote
+        degrade_step: Budget degradation step that cuts an item down to a
+            single completion; checked as each item starts, so items started
+            after the budget runs low are cheaper
+        on_error: Called with each item that got no result because one of its
+            LLM calls failed, as opposed to the votes deciding against it
 
     Returns:
         List of successfully processed results
     """
-    results = []
+    if strategy not in VOTING_STRATEGIES:
+        raise ValueError(f"Unknown voting strategy '{strategy}'")
 
-    for item in items:
-        # Make multiple attempts concurrently
-        tasks = [processor(item, llm) for _ in range(completions)]
-        attempts = await asyncio.gather(*tasks)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-        # Count successes
-        success_count = sum(1 for success, _ in attempts if success)
+    async def _process(item: T) -> Any:
+        with track_llm_failures() as failures:
+            outcome = await _vote(item)
+        if not outcome and failures and on_error is not None:
+            on_error(item)
+        return outcome
 
-        # Only proceed if we have enough successes
-        if success_count < min_successes:
-            logger.info(
-                f"Not enough successes ({success_count}/{min_successes}) for {description}"
-            )
-            continue
+    async def _vote(item: T) -> Any:
+        async with semaphore:
+            if degrade_step is not None and degrade(degrade_step):
+                tally = _VoteTally(1, 1, require_agreement)
+            else:
+                tally = _VoteTally(completions, min_successes, require_agreement)
+            if strategy == "sequential":
+                if candidate_processor is not None:
+
+                    async def run_round(n: int) -> List[Tuple[bool, Optional[R]]]:
+                        return await candidate_processor(item, llm, n)
+
+                else:
+
+                    async def run_round(n: int) -> List[Tuple[bool, Optional[R]]]:
+                        outcomes = await asyncio.gather(
+                            *(processor(item, llm) for _ in range(n)), return_exceptions=True
+                        )
+                        return [_attempt_outcome(o, description) for o in outcomes]
+
+                return await _vote_sequentially(
+                    item, run_round, tally, result_factory, description
+                )
+            if candidate_processor is not None:
+                return await _vote_on_candidates(
+                    item, candidate_processor, llm, tally, result_factory, description
+                )
+            return await _vote_on_item(item, processor, llm, tally, result_factory, description)
 
-        # Use the first successful result
-        for success, result in attempts:
-            if success and result is not None:
-                processed_result = result_factory(result, item)
-                if processed_result:
-                    results.append(processed_result)
-                    break
+    outcomes = await asyncio.gather(*(_process(item) for item in items))
 
-    return results
\ No newline at end of file
+    return [outcome for outcome in outcomes if outcome]
@@ -0,0 +1,121 @@
+"""Local stand-in LLM backend.
+
+Answers structured-output calls in-process, without network access. Useful
+for offline runs, throughput experiments and exercising the voting paths.
+"""
+
+import asyncio
+import enum
+import logging
+import types
+import typing
+from typing import Any, Callable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# responder(output_class, messages, candidate_index) -> instance of output_class
+Responder = Callable[[Type[BaseModel], Any, int], BaseModel]
+
+
+def _default_for_annotation(annotation: Any) -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin in (typing.Union, types.UnionType):
+        return None if type(None) in args else _default_for_annotation(args[0])
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, List, tuple, set):
+        return []
+    if origin is dict:
+        return {}
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation))
+        if issubclass(annotation, BaseModel):
+            return build_default_response(annotation)
+        if issubclass(annotation, bool):
+            return False
+        if issubclass(annotation, (int, float)):
+            return annotation(0)
+        if issubclass(annotation, str):
+            return ""
+    return None
+
+
+def build_default_response(output_class: Type[M]) -> M:
+    """Build a schema-valid instance using defaults and empty values."""
+    values = {
+        name: _default_for_annotation(field.annotation)
+        for name, field in output_class.model_fields.items()
+        if field.is_required()
+    }
+    return output_class.model_validate(values)
+
+
+def _default_responder(output_class: Type[BaseModel], messages: Any, index: int) -> BaseModel:
+    return build_default_response(output_class)
+
+
+_responder: Responder = _default_responder
+
+
+def set_local_responder(responder: Optional[Responder]) -> None:
+    """Install the function LocalLLM uses to answer calls (None restores the default)."""
+    global _responder
+    _responder = responder or _default_responder
+
+
+class _LocalStructuredRunnable:
+    def __init__(self, llm: "LocalLLM", output_class: Type[BaseModel]):
+        self.llm = llm
+        self.output_class = output_class
+
+    async def ainvoke(self, messages: Any, *args: Any, **kwargs: Any) -> BaseModel:
+        candidates = await self.llm.astructured_candidates(self.output_class, messages, 1)
+        return candidates[0]
+
+    def invoke(self, messages: Any, *args: Any, **kwargs: Any) -> BaseModel:
+        return asyncio.run(self.ainvoke(messages))
+
+
+class LocalLLM:
+    """In-process chat backend that supports structured output and candidate counts.
+
+    Args:
+        model_name: Name reported for caching, rate limiting and metrics
+        temperature: Temperature reported for caching
+        latency: Simulated seconds per request
+        responder: Overrides the module-level responder for this instance
+    """
+
+    def __init__(
+        self,
+        model_name: str = "local",
+        temperature: float = 0.0,
+        latency: float = 0.0,
+        responder: Optional[Responder] = None,
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.latency = latency
+        self.responder = responder
+        self.requests = 0
+
+    def with_structured_output(self, output_class: Type[M], **kwargs: Any) -> _LocalStructuredRunnable:
+        return _LocalStructuredRunnable(self, output_class)
+
+    async def astructured_candidates(
+        self, output_class: Type[M], messages: Any, n: int
+    ) -> List[Optional[M]]:
+        """Answer one request with n candidates."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        responder = self.responder or _responder
+        return [responder(output_class, messages, i) for i in range(n)]
@@ -0,0 +1,287 @@
+"""Per-node latency, LLM call and token accounting.
+
+Graph nodes are decorated with instrument_node(), which records wall time and
+makes the node the current attribution target. LLM calls, retries and
+searches made while it runs are charged to it. Figures go to the collector
+of the active metrics_scope(), or to a process-wide collector outside one.
+LangGraph runs each node in its own context, so a graph whose state carries
+a "metrics" collector has every instrumented node reopen its scope.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from pydantic import BaseModel, Field
+
+_UNATTRIBUTED = "unattributed"
+
+_current_node: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "athena_current_node", default=None
+)
+_current_collector: contextvars.ContextVar[Optional["MetricsCollector"]] = (
+    contextvars.ContextVar("athena_metrics_collector", default=None)
+)
+
+
+class NodeMetrics(BaseModel):
+    """Counters for one graph node (or the totals over all nodes)."""
+
+    runs: int = Field(default=0, description="Times the node ran")
+    wall_seconds: float = Field(
+        default=0.0,
+        description="Wall time; per node it includes nested subgraph nodes, "
+        "in the totals it is the span of the whole run",
+    )
+    llm_calls: int = Field(default=0, description="LLM requests sent to the provider")
+    input_tokens: int = Field(default=0, description="Prompt tokens reported by the provider")
+    output_tokens: int = Field(default=0, description="Output tokens reported by the provider")
+    retries: int = Field(default=0, description="LLM requests retried after an error")
+    hedges: int = Field(default=0, description="Backup LLM requests sent for slow calls")
+    hedge_wins: int = Field(default=0, description="Hedged calls the backup request answered")
+    search_calls: int = Field(default=0, description="Search requests made")
+    items: int = Field(default=0, description="Items handed to nodes that can skip the LLM")
+    skipped_items: int = Field(
+        default=0, description="Of those items, the ones settled locally without an LLM call"
+    )
+
+    @property
+    def skip_rate(self) -> float:
+        """Share of items settled without an LLM call."""
+        return self.skipped_items / self.items if self.items else 0.0
+
+
+class RunMetrics(BaseModel):
+    """Per-node counters plus totals for a run."""
+
+    nodes: Dict[str, NodeMetrics] = Field(default_factory=dict)
+    totals: NodeMetrics = Field(default_factory=NodeMetrics)
+
+
+# (metric suffix, NodeMetrics field, help text) for the Prometheus export
+_PROMETHEUS_METRICS = (
+    ("node_runs_total", "runs", "Graph node executions"),
+    ("node_wall_seconds_total", "wall_seconds", "Graph node wall time in seconds"),
+    ("llm_calls_total", "llm_calls", "LLM requests sent to the provider"),
+    ("llm_input_tokens_total", "input_tokens", "LLM prompt tokens"),
+    ("llm_output_tokens_total", "output_tokens", "LLM output tokens"),
+    ("llm_retries_total", "retries", "LLM requests retried after an error"),
+    ("llm_hedges_total", "hedges", "Backup LLM requests sent for slow calls"),
+    ("llm_hedge_wins_total", "hedge_wins", "Hedged calls the backup request answered"),
+    ("search_calls_total", "search_calls", "Search requests made"),
+    ("items_total", "items", "Items handed to nodes that can skip the LLM"),
+    ("skipped_items_total", "skipped_items", "Items settled locally without an LLM call"),
+)
+
+
+class MetricsCollector:
+    """Thread-safe accumulator of NodeMetrics keyed by node name."""
+
+    def __init__(self):
+        self._nodes: Dict[str, NodeMetrics] = {}
+        self._first_start: Optional[float] = None
+        self._last_end: Optional[float] = None
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def _node(self, node: Optional[str]) -> NodeMetrics:
+        name = node or _UNATTRIBUTED
+        metrics = self._nodes.get(name)
+        if metrics is None:
+            metrics = self._nodes[name] = NodeMetrics()
+        return metrics
+
+    def add(self, node: Optional[str], **increments: float) -> None:
+        """Add to one node's counters."""
+        with self._lock:
+            metrics = self._node(node)
+            for field, value in increments.items():
+                setattr(metrics, field, getattr(metrics, field) + value)
+
+    def node_started(self, start: float) -> None:
+        with self._lock:
+            self._running += 1
+            if self._first_start is None:
+                self._first_start = start
+
+    def node_finished(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self._running -= 1
+            self._last_end = end if self._last_end is None else max(self._last_end, end)
+            metrics = self._node(name)
+            metrics.runs += 1
+            metrics.wall_seconds += end - start
+
+    def _elapsed(self) -> float:
+        # Span from the first node start to the last node end (or now, mid-run);
+        # per-node wall times overlap across nested and parallel nodes
+        if self._first_start is None:
+            return 0.0
+        end = time.perf_counter() if self._running else self._last_end
+        return end - self._first_start
+
+    def snapshot(self) -> RunMetrics:
+        """Copy the current counters and compute totals."""
+        with self._lock:
+            nodes = {name: m.model_copy() for name, m in sorted(self._nodes.items())}
+            elapsed = self._elapsed()
+
+        totals = NodeMetrics(
+            **{
+                field: sum(getattr(m, field) for m in nodes.values())
+                for field in NodeMetrics.model_fields
+            }
+        )
+        totals.wall_seconds = elapsed
+        return RunMetrics(nodes=nodes, totals=totals)
+
+    def reset(self) -> None:
+        """Drop every counter."""
+        with self._lock:
+            self._nodes.clear()
+            self._first_start = self._last_end = None
+            self._running = 0
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Export the counters as JSON."""
+        return self.snapshot().model_dump_json(indent=indent)
+
+    def to_prometheus(self, prefix: str = "athena") -> str:
+        """Export the counters in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for suffix, field, help_text in _PROMETHEUS_METRICS:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for node, metrics in snapshot.nodes.items():
+                lines.append(f'{name}{{node="{node}"}} {getattr(metrics, field)}')
+        return "\n".join(lines) + "\n"
+
+
+_process_collector = MetricsCollector()
+
+
+def get_metrics() -> MetricsCollector:
+    """Get the collector of the active metrics_scope(), or the process-wide one."""
+    return _current_collector.get() or _process_collector
+
+
+@contextmanager
+def metrics_scope(collector: Optional[MetricsCollector] = None) -> Iterator[MetricsCollector]:
+    """Collect the metrics of everything run inside the block separately.
+
+    Example:
+        with metrics_scope() as metrics:
+            result = await graph.ainvoke({"answer": text})
+        print(metrics.to_prometheus())
+    """
+    collector = collector or MetricsCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def current_node() -> Optional[str]:
+    """Name of the graph node currently running, if any."""
+    return _current_node.get()
+
+
+def record_llm_call(input_tokens: int = 0, output_tokens: int = 0) -> None:
+    """Charge one LLM request and its token usage to the current node."""
+    get_metrics().add(
+        _current_node.get(), llm_calls=1, input_tokens=input_tokens, output_tokens=output_tokens
+    )
+
+
+def record_retry() -> None:
+    """Charge one retried LLM request to the current node."""
+    get_metrics().add(_current_node.get(), retries=1)
+
+
+def record_hedge(won: bool) -> None:
+    """Charge one hedged LLM call to the current node."""
+    get_metrics().add(_current_node.get(), hedges=1, hedge_wins=int(won))
+
+
+def record_search() -> None:
+    """Charge one search request to the current node."""
+    get_metrics().add(_current_node.get(), search_calls=1)
+
+
+def record_skips(skipped: int, total: int) -> None:
+    """Record that the current node settled skipped of total items without an LLM call."""
+    get_metrics().add(_current_node.get(), items=total, skipped_items=skipped)
+
+
+def usage_tokens(message: Any) -> tuple[int, int]:
+    """Read (input_tokens, output_tokens) from a chat message's usage metadata."""
+    usage = getattr(message, "usage_metadata", None) or {}
+    return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+
+def _state_collector(args: tuple) -> Optional[MetricsCollector]:
+    """The collector carried in a node's state (model or Send payload), if any."""
+    state = args[0] if args else None
+    collector = state.get("metrics") if isinstance(state, dict) else getattr(state, "metrics", None)
+    return collector if isinstance(collector, MetricsCollector) else None
+
+
+def instrument_node(name: str) -> Callable[[Callable], Callable]:
+    """Decorate a graph node so its wall time and calls are recorded under name.
+
+    When the node's state carries a metrics collector, the node runs inside
+    its metrics_scope(), timing included, so nothing lands in the
+    process-wide collector.
+
+    Example:
+        @instrument_node("Claim_Handle.selection")
+        async def selection_node(state: State) -> Dict[str, Any]: ...
+    """
+
+    def _scope(args: tuple):
+        collector = _state_collector(args)
+        return metrics_scope(collector) if collector is not None else nullcontext()
+
+    def _start() -> tuple[contextvars.Token, MetricsCollector, float]:
+        collector = get_metrics()
+        start = time.perf_counter()
+        collector.node_started(start)
+        return _current_node.set(name), collector, start
+
+    def _finish(token: contextvars.Token, collector: MetricsCollector, start: float) -> None:
+        collector.node_finished(name, start, time.perf_counter())
+        _current_node.reset(token)
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _scope(args):
+                    token, collector, start = _start()
+                    try:
+                        return await fn(*args, **kwargs)
+                    finally:
+                        _finish(token, collector, start)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _scope(args):
+                token, collector, start = _start()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    _finish(token, collector, start)
+
+        return wrapper
+
+    return decorator
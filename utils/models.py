@@ -1,13 +1,35 @@
 """Unified LLM model instances and factory functions.
 
 Provides access to configured language model instances for all modules.
+Clients are pooled per (model, temperature) so that every node shares the
+same underlying transport instead of building a new one per call.
 """
 
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Type
+
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_google_vertexai import ChatVertexAI
+from pydantic import BaseModel
 
+from utils.cassette import CassetteLLM, get_cassette
+from utils.local_llm import LocalLLM
 from utils.settings import settings
 
+# Process-wide pool of chat clients keyed by (model_name, temperature)
+_llm_pool: Dict[Tuple[str, float], BaseChatModel] = {}
+_llm_pool_lock = threading.Lock()
+
+# Bound structured-output runnables keyed by (id(llm), output_class).
+# The llm is stored alongside so its id cannot be reused while cached.
+_MAX_STRUCTURED_RUNNABLES = 256
+_structured_runnables: "OrderedDict[Tuple[int, Type[BaseModel]], Tuple[Any, Runnable]]" = (
+    OrderedDict()
+)
+_structured_runnables_lock = threading.Lock()
+
 
 def get_llm(
     model_name: str = "gemini-2.0-flash",
@@ -16,6 +38,11 @@ def get_llm(
 ) -> BaseChatModel:
     """Get LLM with specified configuration.
 
+    Instances are shared across the process, so repeated calls with the same
+    model and temperature return the same client. With LLM_BACKEND=local the
+    in-process LocalLLM stand-in is returned instead of Vertex AI. With
+    CASSETTE_MODE set, the client records to or replays from the cassette.
+
     Args:
         model_name: The model to use
         temperature: Temperature for generation
@@ -28,17 +55,87 @@ def get_llm(
     if completions > 1 and temperature == 0.0:
         temperature = 0.2
 
-    if not settings.gcp_project or not settings.gcp_location:
-        raise ValueError("GCP_PROJECT and GCP_LOCATION must be set in environment variables for Vertex AI")
+    key = (model_name, temperature)
+    llm = _llm_pool.get(key)
+    if llm is not None:
+        return llm
+
+    with _llm_pool_lock:
+        llm = _llm_pool.get(key)
+        if llm is None:
+            llm = _build_llm(model_name, temperature)
+            _llm_pool[key] = llm
+
+    return llm
+
+
+def _build_llm(model_name: str, temperature: float) -> Any:
+    cassette = get_cassette()
+    if cassette is not None and cassette.mode == "replay":
+        return CassetteLLM(cassette, model_name, temperature)
+
+    if settings.llm_backend == "local":
+        llm = LocalLLM(
+            model_name=model_name, temperature=temperature, latency=settings.local_llm_latency
+        )
+    else:
+        if not settings.gcp_project or not settings.gcp_location:
+            raise ValueError("GCP_PROJECT and GCP_LOCATION must be set in environment variables for Vertex AI")
+
+        llm = ChatVertexAI(
+            model_name=model_name,
+            temperature=temperature,
+            project=settings.gcp_project,
+            location=settings.gcp_location,
+            # Quota retries are handled by the shared rate limiter
+            max_retries=0,
+        )
+
+    if cassette is not None:
+        return CassetteLLM(cassette, model_name, temperature, inner=llm)
+    return llm
+
+
+def get_structured_llm(llm: Any, output_class: Type[BaseModel]) -> Runnable:
+    """Get the structured-output runnable for an LLM and schema.
+
+    Binding a schema converts it to a tool definition, so the result is
+    memoized per (llm, output_class).
+
+    Args:
+        llm: LLM instance
+        output_class: Pydantic model for structured output
+
+    Returns:
+        Runnable producing output_class instances
+    """
+    key = (id(llm), output_class)
+
+    with _structured_runnables_lock:
+        entry = _structured_runnables.get(key)
+        if entry is not None and entry[0] is llm:
+            _structured_runnables.move_to_end(key)
+            return entry[1]
+
+    # include_raw keeps the raw message so its usage metadata can be recorded
+    runnable = llm.with_structured_output(output_class, include_raw=True)
+
+    with _structured_runnables_lock:
+        _structured_runnables[key] = (llm, runnable)
+        while len(_structured_runnables) > _MAX_STRUCTURED_RUNNABLES:
+            _structured_runnables.popitem(last=False)
+
+    return runnable
+
 
-    return ChatVertexAI(
-        model_name=model_name,
-        temperature=temperature,
-        project=settings.gcp_project,
-        location=settings.gcp_location,
-    )
+def clear_llm_pool() -> None:
+    """Drop every pooled client and memoized structured runnable."""
+    with _llm_pool_lock:
+        _llm_pool.clear()
+    with _structured_runnables_lock:
+        _structured_runnables.clear()
 
 
 def get_default_llm() -> BaseChatModel:
     """Get default LLM instance."""
-    return get_llm()
\ No newline at end of file
+    return get_llm()
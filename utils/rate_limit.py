@@ -0,0 +1,296 @@
+"""Shared rate and concurrency control for LLM calls.
+
+Every LLM request goes through one AdaptiveRateLimiter, which combines a
+token bucket per model with an AIMD concurrency limit that shrinks when
+Vertex answers with 429 / RESOURCE_EXHAUSTED and grows back on success.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from utils.metrics import record_retry
+from utils.settings import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Matched against messages only when the exception carries no status code;
+# bare numbers like "429" turn up in unrelated errors too
+_QUOTA_MARKERS = (
+    "resource_exhausted",
+    "resource exhausted",
+    "quota exceeded",
+    "too many requests",
+    "rate limit exceeded",
+)
+_TRANSIENT_MARKERS = ("service unavailable", "deadline exceeded", "deadline_exceeded")
+
+
+def _error_chain(error: BaseException):
+    while error is not None:
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an API error (google.api_core, httpx, requests), if any."""
+    for candidate in (
+        getattr(error, "code", None),
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+    ):
+        if isinstance(candidate, int):
+            return int(candidate)
+    return None
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """Check whether an exception is a quota / rate-limit rejection."""
+    for e in _error_chain(error):
+        if type(e).__name__ in ("ResourceExhausted", "TooManyRequests"):
+            return True
+        status = _status_code(e)
+        if status is not None:
+            if status == 429:
+                return True
+            continue
+        message = str(e).lower()
+        if any(marker in message for marker in _QUOTA_MARKERS):
+            return True
+    return False
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Check whether an exception is a transient server-side failure."""
+    for e in _error_chain(error):
+        if type(e).__name__ in ("ServiceUnavailable", "DeadlineExceeded"):
+            return True
+        status = _status_code(e)
+        if status is not None:
+            if status in (503, 504):
+                return True
+            continue
+        message = str(e).lower()
+        if any(marker in message for marker in _TRANSIENT_MARKERS):
+            return True
+    return False
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """Take a token if available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class AdaptiveRateLimiter:
+    """Token buckets per model plus a shared AIMD concurrency limit.
+
+    Quota errors halve the concurrency limit (at most once per cooldown) and
+    are retried with full-jitter exponential backoff; successes grow the limit
+    additively. Calls give up once max_retries or max_wait_seconds is exceeded.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 10.0,
+        burst: float = 10.0,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_wait_seconds: float = 120.0,
+        decrease_cooldown: float = 1.0,
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait_seconds = max_wait_seconds
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(max(min_concurrency, min(initial_concurrency, max_concurrency)))
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._queued = 0
+        self._stats = {"calls": 0, "throttled": 0, "retries": 0, "failures": 0}
+
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # asyncio primitives are bound to the loop they are first used on
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+            self._queued = 0
+        return self._condition
+
+    def _bucket(self, model_name: str) -> TokenBucket:
+        bucket = self._buckets.get(model_name)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_second, self.burst)
+            self._buckets[model_name] = bucket
+        return bucket
+
+    async def _acquire(self, model_name: str, deadline: float) -> None:
+        condition = self._get_condition()
+        self._queued += 1
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self._in_flight < int(self._limit)),
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+                self._in_flight += 1
+
+            # The slot is held from here on, so give it back if the wait is
+            # cut short by the deadline or a cancellation
+            try:
+                bucket = self._bucket(model_name)
+                while (delay := bucket.try_acquire()) > 0:
+                    if time.monotonic() + delay > deadline:
+                        raise asyncio.TimeoutError(f"Rate limit wait exceeded for {model_name}")
+                    await asyncio.sleep(delay)
+            except BaseException:
+                await self._release()
+                raise
+        finally:
+            self._queued -= 1
+
+    async def _release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _on_success(self) -> None:
+        self._limit = min(float(self.max_concurrency), self._limit + 1.0 / max(self._limit, 1.0))
+
+    def _on_throttle(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease >= self.decrease_cooldown:
+            self._limit = max(float(self.min_concurrency), self._limit / 2)
+            self._last_decrease = now
+            logger.warning(f"Quota exceeded, reducing LLM concurrency to {int(self._limit)}")
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+    async def run(self, model_name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run an LLM call under the rate and concurrency limits.
+
+        Args:
+            model_name: Model the call is billed against
+            call: Factory producing the awaitable for one attempt
+
+        Returns:
+            The call's result
+
+        Raises:
+            The last error once retries or the maximum wait are exhausted
+        """
+        deadline = time.monotonic() + self.max_wait_seconds
+        attempt = 0
+
+        while True:
+            await self._acquire(model_name, deadline)
+            self._stats["calls"] += 1
+            try:
+                result = await call()
+            except Exception as e:
+                await self._release()
+
+                quota_error = is_quota_error(e)
+                if not quota_error and not is_transient_error(e):
+                    self._stats["failures"] += 1
+                    raise
+
+                if quota_error:
+                    self._stats["throttled"] += 1
+                    self._on_throttle()
+
+                delay = self._backoff(attempt)
+                attempt += 1
+                if attempt > self.max_retries or time.monotonic() + delay > deadline:
+                    self._stats["failures"] += 1
+                    raise
+
+                self._stats["retries"] += 1
+                record_retry()
+                logger.info(
+                    f"Retrying {model_name} call in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_retries}): {e}"
+                )
+                await asyncio.sleep(delay)
+            except BaseException:
+                await self._release()
+                raise
+            else:
+                await self._release()
+                self._on_success()
+                return result
+
+    def stats(self) -> Dict[str, float]:
+        """Return current in-flight, queued and throttled counts."""
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "concurrency_limit": int(self._limit),
+        }
+
+
+_rate_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Get the process-wide rate limiter shared by every LLM call."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        _rate_limiter = AdaptiveRateLimiter(
+            requests_per_second=settings.llm_requests_per_second,
+            burst=settings.llm_burst,
+            initial_concurrency=settings.llm_initial_concurrency,
+            min_concurrency=settings.llm_min_concurrency,
+            max_concurrency=settings.llm_max_concurrency,
+            max_retries=settings.llm_max_retries,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay,
+            max_wait_seconds=settings.llm_max_wait_seconds,
+        )
+
+    return _rate_limiter
@@ -11,6 +11,67 @@ class Settings(BaseSettings):
     gcp_project: Optional[str] = Field(default=None, alias="GCP_PROJECT")
     gcp_location: Optional[str] = Field(default=None, alias="GCP_LOCATION")
 
+    # "vertex" for Vertex AI, "local" for the in-process stand-in backend
+    llm_backend: str = Field(default="vertex", alias="LLM_BACKEND")
+    # Simulated seconds per request for the local backend
+    local_llm_latency: float = Field(default=0.0, alias="LOCAL_LLM_LATENCY")
+
+    # Record/replay of LLM and search calls: "off", "record" or "replay".
+    # CASSETTE_LATENCY is "recorded" or a fixed number of seconds per call.
+    cassette_mode: str = Field(default="off", alias="CASSETTE_MODE")
+    cassette_path: str = Field(default=".cache/cassette.json.gz", alias="CASSETTE_PATH")
+    cassette_latency: str = Field(default="recorded", alias="CASSETTE_LATENCY")
+
+    # Token counter for prompt budgeting: "heuristic", "gemini" or "tiktoken"
+    token_counter: str = Field(default="heuristic", alias="TOKEN_COUNTER")
+
+    # Structured LLM response cache (opt-in)
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_dir: Optional[str] = Field(default=".cache/llm", alias="LLM_CACHE_DIR")
+    llm_cache_ttl_seconds: Optional[float] = Field(
+        default=7 * 24 * 3600, alias="LLM_CACHE_TTL_SECONDS"
+    )
+    llm_cache_max_memory_entries: int = Field(
+        default=1024, alias="LLM_CACHE_MAX_MEMORY_ENTRIES"
+    )
+    llm_cache_max_disk_entries: int = Field(
+        default=100_000, alias="LLM_CACHE_MAX_DISK_ENTRIES"
+    )
+
+    # Per-request budget for fact_checker runs; unset limits are unbounded
+    budget_max_llm_calls: Optional[int] = Field(default=None, alias="BUDGET_MAX_LLM_CALLS")
+    budget_max_tokens: Optional[int] = Field(default=None, alias="BUDGET_MAX_TOKENS")
+    budget_deadline_seconds: Optional[float] = Field(
+        default=None, alias="BUDGET_DEADLINE_SECONDS"
+    )
+
+    # Chunked fact_checker runs for very long documents: sentences per chunk,
+    # sentences carried over as context, and chunks extracted or verified at once
+    chunk_sentences: int = Field(default=100, alias="CHUNK_SENTENCES")
+    chunk_overlap_sentences: int = Field(default=5, alias="CHUNK_OVERLAP_SENTENCES")
+    chunk_max_in_flight: int = Field(default=2, alias="CHUNK_MAX_IN_FLIGHT")
+
+    # Hedged LLM requests (opt-in): send one backup request once a call
+    # outlives the model's rolling latency quantile
+    llm_hedging_enabled: bool = Field(default=False, alias="LLM_HEDGING_ENABLED")
+    llm_hedge_quantile: float = Field(default=0.95, alias="LLM_HEDGE_QUANTILE")
+    llm_hedge_min_samples: int = Field(default=20, alias="LLM_HEDGE_MIN_SAMPLES")
+    llm_hedge_window: int = Field(default=200, alias="LLM_HEDGE_WINDOW")
+
+    # Coalesce identical in-flight LLM and search requests
+    llm_singleflight_enabled: bool = Field(default=True, alias="LLM_SINGLEFLIGHT_ENABLED")
+
+    # Shared LLM rate / concurrency control
+    llm_requests_per_second: float = Field(default=10.0, alias="LLM_REQUESTS_PER_SECOND")
+    llm_burst: float = Field(default=10.0, alias="LLM_BURST")
+    llm_initial_concurrency: int = Field(default=8, alias="LLM_INITIAL_CONCURRENCY")
+    llm_min_concurrency: int = Field(default=1, alias="LLM_MIN_CONCURRENCY")
+    llm_max_concurrency: int = Field(default=32, alias="LLM_MAX_CONCURRENCY")
+    llm_max_retries: int = Field(default=5, alias="LLM_MAX_RETRIES")
+    llm_retry_base_delay: float = Field(default=1.0, alias="LLM_RETRY_BASE_DELAY")
+    llm_retry_max_delay: float = Field(default=30.0, alias="LLM_RETRY_MAX_DELAY")
+    llm_max_wait_seconds: float = Field(default=120.0, alias="LLM_MAX_WAIT_SECONDS")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
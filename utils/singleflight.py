@@ -0,0 +1,89 @@
+"""Coalescing of identical in-flight requests.
+
+While a call for a key is running, later callers with the same key wait on
+its result instead of issuing their own request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result.
+
+    Results are shared objects, so callers must not mutate them. The shared
+    call keeps running when one caller is cancelled and is only cancelled
+    once every caller waiting on it has gone.
+
+    Args:
+        name: Name used in logs and stats
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Any, Tuple[asyncio.Task, list]] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key: Any, call_factory: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight call for key, starting one if there is none.
+
+        Args:
+            key: Hashable request identity
+            call_factory: Zero-argument callable returning a fresh awaitable
+
+        Returns:
+            The result of the shared call
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._calls.get(key)
+
+        if entry is not None and entry[0].get_loop() is loop and not entry[0].done():
+            task, waiters = entry
+            self._stats["coalesced"] += 1
+            logger.debug(f"Coalesced duplicate {self.name} call")
+        else:
+            task = loop.create_task(call_factory())
+            waiters = [0]
+            self._calls[key] = (task, waiters)
+            self._stats["calls"] += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def _forget(self, key: Any, task: asyncio.Task) -> None:
+        entry = self._calls.get(key)
+        if entry is not None and entry[0] is task:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return started and coalesced call counts."""
+        return {**self._stats, "in_flight": len(self._calls)}
+
+
+_flights: Dict[str, SingleFlight] = {}
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """Get the shared SingleFlight group for a kind of request (e.g. "llm", "search")."""
+    flight = _flights.get(name)
+    if flight is None:
+        flight = _flights.setdefault(name, SingleFlight(name))
+    return flight
+
+
+def singleflight_stats() -> Dict[str, Dict[str, int]]:
+    """Return the stats of every SingleFlight group."""
+    return {name: flight.stats() for name, flight in _flights.items()}
@@ -0,0 +1,124 @@
+"""Token counting utilities.
+
+Pluggable token counters with a shared, cached entry point. The default
+heuristic is script-aware, so Devanagari and other non-Latin text is not
+undercounted the way a plain len(text) // 4 estimate is.
+"""
+
+import hashlib
+import logging
+import math
+import re
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_COUNT_CACHE_SIZE = 8192
+
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_LATIN_RUN = re.compile(r"[A-Za-z0-9\u00c0-\u024f]+")
+_CJK_RUN = re.compile(f"[{_CJK_RANGES}]+")
+# Everything else that is neither ASCII, Latin, CJK nor whitespace, so
+# combining marks stay attached to the letters they modify
+_OTHER_RUN = re.compile(f"[^\\x00-\\x7f\\s\u00c0-\u024f{_CJK_RANGES}]+")
+_SYMBOL = re.compile(r"[!-/:-@\[-`{-~]")
+
+
+class TokenCounter(Protocol):
+    """Anything that can count the tokens in a string."""
+
+    def count(self, text: str) -> int: ...
+
+
+class HeuristicTokenCounter:
+    """Script-aware token estimate that needs no tokenizer download.
+
+    Latin words cost about one token per 4 characters, CJK one per character,
+    other scripts (Devanagari, Tamil, Arabic, ...) one per 2 characters, and
+    each symbol or punctuation mark one token.
+    """
+
+    def count(self, text: str) -> int:
+        tokens = sum(math.ceil(len(run) / 4) for run in _LATIN_RUN.findall(text))
+        tokens += sum(len(run) for run in _CJK_RUN.findall(text))
+        tokens += sum(math.ceil(len(run) / 2) for run in _OTHER_RUN.findall(text))
+        tokens += len(_SYMBOL.findall(text))
+        return tokens
+
+
+class GeminiTokenCounter:
+    """Exact counts from the local Gemini tokenizer (needs sentencepiece)."""
+
+    def __init__(self, model_name: str = "gemini-1.5-flash"):
+        from vertexai.preview.tokenization import get_tokenizer_for_model
+
+        self._tokenizer = get_tokenizer_for_model(model_name)
+
+    def count(self, text: str) -> int:
+        return self._tokenizer.count_tokens(text).total_tokens
+
+
+class TiktokenCounter:
+    """Counts from a tiktoken encoding (needs tiktoken)."""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+_token_counter: Optional[TokenCounter] = None
+_token_counts: "OrderedDict[bytes, int]" = OrderedDict()
+
+
+def _build_token_counter(name: str) -> TokenCounter:
+    try:
+        match name.lower():
+            case "gemini":
+                return GeminiTokenCounter()
+            case "tiktoken":
+                return TiktokenCounter()
+    except Exception as e:
+        logger.warning(f"Token counter '{name}' unavailable, using heuristic: {e}")
+    return HeuristicTokenCounter()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the shared token counter selected by TOKEN_COUNTER."""
+    global _token_counter
+
+    if _token_counter is None:
+        _token_counter = _build_token_counter(settings.token_counter)
+    return _token_counter
+
+
+def set_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Replace the shared token counter (None re-reads TOKEN_COUNTER)."""
+    global _token_counter
+
+    _token_counter = counter
+    _token_counts.clear()
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the shared counter, memoizing repeated strings.
+
+    Memoized by a digest of the text, so cached counts don't keep whole
+    prompts alive.
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    count = _token_counts.get(key)
+    if count is None:
+        count = get_token_counter().count(text)
+        _token_counts[key] = count
+        if len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    else:
+        _token_counts.move_to_end(key)
+    return count